@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Artifact Store - Content-addressed storage for optimization runs
+
+Every run used to create its own resume_optimization_output_YYYYMMDD_HHMMSS
+folder, so the working directory grew by a dozen near-identical files per
+run. With --store, save_results_to_files() puts each file in a blob store
+instead: blobs are named by their SHA-256 and sharded by the first two hex
+digits (blobs/ab/abcdef...), so an analysis file or a DOCX resume that is
+the same across runs is stored once. An SQLite index records every run (job
+and resume hashes, role, company, style, field, time) and the files it
+produced.
+
+Disk use grows only with new content and the directory tree stays at most
+256 shards wide however many runs are stored. A run is materialized as an
+ordinary folder on demand:
+
+    python resume_windows.py --export my_run              # latest run
+    python resume_windows.py --export my_run --run 12     # a specific run
+"""
+
+import hashlib
+import os
+import sqlite3
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from render_cache import copy_file_atomic, write_bytes_atomic
+
+DEFAULT_STORE_DIR = 'resume_artifacts'
+INDEX_NAME = 'index.sqlite3'
+
+# Columns of the runs table that callers may set (besides id and created)
+RUN_FIELDS = ('job_sha256', 'resume_sha256', 'role', 'company', 'style', 'field')
+
+
+def content_sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class ArtifactStore:
+    """Deduplicated blob directory plus an SQLite index of runs and their files"""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.environ.get('RESUME_ARTIFACT_STORE') or DEFAULT_STORE_DIR
+        self.new_blobs = 0
+        self.reused_blobs = 0
+        self._conn = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (and create) the run index on first use"""
+        if self._conn is None:
+            os.makedirs(self.root, exist_ok=True)
+            conn = sqlite3.connect(os.path.join(self.root, INDEX_NAME), timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("""CREATE TABLE IF NOT EXISTS runs (
+                                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                                created TEXT NOT NULL,
+                                job_sha256 TEXT,
+                                resume_sha256 TEXT,
+                                role TEXT,
+                                company TEXT,
+                                style TEXT,
+                                field TEXT)""")
+            conn.execute("""CREATE TABLE IF NOT EXISTS run_files (
+                                run_id INTEGER NOT NULL REFERENCES runs(id),
+                                name TEXT NOT NULL,
+                                sha256 TEXT NOT NULL,
+                                size INTEGER NOT NULL,
+                                PRIMARY KEY (run_id, name))""")
+            conn.execute("CREATE INDEX IF NOT EXISTS runs_by_inputs ON runs (job_sha256, resume_sha256)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def blob_path(self, sha256: str) -> str:
+        return os.path.join(self.root, 'blobs', sha256[:2], sha256)
+
+    def put_blob(self, data: bytes) -> str:
+        """Store data once under its SHA-256 and return the hash"""
+        sha256 = content_sha256(data)
+        path = self.blob_path(sha256)
+        if os.path.exists(path):
+            self.reused_blobs += 1
+            return sha256
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_bytes_atomic(path, data)
+        self.new_blobs += 1
+        return sha256
+
+    def read_blob(self, sha256: str) -> bytes:
+        with open(self.blob_path(sha256), 'rb') as f:
+            return f.read()
+
+    def add_run(self, files: Iterable[Tuple[str, bytes]], **run_info) -> int:
+        """Store a run's (name, data) files and index them; returns the run id
+
+        run_info may carry any of RUN_FIELDS; other keys are ignored.
+        """
+        stored = [(name, self.put_blob(data), len(data)) for name, data in files]
+        conn = self._connect()
+        values = [run_info.get(field) for field in RUN_FIELDS]
+        with conn:
+            cursor = conn.execute(
+                f"INSERT INTO runs (created, {', '.join(RUN_FIELDS)}) VALUES (?{', ?' * len(RUN_FIELDS)})",
+                [datetime.now().isoformat(timespec='seconds')] + values)
+            run_id = cursor.lastrowid
+            conn.executemany("INSERT INTO run_files (run_id, name, sha256, size) VALUES (?, ?, ?, ?)",
+                             [(run_id, name, sha256, size) for name, sha256, size in stored])
+        return run_id
+
+    def runs(self, limit: Optional[int] = None, **filters) -> List[Dict]:
+        """Runs newest first, optionally filtered by RUN_FIELDS values"""
+        unknown = set(filters) - set(RUN_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown run field(s): {', '.join(sorted(unknown))}")
+        where = ' AND '.join(f"{field} = ?" for field in filters)
+        query = "SELECT * FROM runs" + (f" WHERE {where}" if where else '') + " ORDER BY id DESC"
+        if limit is not None:
+            query += f" LIMIT {int(limit)}"
+        return [dict(row) for row in self._connect().execute(query, list(filters.values()))]
+
+    def latest_run(self, **filters) -> Optional[Dict]:
+        runs = self.runs(limit=1, **filters)
+        return runs[0] if runs else None
+
+    def run_files(self, run_id: int) -> List[Dict]:
+        """(name, sha256, size) records of one run's files"""
+        rows = self._connect().execute(
+            "SELECT name, sha256, size FROM run_files WHERE run_id = ? ORDER BY rowid", (run_id,))
+        return [dict(row) for row in rows]
+
+    def export(self, run_id: int, directory: str) -> List[str]:
+        """Materialize a run as a folder of files
+
+        The files are copies: exported resumes get edited, and a hard link
+        would let an in-place save corrupt the blob every other run shares.
+        """
+        files = self.run_files(run_id)
+        if not files:
+            raise KeyError(f"Run {run_id} is not in artifact store {self.root}")
+        os.makedirs(directory, exist_ok=True)
+        paths = []
+        for record in files:
+            target = os.path.join(directory, record['name'])
+            copy_file_atomic(self.blob_path(record['sha256']), target)
+            paths.append(target)
+        return paths
+
+    def stats(self) -> Dict[str, int]:
+        """Run count, stored file references, unique blobs and blob bytes"""
+        conn = self._connect()
+        runs = conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+        references, unique, size = conn.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT sha256), "
+            "(SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT sha256, size FROM run_files)) FROM run_files"
+        ).fetchone()
+        return {'runs': runs, 'files': references, 'blobs': unique, 'bytes': size}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
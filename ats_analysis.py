@@ -2,177 +2,461 @@
 """
 ATS Analysis Tool - Evaluate resume formats for ATS compatibility
 Checks both storytelling and standard formats
+
+    python ats_analysis.py                         # latest browse mode run
+    python ats_analysis.py --all . --jobs 8        # every run -> ats_report.csv / .json
 """
 
 import sys
 import os
 import re
+import csv
+import json
+import time
+import sqlite3
+import zipfile
+import argparse
+import statistics
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
-def analyze_ats_compatibility(content, format_name):
-    """Analyze resume content for ATS compatibility"""
+from artifact_store import INDEX_NAME as STORE_INDEX_NAME, ArtifactStore
+from result_bundle import ResultBundle, is_result_bundle
+from run_index import latest_output_folder
+
+# Terms the analyzer looks for; every list is matched case-insensitively as substrings
+REQUIRED_SECTIONS = {
+    'contact': ['contact', 'phone', 'email', '@'],
+    'experience': ['experience', 'work', 'employment', 'professional'],
+    'education': ['education', 'degree', 'university', 'college'],
+    'skills': ['skills', 'technical', 'competencies', 'technologies']
+}
+# '💻' is listed twice, so each one counts double
+PROBLEMATIC_CHARS = ['🔥', '🔬', '💻', '🌟', '📞', '✉️', '🔗', '💻']
+GRAPHICS_INDICATORS = ['image', 'graphic', 'chart', 'logo']
+COMMON_KEYWORDS = [
+    'experience', 'skills', 'project', 'develop', 'manage', 'lead',
+    'engineer', 'technical', 'analysis', 'design', 'system'
+]
+NARRATIVE_PHRASES = [
+    'my journey', 'my story', 'career story', 'chapter', 'narrative',
+    'always been', 'passion for', 'fascination with'
+]
+METRIC_PATTERN = r'\d+(?:%|\+|years?|months?)'
+BULLET_MARKERS = ('•', '-')
+
+
+class AtsPatternTable:
+    """Every term the analyzer counts, with the counters it feeds, compiled once
     
-    print(f"\n🤖 ATS ANALYSIS: {format_name.upper()}")
-    print("=" * 60)
+    Each distinct term maps to the counters it feeds ('section:contact',
+    'emoji', 'graphics', 'keyword', 'narrative') with a weight of how often
+    it is listed, so a term that appears in several lists is searched once.
+    Bullets and metrics are single compiled regexes over the whole text.
+    """
     
-    lines = content.split('\n')
+    def __init__(self):
+        roles = {}
+        for section, keywords in REQUIRED_SECTIONS.items():
+            for keyword in keywords:
+                roles.setdefault(keyword, Counter())[f'section:{section}'] += 1
+        for counter, terms in (('emoji', PROBLEMATIC_CHARS), ('graphics', GRAPHICS_INDICATORS),
+                               ('keyword', COMMON_KEYWORDS), ('narrative', NARRATIVE_PHRASES)):
+            for term in terms:
+                roles.setdefault(term, Counter())[counter] += 1
+        self.roles = {term: tuple(counters.items()) for term, counters in roles.items()}
+        # Terms only used to detect a section or graphics need a presence check, not a count
+        self.presence_only = {term for term, counters in roles.items()
+                              if all(c.startswith('section:') or c == 'graphics' for c in counters)}
+        # A line whose first non-blank character is a bullet marker
+        self.bullet_pattern = re.compile(rf"^[^\S\n]*(?:{'|'.join(map(re.escape, BULLET_MARKERS))})", re.MULTILINE)
+        self.metric_pattern = re.compile(METRIC_PATTERN)
+
+
+@dataclass
+class AtsScan:
+    """Counts gathered from a resume's text"""
+    sections: Dict[str, bool] = field(default_factory=dict)
+    emoji_count: int = 0
+    graphics_count: int = 0
+    keyword_count: int = 0
+    narrative_count: int = 0
+    metric_count: int = 0
+    bullet_count: int = 0
+    word_count: int = 0
+
+
+_PATTERN_TABLE = None
+
+
+def pattern_table() -> AtsPatternTable:
+    """The compiled pattern table, built on first use"""
+    global _PATTERN_TABLE
+    if _PATTERN_TABLE is None:
+        _PATTERN_TABLE = AtsPatternTable()
+    return _PATTERN_TABLE
+
+
+def scan_resume(content: str) -> AtsScan:
+    """Count sections, emoji, keywords, phrases, metrics, bullets and words
+    
+    Works on the whole lowercased text with one C-level search per distinct
+    term instead of per-line Python loops. Counts match the per-term
+    str.count() / re.findall() / line scans they replace: occurrences of a
+    term never overlap each other, and a bullet is a line whose first
+    non-blank character is a bullet marker.
+    """
+    table = pattern_table()
+    text = content.lower()
+    counts = Counter()
+    for term, roles in table.roles.items():
+        if term in table.presence_only:
+            occurrences = 1 if term in text else 0
+        else:
+            occurrences = text.count(term)
+        if occurrences:
+            for counter, weight in roles:
+                counts[counter] += occurrences * weight
+    
+    return AtsScan(
+        sections={section: counts[f'section:{section}'] > 0 for section in REQUIRED_SECTIONS},
+        emoji_count=counts['emoji'],
+        graphics_count=counts['graphics'],
+        keyword_count=counts['keyword'],
+        narrative_count=counts['narrative'],
+        metric_count=len(table.metric_pattern.findall(text)),
+        bullet_count=len(table.bullet_pattern.findall(text)),
+        word_count=len(text.split()),
+    )
+
+
+# Score thresholds for each compatibility level, best first
+COMPATIBILITY_LEVELS = [(85, "EXCELLENT", "🟢"), (70, "GOOD", "🟡"), (55, "FAIR", "🟠"), (0, "POOR", "🔴")]
+
+
+@dataclass
+class AtsReport:
+    """ATS compatibility of one resume text, as computed by score_resume()"""
+    score: int
+    compatibility: str
+    sections: Dict[str, bool]
+    emoji_count: int
+    graphics_found: bool
+    keyword_density: float
+    bullet_count: int
+    metric_count: int
+    narrative_count: int
+    word_count: int
+    strengths: List[str] = field(default_factory=list)
+    issues: List[str] = field(default_factory=list)
+
+
+def score_resume(content: str) -> AtsReport:
+    """Score a resume text for ATS compatibility without any console output"""
+    scan = scan_resume(content)
     issues = []
     strengths = []
     score = 100
     
-    # 1. Check for standard sections
-    print("📋 SECTION ANALYSIS:")
-    required_sections = {
-        'contact': ['contact', 'phone', 'email', '@'],
-        'experience': ['experience', 'work', 'employment', 'professional'],
-        'education': ['education', 'degree', 'university', 'college'],
-        'skills': ['skills', 'technical', 'competencies', 'technologies']
-    }
-    
-    sections_found = {}
-    for section, keywords in required_sections.items():
-        found = any(any(keyword in line.lower() for keyword in keywords) for line in lines)
-        sections_found[section] = found
-        status = "✅" if found else "❌"
-        print(f"   {status} {section.title()}: {'Found' if found else 'Missing'}")
-        if not found:
+    # 1. Standard sections
+    for section in REQUIRED_SECTIONS:
+        if not scan.sections[section]:
             issues.append(f"Missing {section} section")
             score -= 15
         else:
             strengths.append(f"Has {section} section")
     
-    # 2. Check formatting issues
-    print(f"\n🎨 FORMATTING ANALYSIS:")
-    
-    # Check for problematic characters/formatting
-    problematic_chars = ['🔥', '🔬', '💻', '🌟', '📞', '✉️', '🔗', '💻']
-    emoji_count = sum(line.count(char) for line in lines for char in problematic_chars)
-    if emoji_count > 0:
-        print(f"   ❌ Emojis/Special characters: {emoji_count} found")
-        issues.append(f"Contains {emoji_count} emojis (ATS may not parse)")
-        score -= min(emoji_count * 2, 20)
+    # 2. Formatting: problematic characters and graphics
+    if scan.emoji_count > 0:
+        issues.append(f"Contains {scan.emoji_count} emojis (ATS may not parse)")
+        score -= min(scan.emoji_count * 2, 20)
     else:
-        print(f"   ✅ No problematic emojis")
         strengths.append("Clean text formatting")
     
-    # Check for graphics/images (text-based check)
-    graphics_indicators = ['image', 'graphic', 'chart', 'logo']
-    graphics_found = any(any(indicator in line.lower() for indicator in graphics_indicators) for line in lines)
+    graphics_found = scan.graphics_count > 0
     if graphics_found:
-        print(f"   ❌ May contain graphics/images")
         issues.append("Contains graphics/images")
         score -= 10
     else:
-        print(f"   ✅ Text-only format")
         strengths.append("Text-only format")
     
-    # 3. Check keyword density
-    print(f"\n🔤 KEYWORD ANALYSIS:")
-    
-    # Extract common technical/professional keywords
-    text = content.lower()
-    common_keywords = [
-        'experience', 'skills', 'project', 'develop', 'manage', 'lead',
-        'engineer', 'technical', 'analysis', 'design', 'system'
-    ]
-    
-    keyword_count = sum(text.count(keyword) for keyword in common_keywords)
-    keyword_density = keyword_count / len(text.split()) * 100 if text.split() else 0
-    
-    print(f"   📊 Keyword density: {keyword_density:.2f}%")
+    # 3. Density of common technical/professional keywords
+    keyword_density = scan.keyword_count / scan.word_count * 100 if scan.word_count else 0
     if keyword_density >= 3:
-        print(f"   ✅ Good keyword density")
         strengths.append(f"Good keyword density ({keyword_density:.1f}%)")
     elif keyword_density >= 1.5:
-        print(f"   ⚠️  Moderate keyword density")
         score -= 5
     else:
-        print(f"   ❌ Low keyword density")
         issues.append("Low keyword density")
         score -= 15
     
-    # 4. Check structure and readability
-    print(f"\n📖 STRUCTURE ANALYSIS:")
-    
-    # Check for bullet points
-    bullet_lines = [line for line in lines if line.strip().startswith('•') or line.strip().startswith('-')]
-    if bullet_lines:
-        print(f"   ✅ Uses bullet points: {len(bullet_lines)} found")
-        strengths.append(f"Uses {len(bullet_lines)} bullet points")
+    # 4. Structure: bullet points and quantified achievements
+    if scan.bullet_count:
+        strengths.append(f"Uses {scan.bullet_count} bullet points")
     else:
-        print(f"   ❌ No bullet points found")
         issues.append("No bullet points for readability")
         score -= 10
     
-    # Check for quantified achievements
-    numbers = re.findall(r'\d+(?:%|\+|years?|months?)', content.lower())
-    if numbers:
-        print(f"   ✅ Quantified achievements: {len(numbers)} metrics found")
-        strengths.append(f"Contains {len(numbers)} quantified metrics")
+    if scan.metric_count:
+        strengths.append(f"Contains {scan.metric_count} quantified metrics")
     else:
-        print(f"   ⚠️  Limited quantified achievements")
         score -= 5
     
-    # 5. Check for problematic narrative elements
-    print(f"\n📝 NARRATIVE ANALYSIS:")
-    
-    narrative_phrases = [
-        'my journey', 'my story', 'career story', 'chapter', 'narrative',
-        'always been', 'passion for', 'fascination with'
-    ]
-    
-    narrative_count = sum(text.count(phrase) for phrase in narrative_phrases)
-    if narrative_count > 5:
-        print(f"   ⚠️  Heavy narrative style: {narrative_count} narrative phrases")
-        print(f"   💡 May be less ATS-friendly but more human-engaging")
+    # 5. Narrative elements
+    if scan.narrative_count > 5:
         score -= 10
-    elif narrative_count > 0:
-        print(f"   ⚠️  Moderate narrative elements: {narrative_count} phrases")
+    elif scan.narrative_count > 0:
         score -= 5
     else:
-        print(f"   ✅ Professional, fact-based style")
         strengths.append("Fact-based professional style")
     
-    # Calculate final score
     score = max(0, min(100, score))
+    compatibility = next(level for threshold, level, _ in COMPATIBILITY_LEVELS if score >= threshold)
+    return AtsReport(score, compatibility, dict(scan.sections), scan.emoji_count, graphics_found,
+                     keyword_density, scan.bullet_count, scan.metric_count, scan.narrative_count,
+                     scan.word_count, strengths, issues)
+
+
+def analyze_ats_compatibility(content, format_name):
+    """Analyze resume content for ATS compatibility and print the findings"""
+    report = score_resume(content)
+    print_ats_report(report, format_name)
+    return report.score, report.compatibility, report.strengths, report.issues
+
+
+def print_ats_report(report: AtsReport, format_name: str):
+    """Print an AtsReport section by section"""
+    print(f"\n🤖 ATS ANALYSIS: {format_name.upper()}")
+    print("=" * 60)
+    
+    print("📋 SECTION ANALYSIS:")
+    for section, found in report.sections.items():
+        status = "✅" if found else "❌"
+        print(f"   {status} {section.title()}: {'Found' if found else 'Missing'}")
+    
+    print(f"\n🎨 FORMATTING ANALYSIS:")
+    if report.emoji_count > 0:
+        print(f"   ❌ Emojis/Special characters: {report.emoji_count} found")
+    else:
+        print(f"   ✅ No problematic emojis")
+    if report.graphics_found:
+        print(f"   ❌ May contain graphics/images")
+    else:
+        print(f"   ✅ Text-only format")
+    
+    print(f"\n🔤 KEYWORD ANALYSIS:")
+    print(f"   📊 Keyword density: {report.keyword_density:.2f}%")
+    if report.keyword_density >= 3:
+        print(f"   ✅ Good keyword density")
+    elif report.keyword_density >= 1.5:
+        print(f"   ⚠️  Moderate keyword density")
+    else:
+        print(f"   ❌ Low keyword density")
+    
+    print(f"\n📖 STRUCTURE ANALYSIS:")
+    if report.bullet_count:
+        print(f"   ✅ Uses bullet points: {report.bullet_count} found")
+    else:
+        print(f"   ❌ No bullet points found")
+    if report.metric_count:
+        print(f"   ✅ Quantified achievements: {report.metric_count} metrics found")
+    else:
+        print(f"   ⚠️  Limited quantified achievements")
     
-    # Determine ATS compatibility level
-    if score >= 85:
-        compatibility = "EXCELLENT"
-        color = "🟢"
-    elif score >= 70:
-        compatibility = "GOOD"
-        color = "🟡"
-    elif score >= 55:
-        compatibility = "FAIR"
-        color = "🟠"
+    print(f"\n📝 NARRATIVE ANALYSIS:")
+    if report.narrative_count > 5:
+        print(f"   ⚠️  Heavy narrative style: {report.narrative_count} narrative phrases")
+        print(f"   💡 May be less ATS-friendly but more human-engaging")
+    elif report.narrative_count > 0:
+        print(f"   ⚠️  Moderate narrative elements: {report.narrative_count} phrases")
     else:
-        compatibility = "POOR"
-        color = "🔴"
+        print(f"   ✅ Professional, fact-based style")
     
-    print(f"\n{color} ATS COMPATIBILITY SCORE: {score}/100 ({compatibility})")
+    color = next(color for threshold, _, color in COMPATIBILITY_LEVELS if report.score >= threshold)
+    print(f"\n{color} ATS COMPATIBILITY SCORE: {report.score}/100 ({report.compatibility})")
     
-    print(f"\n✅ STRENGTHS ({len(strengths)}):")
-    for strength in strengths[:5]:  # Show top 5
+    print(f"\n✅ STRENGTHS ({len(report.strengths)}):")
+    for strength in report.strengths[:5]:  # Show top 5
         print(f"   • {strength}")
     
-    print(f"\n⚠️  POTENTIAL ISSUES ({len(issues)}):")
-    for issue in issues[:5]:  # Show top 5
+    print(f"\n⚠️  POTENTIAL ISSUES ({len(report.issues)}):")
+    for issue in report.issues[:5]:  # Show top 5
         print(f"   • {issue}")
+
+# Resume texts a run can contain (the analysis reports are not resumes)
+RESUME_TEXT_FILES = (
+    'resume_impact_version.txt', 'resume_ats_optimized.txt', 'narrative_story_resume.txt',
+    'enhanced_standard_resume.txt', 'combined_comprehensive_resume.txt', 'narrative_only_reference.txt',
+    'enhanced_only_reference.txt', 'tailored_resume_final.txt'
+)
+
+REPORT_COLUMNS = ['run', 'kind', 'modified', 'file', 'score', 'compatibility', 'word_count', 'keyword_density',
+                  'bullet_count', 'metric_count', 'emoji_count', 'narrative_count', 'missing_sections']
+
+
+def discover_runs(root: str) -> List[Dict]:
+    """Every run at any depth under root: output folders, result bundles and artifact store runs"""
+    runs = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Staging folders and other hidden entries are never runs
+        dirnames[:] = sorted(name for name in dirnames if not name.startswith('.'))
+        relative = os.path.relpath(dirpath, root)
+        name = os.path.basename(os.path.abspath(root)) if relative == '.' else relative
+        if STORE_INDEX_NAME in filenames:
+            with ArtifactStore(dirpath) as store:
+                for run in reversed(store.runs()):
+                    runs.append({'run': f"{name}#{run['id']}", 'kind': 'store', 'path': dirpath,
+                                 'run_id': run['id'], 'modified': run['created']})
+            dirnames[:] = []  # blob shards hold no runs of their own
+            continue
+        if not set(filenames).isdisjoint(RESUME_TEXT_FILES):
+            runs.append({'run': name, 'kind': 'folder', 'path': dirpath, 'modified': _modified(dirpath)})
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            if not filename.startswith('.') and is_result_bundle(path):
+                runs.append({'run': os.path.relpath(path, root), 'kind': 'bundle', 'path': path,
+                             'modified': _modified(path)})
+    runs.sort(key=lambda run: (run['run'].split('#')[0], run.get('run_id', 0)))
+    return runs
+
+
+def _modified(path: str) -> str:
+    return datetime.fromtimestamp(os.path.getmtime(path)).isoformat(timespec='seconds')
+
+
+def _read_run_texts(run: Dict) -> Dict[str, str]:
+    """Resume texts of one run by file name"""
+    if run['kind'] == 'bundle':
+        with ResultBundle(run['path']) as bundle:
+            return {name: bundle.read_text(name) for name in RESUME_TEXT_FILES if name in bundle}
+    if run['kind'] == 'store':
+        with ArtifactStore(run['path']) as store:
+            return {record['name']: store.read_blob(record['sha256']).decode('utf-8')
+                    for record in store.run_files(run['run_id']) if record['name'] in RESUME_TEXT_FILES}
+    texts = {}
+    for name in RESUME_TEXT_FILES:
+        file_path = os.path.join(run['path'], name)
+        if os.path.exists(file_path):
+            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+                texts[name] = f.read()
+    return texts
+
+
+def score_run(run: Dict) -> Tuple[List[Dict], Optional[str]]:
+    """Report rows for every resume text in a run, or an error message (runs in pool workers)"""
+    try:
+        texts = _read_run_texts(run)
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile, sqlite3.Error) as e:
+        return [], f"{run['run']}: {e}"
+    rows = []
+    for name, text in texts.items():
+        report = score_resume(text)
+        rows.append({
+            'run': run['run'], 'kind': run['kind'], 'modified': run['modified'], 'file': name,
+            'score': report.score, 'compatibility': report.compatibility, 'word_count': report.word_count,
+            'keyword_density': round(report.keyword_density, 2), 'bullet_count': report.bullet_count,
+            'metric_count': report.metric_count, 'emoji_count': report.emoji_count,
+            'narrative_count': report.narrative_count,
+            'missing_sections': '; '.join(section for section, found in report.sections.items() if not found),
+        })
+    return rows, None
+
+
+def score_distribution(scores: List[int]) -> Dict:
+    """Summary statistics, compatibility levels and a 10-point histogram of scores"""
+    if not scores:
+        return {'count': 0}
+    levels = Counter(next(level for threshold, level, _ in COMPATIBILITY_LEVELS if score >= threshold)
+                     for score in scores)
+    histogram = Counter(min(score // 10 * 10, 90) for score in scores)
+    return {
+        'count': len(scores),
+        'mean': round(statistics.mean(scores), 2),
+        'median': statistics.median(scores),
+        'stdev': round(statistics.pstdev(scores), 2),
+        'min': min(scores),
+        'max': max(scores),
+        'levels': {level: levels[level] for _, level, _ in COMPATIBILITY_LEVELS},
+        'histogram': {f"{bucket}-{bucket + 9 if bucket < 90 else 100}": histogram[bucket] for bucket in range(0, 100, 10)},
+    }
+
+
+def aggregate_scores(rows: List[Dict]) -> Dict:
+    """Distributions over every scored text and per resume file"""
+    by_file = {}
+    for row in rows:
+        by_file.setdefault(row['file'], []).append(row['score'])
+    return {'all': score_distribution([row['score'] for row in rows]),
+            'by_file': {name: score_distribution(scores) for name, scores in sorted(by_file.items())}}
+
+
+def run_batch_report(root: str, jobs: Optional[int] = None, report_prefix: str = 'ats_report') -> int:
+    """Score every resume of every run under root in a process pool and write CSV + JSON reports"""
+    start = time.perf_counter()
+    runs = discover_runs(root)
+    if not runs:
+        print(f"❌ No runs found under {root}")
+        return 1
+    jobs = jobs or os.cpu_count() or 1
+    print(f"📂 Scoring {len(runs)} runs under {root} with {jobs} worker(s)...")
     
-    return score, compatibility, strengths, issues
+    if jobs == 1:
+        results = list(map(score_run, runs))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(score_run, runs, chunksize=max(1, len(runs) // (jobs * 4))))
+    
+    rows = []
+    for run_rows, error in results:
+        if error:
+            print(f"WARNING: Skipping run {error}")
+        rows.extend(run_rows)
+    
+    csv_path, json_path = f"{report_prefix}.csv", f"{report_prefix}.json"
+    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    aggregate = aggregate_scores(rows)
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump({'root': os.path.abspath(root), 'runs': len(runs), 'aggregate': aggregate, 'rows': rows},
+                  f, indent=2, ensure_ascii=False)
+    
+    print(f"\n📊 {len(rows)} resumes from {len(runs)} runs scored in {time.perf_counter() - start:.2f}s")
+    overall = aggregate['all']
+    if overall['count']:
+        print(f"   All resumes: mean {overall['mean']}, median {overall['median']}, "
+              f"range {overall['min']}-{overall['max']}")
+    for name, stats in aggregate['by_file'].items():
+        print(f"   {name}: mean {stats['mean']} over {stats['count']}")
+    print(f"✅ Report written to {csv_path} and {json_path}")
+    return 0
+
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='ATS compatibility analysis of generated resumes')
+    parser.add_argument('--all', metavar='ROOT',
+                        help='Score every resume of every run under ROOT and write a CSV/JSON report')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Worker processes for --all (default: CPU count)')
+    parser.add_argument('--report', default='ats_report', metavar='PREFIX',
+                        help='Report path prefix for --all (writes PREFIX.csv and PREFIX.json)')
+    args = parser.parse_args(argv)
+    if args.all:
+        return run_batch_report(args.all, args.jobs, args.report)
+    
     print("🤖 ATS COMPATIBILITY ANALYZER")
     print("Analyzing storytelling vs standard resume formats...")
     
     # Find latest output folder
-    folders = [f for f in os.listdir('.') if f.startswith('browse_mode_output_')]
-    if not folders:
+    latest_folder = latest_output_folder('browse_mode_output_')
+    if not latest_folder:
         print("❌ No browse_mode_output folders found")
-        return
+        return 1
     
-    latest_folder = sorted(folders)[-1]
     print(f"📂 Analyzing: {latest_folder}")
     
     # Analyze storytelling resume
@@ -222,6 +506,7 @@ def main():
     print(f"   1. Use ATS-optimized version for online applications")
     print(f"   2. Use storytelling version for networking and direct submissions")
     print(f"   3. Both versions contain the same core information")
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
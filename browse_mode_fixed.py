@@ -5,9 +5,9 @@ Complete Browse Mode Resume Optimizer - Fixed Version
 
 import os
 import sys
+import zipfile
 import tkinter as tk
 from tkinter import filedialog, messagebox
-from datetime import datetime
 
 # Add current directory to path to import resume_windows
 sys.path.insert(0, os.getcwd())
@@ -18,6 +18,10 @@ try:
 except ImportError:
     HAS_DOCX = False
 
+from docx_to_txt_converter import iter_docx_blocks
+from pdf_text_extractor import DOCUMENT_TEXT_CHARS, extract_text_from_pdf, PdfError
+from resume_windows import detect_text_encoding
+
 def validate_docx_file(filepath):
     """Check if a DOCX file can be opened by python-docx"""
     try:
@@ -30,7 +34,7 @@ def validate_docx_file(filepath):
         return False, str(e)
 
 def read_file_safely(filepath):
-    """Read a file safely, handling both .txt and .docx files"""
+    """Read a file safely, handling .txt, .docx and .pdf files"""
     try:
         # First check if file exists
         if not os.path.exists(filepath):
@@ -46,16 +50,9 @@ def read_file_safely(filepath):
         print(f"📄 Reading file: {os.path.basename(filepath)} ({file_size:,} bytes)")
         
         if filepath.lower().endswith('.docx'):
-            if not HAS_DOCX:
-                return f"Error: python-docx not installed. Run: pip install python-docx"
-            
             try:
-                # Read .docx file with improved error handling
-                doc = Document(filepath)
-                text = []
-                for paragraph in doc.paragraphs:
-                    if paragraph.text.strip():  # Only add non-empty paragraphs
-                        text.append(paragraph.text)
+                # Stream header, body, table, text box and footer text straight out of the DOCX zip
+                text = [block.text for block in iter_docx_blocks(filepath) if block.text.strip()]
                 
                 if not text:
                     return f"Error: DOCX file appears to be empty or contains no readable text"
@@ -64,40 +61,33 @@ def read_file_safely(filepath):
                 print(f"✅ Successfully read {len(content)} characters from DOCX file")
                 return content
                 
+            except (zipfile.BadZipFile, KeyError) as docx_error:
+                return f"Error: DOCX file may be corrupted, password-protected, or in use by another program. Close Microsoft Word if open and try again. Package details: {docx_error}"
             except Exception as docx_error:
-                # Try to provide more specific error information
-                error_msg = str(docx_error)
-                if "Package" in error_msg:
-                    return f"Error: DOCX file may be corrupted, password-protected, or in use by another program. Close Microsoft Word if open and try again. Details: {error_msg}"
-                else:
-                    return f"Error reading DOCX file: {error_msg}"
-        else:
-            # Read text file with proper encoding detection
-            encodings = ['utf-8', 'utf-16', 'latin-1', 'cp1252']
-            for encoding in encodings:
-                try:
-                    with open(filepath, 'r', encoding=encoding) as f:
-                        content = f.read()
-                        if content.strip():  # Make sure we got actual content
-                            print(f"✅ Successfully read {len(content)} characters from text file")
-                            return content
-                except UnicodeDecodeError:
-                    continue
-                except Exception as e:
-                    continue
-                    
-            # If all encodings fail, try reading as binary and decode
+                return f"Error reading DOCX file: {docx_error}"
+        elif filepath.lower().endswith('.pdf'):
             try:
-                with open(filepath, 'rb') as f:
-                    content = f.read()
-                    decoded = content.decode('utf-8', errors='ignore')
-                    if decoded.strip():
-                        print(f"✅ Successfully read {len(decoded)} characters (binary mode)")
-                        return decoded
-            except Exception as e:
-                pass
+                content = extract_text_from_pdf(filepath, enough_chars=DOCUMENT_TEXT_CHARS)
+            except PdfError as pdf_error:
+                return f"Error: PDF file could not be read ({pdf_error}). Try saving it as .docx or .txt instead"
+            except Exception as pdf_error:
+                return f"Error reading PDF file: {pdf_error}"
+            
+            if not content.strip():
+                return f"Error: PDF file contains no extractable text (it may be a scanned image)"
+            print(f"✅ Successfully read {len(content)} characters from PDF file")
+            return content
+        else:
+            # Read the bytes once, detect the encoding from BOM + prefix probe, decode once
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            encoding = detect_text_encoding(raw)
+            content = raw.decode(encoding, errors='replace')
+            if content.strip():
+                print(f"✅ Successfully read {len(content)} characters from text file ({encoding})")
+                return content
                 
-            return f"Error: Could not read file with any supported encoding: '{filepath}'"
+            return f"Error: Text file contains no readable text: '{filepath}'"
             
     except Exception as e:
         return f"Error reading file '{filepath}': {e}"
@@ -132,6 +122,7 @@ def browse_mode_optimizer():
             filetypes=[
                 ("Text files", "*.txt"),
                 ("Word documents", "*.docx"),
+                ("PDF files", "*.pdf"),
                 ("All files", "*.*")
             ]
         )
@@ -199,6 +190,7 @@ def browse_mode_optimizer():
             filetypes=[
                 ("Text files", "*.txt"),
                 ("Word documents", "*.docx"),
+                ("PDF files", "*.pdf"),
                 ("All files", "*.*")
             ]
         )
@@ -283,14 +275,17 @@ def browse_mode_optimizer():
         # Import and run the optimizer
         try:
             from resume_windows import ResumeOptimizer
+            from run_index import RunIndex
+            from staged_output import unique_output_dir
             
             optimizer = ResumeOptimizer()
+            optimizer.run_index = RunIndex()
             results = optimizer.process_complete_optimization(
                 job_content, resume_content, role, company
             )
             
             # Save results
-            output_dir = f"browse_mode_output_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            output_dir = unique_output_dir("browse_mode_output", optimizer.run_info.get('job_sha256', ''))
             optimizer.save_results_to_files(results, output_dir)
             
             print(f"✅ SUCCESS! Results saved to: {output_dir}")
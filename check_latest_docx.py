@@ -7,17 +7,18 @@ import os
 # Add the current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from run_index import latest_output_folder
+
 def check_latest_docx():
     """Check the latest generated DOCX for education duplication"""
     print("🔍 Checking latest generated DOCX for education duplication...")
     
     # Find the latest browse_mode_output folder
-    folders = [f for f in os.listdir('.') if f.startswith('browse_mode_output_')]
-    if not folders:
+    latest_folder = latest_output_folder('browse_mode_output_')
+    if not latest_folder:
         print("❌ No browse_mode_output folders found")
         return
     
-    latest_folder = sorted(folders)[-1]
     docx_path = os.path.join(latest_folder, 'optimized_resume.docx')
     
     print(f"📂 Checking: {docx_path}")
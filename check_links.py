@@ -4,17 +4,18 @@
 import sys
 import os
 
+from run_index import latest_output_folder
+
 def check_latest_docx_links():
     """Check the latest generated DOCX for link duplication and hyperlink status"""
     print("🔍 Checking latest generated DOCX for link issues...")
     
     # Find the latest browse_mode_output folder
-    folders = [f for f in os.listdir('.') if f.startswith('browse_mode_output_')]
-    if not folders:
+    latest_folder = latest_output_folder('browse_mode_output_')
+    if not latest_folder:
         print("❌ No browse_mode_output folders found")
         return
     
-    latest_folder = sorted(folders)[-1]
     docx_path = os.path.join(latest_folder, 'optimized_resume.docx')
     
     print(f"📂 Checking: {docx_path}")
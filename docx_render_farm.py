@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+DOCX Render Farm - Render resume .docx files in a pool of worker processes
+
+Batch runs attach a DocxRenderFarm to the optimizer (optimizer.render_farm);
+save_resume_docx() then submits each (path, blocks) job here instead of
+rendering inline. Jobs are grouped into chunks, at most max_pending chunks are
+queued at once (submit() blocks until a chunk finishes when the queue is full),
+and workers return DOCX bytes that the parent writes to disk.
+
+Workers are never plain-forked: the parent runs StagedOutput's writer threads
+while the farm starts, and forking a process with live threads can deadlock
+on a lock one of them held. They come from a forkserver (a clean,
+single-threaded process) where the platform has one, else they are spawned;
+each imports the resume templates once. Each job gets its own timeout,
+enforced with SIGALRM inside the worker where it exists.
+"""
+
+import contextlib
+import io
+import multiprocessing
+import os
+import signal
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
+
+from render_cache import write_bytes_atomic
+
+# Per-worker optimizer, created once by _init_worker
+_WORKER_OPTIMIZER = None
+
+
+class RenderTimeout(Exception):
+    """A single render job ran past its timeout"""
+
+
+def _worker_context():
+    """Start method for workers that is safe while the parent has threads"""
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def _init_worker():
+    """Create one quiet ResumeOptimizer per worker process"""
+    global _WORKER_OPTIMIZER
+    from resume_windows import ResumeOptimizer
+    with contextlib.redirect_stdout(io.StringIO()):
+        _WORKER_OPTIMIZER = ResumeOptimizer()
+
+
+def _raise_timeout(signum, frame):
+    raise RenderTimeout()
+
+
+def run_with_timeout(func, timeout: Optional[float], *args):
+    """Call func(*args), raising RenderTimeout after timeout seconds (where SIGALRM exists)"""
+    if not timeout or not hasattr(signal, 'SIGALRM'):
+        return func(*args)
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return func(*args)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def render_docx_bytes(blocks: list, with_standard_header: bool = False) -> bytes:
+    """Render resume blocks to DOCX bytes with this process's optimizer"""
+    if _WORKER_OPTIMIZER is None:
+        _init_worker()
+    return _WORKER_OPTIMIZER.render_docx_bytes(blocks, with_standard_header)
+
+
+def _render_chunk(chunk: List[Tuple[str, list, bool]], timeout: Optional[float]) -> List[Tuple[str, Optional[bytes], Optional[str]]]:
+    """Render a chunk of jobs into (path, docx bytes, error) results"""
+    results = []
+    for path, blocks, with_standard_header in chunk:
+        try:
+            results.append((path, run_with_timeout(render_docx_bytes, timeout, blocks, with_standard_header), None))
+        except RenderTimeout:
+            results.append((path, None, f"timed out after {timeout}s"))
+        except Exception as e:
+            results.append((path, None, f"{type(e).__name__}: {e}"))
+    return results
+
+
+class DocxRenderFarm:
+    """Process pool that renders DOCX jobs in chunks with bounded queue depth"""
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 4,
+                 max_pending: Optional[int] = None, timeout: Optional[float] = 60.0):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self.max_pending = max_pending or self.workers * 2
+        self.timeout = timeout
+        self.stats = {'submitted': 0, 'written': 0, 'errors': 0}
+
+        self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=_worker_context(),
+                                         initializer=_init_worker)
+        self._chunk: List[Tuple[str, list, bool]] = []
+        # path -> callback(path, data) run after the file is written
+        self._callbacks: Dict[str, Callable] = {}
+        # path -> finished(path) run when the job ends, written or not
+        self._finished: Dict[str, Callable] = {}
+        # future -> paths in its chunk, so a crashed worker can be reported per file
+        self._in_flight: Dict = {}
+
+    def submit(self, path: str, blocks: list, with_standard_header: bool = False,
+               callback: Optional[Callable[[str, bytes], None]] = None,
+               finished: Optional[Callable[[str], None]] = None):
+        """Queue one DOCX render; the file is written once its chunk completes
+
+        callback(path, data) runs after a successful write, finished(path)
+        after the job ends either way.
+        """
+        self._chunk.append((path, list(blocks), with_standard_header))
+        if callback is not None:
+            self._callbacks[path] = callback
+        if finished is not None:
+            self._finished[path] = finished
+        self.stats['submitted'] += 1
+        if len(self._chunk) >= self.chunk_size:
+            self._submit_chunk()
+
+    def _submit_chunk(self):
+        if not self._chunk:
+            return
+        # Backpressure: wait for a chunk to finish before queueing another
+        while len(self._in_flight) >= self.max_pending:
+            self._collect(FIRST_COMPLETED)
+        future = self._pool.submit(_render_chunk, self._chunk, self.timeout)
+        self._in_flight[future] = [path for path, _, _ in self._chunk]
+        self._chunk = []
+
+    def _collect(self, return_when):
+        """Write the results of finished chunks"""
+        finished, _ = wait(list(self._in_flight), return_when=return_when)
+        for future in finished:
+            paths = self._in_flight.pop(future)
+            try:
+                results = future.result()
+            except Exception as e:
+                results = [(path, None, f"worker failed: {type(e).__name__}: {e}") for path in paths]
+
+            for path, data, error in results:
+                callback = self._callbacks.pop(path, None)
+                finished = self._finished.pop(path, None)
+                if error is None:
+                    try:
+                        write_bytes_atomic(path, data)
+                        self.stats['written'] += 1
+                        if callback is not None:
+                            callback(path, data)
+                    except OSError as e:
+                        error = str(e)
+                if error is not None:
+                    self.stats['errors'] += 1
+                    print(f"ERROR: Failed to render {os.path.basename(path)}: {error}")
+                if finished is not None:
+                    finished(path)
+
+    def flush(self):
+        """Render everything submitted so far and write it to disk"""
+        self._submit_chunk()
+        if self._in_flight:
+            self._collect(ALL_COMPLETED)
+
+    def close(self):
+        """Flush outstanding jobs and stop the workers"""
+        try:
+            self.flush()
+        finally:
+            self._pool.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
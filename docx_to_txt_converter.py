@@ -4,12 +4,170 @@ DOCX to TXT Converter - Fix for corrupted or problematic DOCX files
 
 This utility helps when python-docx can't read a DOCX file.
 It provides alternative methods to extract text content.
+
+Batch mode converts whole folders or glob patterns in a process pool, skips
+outputs that are already newer than their source, and writes a JSON manifest
+of what changed:
+
+    python docx_to_txt_converter.py incoming/ "archive/**/*.docx" --out-dir converted --jobs 8
 """
 
 import os
 import sys
+import glob
+import json
+import time
 import zipfile
+import argparse
+from collections import namedtuple
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+MC_NS = '{http://schemas.openxmlformats.org/markup-compatibility/2006}'
+
+_BODY = W_NS + 'body'
+_HEADER = W_NS + 'hdr'
+_FOOTER = W_NS + 'ftr'
+_PARAGRAPH = W_NS + 'p'
+_RUN = W_NS + 'r'
+_TEXT = W_NS + 't'
+_TAB = W_NS + 'tab'
+_BREAKS = (W_NS + 'br', W_NS + 'cr')
+_TABLE_CELL = W_NS + 'tc'
+_TEXTBOX = W_NS + 'txbxContent'
+_FALLBACK = MC_NS + 'Fallback'
+
+# Elements whose children are the top-level blocks of a part (cleared as we go)
+_BLOCK_PARENTS = (_BODY, _HEADER, _FOOTER)
+_CONTAINER_KINDS = {_TABLE_CELL: 'table_cell', _TEXTBOX: 'textbox'}
+
+DocxBlock = namedtuple('DocxBlock', ['kind', 'text', 'part'])
+DocxBlock.__doc__ = """A block of DOCX text: kind is 'paragraph', 'table_cell' or 'textbox'; part is 'header', 'body' or 'footer'"""
+
+
+def _part_sort_key(name):
+    """Sort header2.xml before header10.xml"""
+    digits = ''.join(c for c in name if c.isdigit())
+    return (int(digits) if digits else 0, name)
+
+
+def iter_docx_blocks(docx_path):
+    """
+    Lazily yield tagged text blocks from a DOCX in reading order.
+
+    Headers come first, then the document body, then footers - so contact
+    details that templates keep in the page header land at the top. Each
+    part is streamed once with ET.iterparse straight out of the ZIP, without
+    building the python-docx object graph. Table cells and text boxes are
+    emitted as single 'table_cell' / 'textbox' blocks (their paragraphs
+    joined by newlines); everything else is a 'paragraph' block. Header
+    blocks repeated across the first/even/default header variants are only
+    emitted once, and the same for footers; a line that appears in both a
+    header and a footer is kept in each.
+
+    Raises zipfile.BadZipFile for non-ZIP input and KeyError if word/document.xml is missing.
+    """
+    with zipfile.ZipFile(docx_path, 'r') as zip_file:
+        names = zip_file.namelist()
+        if 'word/document.xml' not in names:
+            raise KeyError('word/document.xml')
+        headers = sorted((n for n in names if n.startswith('word/header') and n.endswith('.xml')), key=_part_sort_key)
+        footers = sorted((n for n in names if n.startswith('word/footer') and n.endswith('.xml')), key=_part_sort_key)
+
+        seen = {'header': set(), 'footer': set()}
+        for part, part_names in (('header', headers), ('body', ['word/document.xml']), ('footer', footers)):
+            for part_name in part_names:
+                with zip_file.open(part_name) as xml_stream:
+                    for block in _iter_blocks_from_stream(xml_stream, part):
+                        if part != 'body':
+                            if not block.text.strip() or block.text in seen[part]:
+                                continue
+                            seen[part].add(block.text)
+                        yield block
+
+
+def iter_docx_paragraphs(docx_path, part_name='word/document.xml'):
+    """
+    Lazily yield the text of each paragraph in a DOCX part.
+
+    Streams the XML straight out of the ZIP member with ET.iterparse and
+    clears elements as soon as they have been read, so memory stays flat
+    regardless of document size. Each table cell and text box comes out as
+    one item; the legacy VML copy of a text box (mc:Fallback) is skipped so
+    its text isn't yielded twice.
+
+    Raises zipfile.BadZipFile for non-ZIP input and KeyError if the part is missing.
+    """
+    with zipfile.ZipFile(docx_path, 'r') as zip_file:
+        with zip_file.open(part_name) as xml_stream:
+            for block in _iter_blocks_from_stream(xml_stream, 'body'):
+                yield block.text
+
+
+def _iter_blocks_from_stream(xml_stream, part):
+    """Yield DocxBlocks from a WordprocessingML XML stream"""
+    open_paragraphs = []  # text fragments for each open (possibly nested) paragraph
+    containers = []       # (kind, paragraph texts) for each open table cell / text box
+    run_depth = 0
+    fallback_depth = 0
+    depth = 0
+    block_parent = None
+    block_depth = None
+
+    for event, elem in ET.iterparse(xml_stream, events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            depth += 1
+            if tag == _PARAGRAPH:
+                open_paragraphs.append([])
+            elif tag == _RUN:
+                run_depth += 1
+            elif tag in _CONTAINER_KINDS:
+                containers.append((_CONTAINER_KINDS[tag], []))
+            elif tag == _FALLBACK:
+                fallback_depth += 1
+            elif tag in _BLOCK_PARENTS and block_parent is None:
+                block_parent, block_depth = elem, depth
+            continue
+
+        if tag == _PARAGRAPH:
+            text = ''.join(open_paragraphs.pop())
+            if not fallback_depth:
+                if containers:
+                    containers[-1][1].append(text)
+                else:
+                    yield DocxBlock('paragraph', text, part)
+        elif tag in _CONTAINER_KINDS:
+            kind, texts = containers.pop()
+            text = '\n'.join(t for t in texts if t)
+            if text and not fallback_depth:
+                yield DocxBlock(kind, text, part)
+        elif tag == _RUN:
+            run_depth -= 1
+        elif tag == _FALLBACK:
+            fallback_depth -= 1
+        elif run_depth and open_paragraphs and not fallback_depth:
+            if tag == _TEXT:
+                open_paragraphs[-1].append(elem.text or '')
+            elif tag == _TAB:
+                open_paragraphs[-1].append('\t')
+            elif tag in _BREAKS:
+                open_paragraphs[-1].append('\n')
+
+        # Drop finished top-level blocks so the tree never grows
+        if block_parent is not None and depth == block_depth + 1:
+            block_parent.clear()
+        else:
+            elem.clear()
+        depth -= 1
+
+
+def extract_docx_text(docx_path):
+    """Return all DOCX text (headers, body incl. tables/text boxes, footers) as newline-joined blocks"""
+    return '\n'.join(block.text for block in iter_docx_blocks(docx_path))
+
 
 def extract_text_from_docx_zip(docx_path):
     """
@@ -17,38 +175,11 @@ def extract_text_from_docx_zip(docx_path):
     This method works even when python-docx fails.
     """
     try:
-        text_content = []
-        
-        # DOCX files are ZIP archives containing XML
-        with zipfile.ZipFile(docx_path, 'r') as zip_file:
-            # The main document is in word/document.xml
-            if 'word/document.xml' in zip_file.namelist():
-                xml_content = zip_file.read('word/document.xml')
-                
-                # Parse XML to extract text
-                root = ET.fromstring(xml_content)
-                
-                # Find all text elements (namespace aware)
-                namespaces = {
-                    'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
-                }
-                
-                # Extract text from all paragraph runs
-                for para in root.findall('.//w:p', namespaces):
-                    para_text = []
-                    for run in para.findall('.//w:t', namespaces):
-                        if run.text:
-                            para_text.append(run.text)
-                    
-                    if para_text:
-                        text_content.append(''.join(para_text))
-                
-                return '\n'.join(text_content)
-            else:
-                return "Error: Not a valid DOCX file (missing document.xml)"
-                
+        return '\n'.join(block.text for block in iter_docx_blocks(docx_path) if block.text)
     except zipfile.BadZipFile:
         return "Error: File is not a valid ZIP/DOCX format"
+    except KeyError:
+        return "Error: Not a valid DOCX file (missing document.xml)"
     except Exception as e:
         return f"Error extracting text: {e}"
 
@@ -56,8 +187,7 @@ def convert_docx_to_txt(input_path, output_path=None):
     """Convert a DOCX file to TXT using ZIP extraction method"""
     
     if not output_path:
-        base_name = os.path.splitext(input_path)[0]
-        output_path = f"{base_name}_converted.txt"
+        output_path = default_output_path(input_path)
     
     print(f"🔄 Converting: {os.path.basename(input_path)}")
     print(f"📄 Output will be: {os.path.basename(output_path)}")
@@ -88,6 +218,152 @@ def convert_docx_to_txt(input_path, output_path=None):
         print(f"❌ Failed to save: {e}")
         return None
 
+def default_output_path(input_path, out_dir=None, input_root=None):
+    """Return the *_converted.txt path for a DOCX, optionally inside out_dir
+
+    With an input_root the path below it is kept under out_dir, so
+    a/resume.docx and b/resume.docx don't both become out_dir/resume.txt.
+    """
+    base_name = os.path.splitext(input_path)[0]
+    if out_dir:
+        relative = os.path.relpath(base_name, input_root) if input_root else os.path.basename(base_name)
+        base_name = os.path.join(out_dir, relative)
+    return f"{base_name}_converted.txt"
+
+def _glob_root(pattern):
+    """The leading directories of a glob pattern that contain no wildcards"""
+    parts = []
+    for part in os.path.normpath(pattern).split(os.sep)[:-1]:
+        if any(char in part for char in '*?['):
+            break
+        parts.append(part)
+    return os.sep.join(parts) or ('/' if pattern.startswith('/') else '.')
+
+def expand_inputs_with_roots(inputs):
+    """Map each DOCX found in files, directories and glob patterns to the input root it was found under"""
+    found = {}
+    for item in inputs:
+        if os.path.isdir(item):
+            for root, _, files in os.walk(item):
+                for name in files:
+                    if name.lower().endswith('.docx') and not name.startswith('~$'):
+                        found.setdefault(os.path.join(root, name), item)
+        elif os.path.isfile(item):
+            found.setdefault(item, os.path.dirname(item))
+        else:
+            for match in glob.glob(item, recursive=True):
+                if os.path.isfile(match) and match.lower().endswith('.docx'):
+                    found.setdefault(match, _glob_root(item))
+    return found
+
+def expand_inputs(inputs):
+    """Expand files, directories and glob patterns into a sorted list of DOCX paths"""
+    return sorted(expand_inputs_with_roots(inputs))
+
+def is_up_to_date(input_path, output_path):
+    """True when the output exists and is at least as new as its source"""
+    try:
+        return os.stat(output_path).st_mtime_ns >= os.stat(input_path).st_mtime_ns
+    except OSError:
+        return False
+
+def _convert_quietly(paths):
+    """Worker: convert one (input, output) pair and return a manifest entry"""
+    input_path, output_path = paths
+    entry = {'source': input_path, 'output': output_path, 'bytes': 0}
+    try:
+        entry['bytes'] = os.path.getsize(input_path)
+    except OSError as e:
+        # Vanished or unreadable since it was listed: record it, don't abort the batch
+        entry.update(status='error', error=f"Failed to read: {e}")
+        return entry
+    content = extract_text_from_docx_zip(input_path)
+    if content.startswith("Error"):
+        entry.update(status='error', error=content)
+        return entry
+    try:
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        entry.update(status='converted', characters=len(content))
+    except OSError as e:
+        entry.update(status='error', error=f"Failed to save: {e}")
+    return entry
+
+def batch_convert(inputs, out_dir=None, jobs=None, force=False, manifest_path=None):
+    """Convert many DOCX files in parallel, skipping up-to-date outputs; returns the manifest
+
+    Returns None without converting anything if two inputs map to the same output.
+    """
+    started = time.perf_counter()
+    roots = expand_inputs_with_roots(inputs)
+    sources = sorted(roots)
+    targets = {source: default_output_path(source, out_dir, roots[source]) for source in sources}
+
+    # Two inputs writing the same file would silently overwrite each other
+    claimed = {}
+    for source, output in targets.items():
+        claimed.setdefault(os.path.normcase(os.path.abspath(output)), []).append(source)
+    duplicates = [group for group in claimed.values() if len(group) > 1]
+    if duplicates:
+        for group in duplicates:
+            print(f"❌ Same output {targets[group[0]]} for: {', '.join(group)}")
+        print("❌ Conversion aborted: rename the inputs or convert them separately")
+        return None
+
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+
+    pending, skipped = [], []
+    for source in sources:
+        output = targets[source]
+        if not force and is_up_to_date(source, output):
+            skipped.append({'source': source, 'output': output, 'status': 'skipped'})
+        else:
+            pending.append((source, output))
+
+    print(f"🔄 {len(sources)} DOCX files found: {len(pending)} to convert, {len(skipped)} up to date")
+
+    entries = []
+    if pending:
+        workers = min(jobs or os.cpu_count() or 1, len(pending))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(pending) // (workers * 4))
+            for entry in pool.map(_convert_quietly, pending, chunksize=chunksize):
+                entries.append(entry)
+                if entry['status'] == 'error':
+                    print(f"❌ {os.path.basename(entry['source'])}: {entry['error']}")
+
+    elapsed = time.perf_counter() - started
+    converted = [e for e in entries if e['status'] == 'converted']
+    errors = [e for e in entries if e['status'] == 'error']
+    megabytes = sum(e['bytes'] for e in converted) / (1024 * 1024)
+    stats = {
+        'files_found': len(sources),
+        'converted': len(converted),
+        'skipped': len(skipped),
+        'errors': len(errors),
+        'seconds': round(elapsed, 3),
+        'files_per_second': round(len(converted) / elapsed, 2) if elapsed else 0.0,
+        'mb_per_second': round(megabytes / elapsed, 2) if elapsed else 0.0,
+    }
+    manifest = {
+        'generated': datetime.now().isoformat(timespec='seconds'),
+        'stats': stats,
+        'converted': converted,
+        'errors': errors,
+        'skipped': skipped,
+    }
+
+    manifest_path = manifest_path or os.path.join(out_dir or '.', 'conversion_manifest.json')
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    print(f"✅ Converted {stats['converted']} files, skipped {stats['skipped']}, {stats['errors']} errors")
+    print(f"📊 Throughput: {stats['files_per_second']} files/s, {stats['mb_per_second']} MB/s ({stats['seconds']}s)")
+    print(f"📝 Manifest: {manifest_path}")
+    return manifest
+
 def main():
     print("🔧 DOCX to TXT Converter")
     print("=" * 30)
@@ -96,10 +372,26 @@ def main():
     
     if len(sys.argv) < 2:
         print("Usage: python docx_to_txt_converter.py <input_file.docx> [output_file.txt]")
+        print("       python docx_to_txt_converter.py <file|folder|glob> [...] [--out-dir DIR] [--jobs N] [--force]")
         print()
         print("Example:")
         print("  python docx_to_txt_converter.py brain_surgeon.docx")
         print("  python docx_to_txt_converter.py C:/Users/ryan_/OneDrive/Documents/brain_surgeon.docx")
+        print("  python docx_to_txt_converter.py incoming_applicants/ --out-dir converted --jobs 8")
+        return
+    
+    # Legacy single-file form: <input_file.docx> [output_file.txt]
+    legacy = (len(sys.argv) in (2, 3) and os.path.isfile(sys.argv[1])
+              and (len(sys.argv) == 2 or sys.argv[2].lower().endswith('.txt')))
+    if not legacy:
+        parser = argparse.ArgumentParser(description='Batch DOCX to TXT converter')
+        parser.add_argument('inputs', nargs='+', help='DOCX files, folders or glob patterns')
+        parser.add_argument('--out-dir', '-o', help='Write converted files here (default: next to each source)')
+        parser.add_argument('--jobs', '-j', type=int, help='Worker processes (default: CPU count)')
+        parser.add_argument('--force', action='store_true', help='Convert even when the output is newer than the source')
+        parser.add_argument('--manifest', help='Manifest path (default: conversion_manifest.json)')
+        args = parser.parse_args()
+        batch_convert(args.inputs, args.out_dir, args.jobs, args.force, args.manifest)
         return
     
     input_file = sys.argv[1]
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Direct OOXML Writer - Write resume .docx files without the python-docx object model
+
+A resume is described as a flat list of DocxParagraph blocks. write_docx()
+streams them as escaped XML fragments into word/document.xml and copies every
+other part (styles, settings, theme, rels) from a base template that is read
+and compressed once per process. The word/document.xml it writes is
+byte-identical to rendering the same blocks with python-docx
+(ResumeOptimizer.render_blocks_to_document).
+
+Sections that never change for a career field are passed as DocxFragment
+blocks; their XML is rendered once per process and spliced in on every render.
+
+Output is deterministic: zip entries carry a fixed timestamp and the core
+properties a fixed created/modified date, so the same blocks always produce
+the same bytes.
+
+The default template is python-docx's bundled default.docx, located on disk
+without importing python-docx.
+"""
+
+import hashlib
+import importlib.util
+import io
+import os
+import re
+import zipfile
+from collections import namedtuple
+from typing import Dict, Iterable, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+# One run of text; size (pt) overrides the paragraph style's Calibri size only when
+# given, and a run with a url is written as a clickable ResumeLink hyperlink
+DocxRun = namedtuple('DocxRun', ['text', 'size', 'bold', 'url'])
+DocxRun.__new__.__defaults__ = (None, False, None)
+
+# One paragraph: style name ('ResumeBody', 'ResumeHeading', 'Title' or None), runs and alignment
+DocxParagraph = namedtuple('DocxParagraph', ['style', 'runs', 'align'])
+DocxParagraph.__new__.__defaults__ = (None, (), None)
+
+# A run of paragraphs whose rendered XML is cached under (key, RENDERER_VERSION).
+# Only for content that never changes for a key; fragments cannot hold
+# hyperlinks because relationship ids are assigned per document.
+DocxFragment = namedtuple('DocxFragment', ['key', 'blocks'])
+
+# Bump whenever the XML produced for a block changes, so cached fragments are rebuilt
+RENDERER_VERSION = "2"
+
+RUN_FONT = 'Calibri'
+
+# Resume page margins in inches
+RESUME_MARGINS = {'top': 0.5, 'bottom': 0.5, 'left': 0.7, 'right': 0.7}
+
+HYPERLINK_RELTYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
+
+DOCUMENT_PART = 'word/document.xml'
+DOCUMENT_RELS_PART = 'word/_rels/document.xml.rels'
+
+XML_DECLARATION = "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+
+# Paragraph style names to styleId; the default paragraph style gets no pStyle
+STYLE_IDS = {'Normal': None, 'Title': 'Title', 'Heading 1': 'Heading1',
+             'Heading 2': 'Heading2', 'Heading 3': 'Heading3'}
+
+# Resume styles added to styles.xml once, so runs reference a style instead of
+# repeating font overrides. ResumeHeading copies Heading 1's layout and outline
+# level with Calibri in place of the theme font.
+RESUME_STYLES = {
+    'ResumeBody': (
+        '<w:style w:type="paragraph" w:customStyle="1" w:styleId="ResumeBody">'
+        '<w:name w:val="ResumeBody"/><w:basedOn w:val="Normal"/><w:qFormat/>'
+        f'<w:rPr><w:rFonts w:ascii="{RUN_FONT}" w:hAnsi="{RUN_FONT}"/><w:sz w:val="24"/></w:rPr>'
+        '</w:style>'),
+    'ResumeHeading': (
+        '<w:style w:type="paragraph" w:customStyle="1" w:styleId="ResumeHeading">'
+        '<w:name w:val="ResumeHeading"/><w:basedOn w:val="Normal"/><w:next w:val="ResumeBody"/><w:qFormat/>'
+        '<w:pPr><w:keepNext/><w:keepLines/><w:spacing w:before="480" w:after="0"/><w:outlineLvl w:val="0"/></w:pPr>'
+        f'<w:rPr><w:rFonts w:ascii="{RUN_FONT}" w:hAnsi="{RUN_FONT}"/><w:b/><w:bCs/>'
+        '<w:color w:val="365F91" w:themeColor="accent1" w:themeShade="BF"/><w:sz w:val="28"/><w:szCs w:val="28"/></w:rPr>'
+        '</w:style>'),
+    'ResumeLink': (
+        '<w:style w:type="character" w:customStyle="1" w:styleId="ResumeLink">'
+        '<w:name w:val="ResumeLink"/><w:basedOn w:val="DefaultParagraphFont"/>'
+        f'<w:rPr><w:rFonts w:ascii="{RUN_FONT}" w:hAnsi="{RUN_FONT}"/><w:color w:val="0563C1"/>'
+        '<w:sz w:val="24"/><w:u w:val="single"/></w:rPr>'
+        '</w:style>'),
+}
+
+STYLES_PART = 'word/styles.xml'
+CORE_PROPERTIES_PART = 'docProps/core.xml'
+
+# Fixed timestamps so identical renders are byte-identical (1980-01-01 is the zip epoch)
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+CORE_PROPERTIES_TIMESTAMP = '1980-01-01T00:00:00Z'
+
+# Hyperlink runs only reference the link character style
+_HYPERLINK_RPR = '<w:rPr><w:rStyle w:val="ResumeLink"/></w:rPr>'
+
+_TEMPLATE_CACHE: Dict[str, 'DocxTemplate'] = {}
+_FRAGMENT_CACHE: Dict[Tuple, str] = {}
+
+
+def default_template_path() -> str:
+    """Locate python-docx's bundled default.docx without importing python-docx"""
+    spec = importlib.util.find_spec('docx')
+    if spec is None or not spec.submodule_search_locations:
+        raise FileNotFoundError("python-docx default template not found (pip install python-docx)")
+    return os.path.join(list(spec.submodule_search_locations)[0], 'templates', 'default.docx')
+
+
+class DocxTemplate:
+    """Fixed parts of a base .docx, pre-compressed so each render only adds document.xml"""
+
+    def __init__(self, template_path: str):
+        with zipfile.ZipFile(template_path) as template:
+            document_xml = template.read(DOCUMENT_PART).decode('utf-8')
+            self.rels_xml = XML_DECLARATION + _compact_xml(template.read(DOCUMENT_RELS_PART).decode('utf-8'))
+
+            fixed = io.BytesIO()
+            with zipfile.ZipFile(fixed, 'w', zipfile.ZIP_DEFLATED) as out:
+                for info in template.infolist():
+                    if info.filename in (DOCUMENT_PART, DOCUMENT_RELS_PART):
+                        continue
+                    data = template.read(info.filename)
+                    if info.filename == STYLES_PART:
+                        data = add_resume_styles_xml(data.decode('utf-8')).encode('utf-8')
+                    elif info.filename == CORE_PROPERTIES_PART:
+                        data = fix_core_properties_xml(data.decode('utf-8')).encode('utf-8')
+                    out.writestr(_zip_entry(info.filename), data)
+            self.fixed_zip = fixed.getvalue()
+        # Identifies the fixed parts, for render caches keyed on their inputs
+        self.fingerprint = hashlib.sha256(self.fixed_zip).hexdigest()
+
+        root = re.search(r'<w:document\b[^>]*>', document_xml)
+        sect_pr = re.search(r'<w:sectPr\b.*?</w:sectPr>', document_xml, re.DOTALL)
+        if root is None or sect_pr is None:
+            raise ValueError(f"Unsupported template document.xml: {template_path}")
+        self.document_start = XML_DECLARATION + root.group(0) + '<w:body>'
+        self.sect_pr = _compact_xml(sect_pr.group(0))
+        self.used_rel_ids = set(int(n) for n in re.findall(r'Id="rId(\d+)"', self.rels_xml))
+
+    def section_xml(self, margins: Dict[str, float]) -> str:
+        """Template sectPr with the page margins replaced"""
+        def set_margin(match):
+            side = match.group(1)
+            if side in margins:
+                return f'w:{side}="{int(round(margins[side] * 1440))}"'
+            return match.group(0)
+
+        return re.sub(r'<w:pgMar\b[^>]*/>',
+                      lambda m: re.sub(r'w:(top|right|bottom|left)="\d+"', set_margin, m.group(0)),
+                      self.sect_pr)
+
+
+def add_resume_styles_xml(styles_xml: str) -> str:
+    """Insert any missing resume styles into a styles.xml document"""
+    missing = ''.join(xml for style_id, xml in RESUME_STYLES.items()
+                      if f'w:styleId="{style_id}"' not in styles_xml)
+    return styles_xml.replace('</w:styles>', missing + '</w:styles>')
+
+
+def fix_core_properties_xml(core_xml: str) -> str:
+    """Pin the created/modified dates in a docProps/core.xml document"""
+    return re.sub(r'(<dcterms:(?:created|modified)\b[^>]*>)[^<]*(</dcterms:)',
+                  lambda m: m.group(1) + CORE_PROPERTIES_TIMESTAMP + m.group(2), core_xml)
+
+
+def _zip_entry(name: str) -> zipfile.ZipInfo:
+    """Deflated zip entry with the fixed timestamp"""
+    info = zipfile.ZipInfo(name, date_time=ZIP_DATE_TIME)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    return info
+
+
+def normalize_docx_package(data: bytes) -> bytes:
+    """Rewrite a saved .docx with fixed zip timestamps (python-docx stamps the current time)"""
+    out = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(data)) as source, zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as package:
+        for info in source.infolist():
+            package.writestr(_zip_entry(info.filename), source.read(info.filename))
+    return out.getvalue()
+
+
+def load_template(template_path: Optional[str] = None) -> DocxTemplate:
+    """Return the cached DocxTemplate for a template file"""
+    template_path = template_path or default_template_path()
+    template = _TEMPLATE_CACHE.get(template_path)
+    if template is None:
+        template = _TEMPLATE_CACHE[template_path] = DocxTemplate(template_path)
+    return template
+
+
+def _compact_xml(xml: str) -> str:
+    """Strip the XML declaration and the indentation between tags"""
+    xml = re.sub(r'^<\?xml[^>]*\?>', '', xml.strip())
+    return re.sub(r'>\s+<', '><', xml.strip())
+
+
+# Control characters XML 1.0 does not allow (tab, LF and CR are fine); PDF text can carry them
+_ILLEGAL_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _escape_text(value: str) -> str:
+    """Escape text for XML content, dropping characters XML 1.0 cannot represent"""
+    return escape(_ILLEGAL_XML_CHARS.sub('', value))
+
+
+def _escape_attr(value: str) -> str:
+    return escape(_ILLEGAL_XML_CHARS.sub('', value), {'"': '&quot;'})
+
+
+def _text_xml(text: str) -> str:
+    """Run content as python-docx writes it: tabs and line breaks become elements
+
+    Form feeds and vertical tabs (page breaks in extracted PDF text) become line
+    breaks too; other control characters are dropped so the XML stays well-formed.
+    """
+    parts = []
+    for piece in re.split(r'([\t\n\r\x0b\x0c])', text):
+        if piece == '\t':
+            parts.append('<w:tab/>')
+        elif piece in ('\n', '\r', '\x0b', '\x0c'):
+            parts.append('<w:br/>')
+        elif piece:
+            piece = _ILLEGAL_XML_CHARS.sub('', piece)
+            if not piece:
+                continue
+            space = ' xml:space="preserve"' if piece.strip() != piece else ''
+            parts.append(f'<w:t{space}>{escape(piece)}</w:t>')
+    return ''.join(parts)
+
+
+def _paragraph_xml(paragraph: DocxParagraph, rel_id_for) -> str:
+    """Serialize one paragraph, asking rel_id_for(url) for hyperlink relationship ids"""
+    ppr = ''
+    style_id = STYLE_IDS.get(paragraph.style, (paragraph.style or '').replace(' ', '') or None)
+    if style_id:
+        ppr += f'<w:pStyle w:val="{style_id}"/>'
+    if paragraph.align:
+        ppr += f'<w:jc w:val="{paragraph.align}"/>'
+
+    runs = []
+    for run in paragraph.runs:
+        if run.url:
+            runs.append(f'<w:hyperlink r:id="{rel_id_for(run.url)}"><w:r>{_HYPERLINK_RPR}'
+                        f'<w:t>{_escape_text(run.text)}</w:t></w:r></w:hyperlink>')
+            continue
+        rpr = f'<w:rFonts w:ascii="{RUN_FONT}" w:hAnsi="{RUN_FONT}"/>' if run.size else ''
+        if run.bold:
+            rpr += '<w:b/>'
+        if run.size:
+            rpr += f'<w:sz w:val="{int(round(run.size * 2))}"/>'
+        rpr = f'<w:rPr>{rpr}</w:rPr>' if rpr else ''
+        runs.append(f'<w:r>{rpr}{_text_xml(run.text)}</w:r>')
+
+    # Any explicit style (even the default one) leaves a pPr behind, as in python-docx
+    if ppr:
+        ppr = f'<w:pPr>{ppr}</w:pPr>'
+    elif paragraph.style:
+        ppr = '<w:pPr/>'
+    if not ppr and not runs:
+        return '<w:p/>'
+    return '<w:p>' + ppr + ''.join(runs) + '</w:p>'
+
+
+def iter_paragraphs(blocks: Iterable) -> Iterable[DocxParagraph]:
+    """Yield plain paragraphs, expanding any fragments inline"""
+    for block in blocks:
+        if isinstance(block, DocxFragment):
+            yield from block.blocks
+        else:
+            yield block
+
+
+def _no_hyperlinks(url):
+    raise ValueError(f"Hyperlink {url} cannot be part of a cached fragment")
+
+
+def fragment_xml(fragment: DocxFragment) -> str:
+    """Return the cached XML for a fragment, rendering it on first use"""
+    cache_key = (fragment.key, RENDERER_VERSION)
+    xml = _FRAGMENT_CACHE.get(cache_key)
+    if xml is None:
+        xml = _FRAGMENT_CACHE[cache_key] = ''.join(
+            _paragraph_xml(paragraph, _no_hyperlinks) for paragraph in fragment.blocks)
+    return xml
+
+
+def render_document_xml(blocks: Iterable, template: DocxTemplate,
+                        margins: Dict[str, float] = RESUME_MARGINS) -> Tuple[str, List[Tuple[str, str]]]:
+    """Return (document.xml, [(rel id, url), ...]) for a list of paragraphs and fragments"""
+    hyperlinks: Dict[str, str] = {}
+    next_id = [1]
+
+    def rel_id_for(url):
+        # Same URL shares one relationship, ids fill the first free rIdN like python-docx
+        if url not in hyperlinks:
+            while next_id[0] in template.used_rel_ids:
+                next_id[0] += 1
+            hyperlinks[url] = f'rId{next_id[0]}'
+            next_id[0] += 1
+        return hyperlinks[url]
+
+    body = ''.join(fragment_xml(block) if isinstance(block, DocxFragment) else _paragraph_xml(block, rel_id_for)
+                   for block in blocks)
+    xml = template.document_start + body + template.section_xml(margins) + '</w:body></w:document>'
+    return xml, [(rel_id, url) for url, rel_id in hyperlinks.items()]
+
+
+def write_docx(target, blocks: Iterable, margins: Dict[str, float] = RESUME_MARGINS,
+               template_path: Optional[str] = None):
+    """Write paragraphs and fragments as a .docx to a file path or binary file object"""
+    template = load_template(template_path)
+    document_xml, hyperlinks = render_document_xml(blocks, template, margins)
+
+    rels_xml = template.rels_xml
+    if hyperlinks:
+        new_rels = ''.join(f'<Relationship Id="{rel_id}" Type="{HYPERLINK_RELTYPE}" '
+                           f'Target="{_escape_attr(url)}" TargetMode="External"/>'
+                           for rel_id, url in hyperlinks)
+        rels_xml = rels_xml.replace('</Relationships>', new_rels + '</Relationships>')
+
+    # Append the two per-render parts to a copy of the pre-compressed fixed parts
+    buffer = io.BytesIO(template.fixed_zip)
+    with zipfile.ZipFile(buffer, 'a', zipfile.ZIP_DEFLATED) as package:
+        package.writestr(_zip_entry(DOCUMENT_PART), document_xml.encode('utf-8'))
+        package.writestr(_zip_entry(DOCUMENT_RELS_PART), rels_xml.encode('utf-8'))
+
+    if hasattr(target, 'write'):
+        target.write(buffer.getvalue())
+    else:
+        with open(target, 'wb') as f:
+            f.write(buffer.getvalue())
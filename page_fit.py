@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Page-Fit Estimator - Predict resume page count from DocxParagraph blocks without rendering
+
+Measures every paragraph with a static Calibri advance-width table, wraps it
+greedily at spaces to the text width left by the resume margins (0.5" top and
+bottom, 0.7" left and right on US Letter), and flows the lines onto pages
+using the paragraph spacing of the resume styles. A full resume estimates in
+well under a millisecond, so a layout can be checked before it is rendered.
+
+fit_to_pages() drops the lowest-priority bullets - the last bullets of the
+longest bullet lists first - until the estimate fits a page budget, so the
+DOCX is rendered exactly once.
+
+Works on the DocxParagraph blocks from build_standard_blocks() and, through
+render_docx_blocks(), on any ResumeDocument.
+"""
+
+from collections import namedtuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, List, Sequence, Tuple
+
+from ooxml_writer import RESUME_MARGINS, iter_paragraphs
+from resume_ir import render_docx_blocks
+
+# US Letter, as in the base template's <w:pgSz>
+PAGE_WIDTH_IN = 8.5
+PAGE_HEIGHT_IN = 11.0
+
+# Calibri advance widths in 1/1000 em
+CALIBRI_WIDTHS = {
+    ' ': 226, '!': 267, '"': 401, '#': 498, '$': 507, '%': 715, '&': 682, "'": 221,
+    '(': 303, ')': 303, '*': 498, '+': 498, ',': 250, '-': 306, '.': 252, '/': 386,
+    ':': 268, ';': 268, '<': 498, '=': 498, '>': 498, '?': 463, '@': 894, '[': 325,
+    '\\': 386, ']': 325, '^': 498, '_': 498, '`': 291, '{': 312, '|': 460, '}': 312, '~': 498,
+    'A': 579, 'B': 544, 'C': 533, 'D': 615, 'E': 488, 'F': 459, 'G': 631, 'H': 623,
+    'I': 252, 'J': 319, 'K': 520, 'L': 420, 'M': 855, 'N': 646, 'O': 662, 'P': 517,
+    'Q': 673, 'R': 543, 'S': 459, 'T': 487, 'U': 642, 'V': 567, 'W': 890, 'X': 519,
+    'Y': 487, 'Z': 468,
+    'a': 479, 'b': 525, 'c': 423, 'd': 525, 'e': 498, 'f': 305, 'g': 471, 'h': 525,
+    'i': 229, 'j': 239, 'k': 455, 'l': 229, 'm': 799, 'n': 525, 'o': 527, 'p': 525,
+    'q': 525, 'r': 349, 's': 391, 't': 335, 'u': 525, 'v': 452, 'w': 715, 'x': 433,
+    'y': 453, 'z': 395,
+    '•': 498, '–': 498, '—': 905, '‘': 250, '’': 250, '“': 418, '”': 418, '…': 690,
+}
+CALIBRI_WIDTHS.update({digit: 507 for digit in '0123456789'})
+
+# Unlisted characters: emoji are drawn from a fallback font about 1 em wide
+DEFAULT_WIDTH = 500
+EMOJI_WIDTH = 1000
+
+# Calibri bold runs about 4% wider than regular
+BOLD_FACTOR = 1.04
+
+# Calibri ascent + descent as a multiple of the font size (single line spacing)
+LINE_HEIGHT_EM = 1.22
+
+# Per paragraph style: font size (pt), space before/after (pt), line spacing multiple, bold
+StyleMetrics = namedtuple('StyleMetrics', ['size', 'before', 'after', 'line_spacing', 'bold'])
+
+# From the template's docDefaults (11pt, 10pt after, 1.15 lines) and the resume styles.
+# Title adds its bottom border (4pt space + 1pt rule) to the space after.
+STYLE_METRICS = {
+    None: StyleMetrics(11, 0, 10, 1.15, False),
+    'Normal': StyleMetrics(11, 0, 10, 1.15, False),
+    'ResumeBody': StyleMetrics(12, 0, 10, 1.15, False),
+    'ResumeHeading': StyleMetrics(14, 24, 0, 1.15, True),
+    'Heading 1': StyleMetrics(14, 24, 0, 1.15, True),
+    'Title': StyleMetrics(26, 0, 20, 1.0, False),
+}
+
+BULLET_PREFIXES = ('• ', '- ')
+
+
+@dataclass
+class LayoutEstimate:
+    """Predicted layout of a list of paragraphs"""
+    pages: int
+    lines: int
+    last_page_height: float
+    page_height: float
+
+    @property
+    def last_page_fill(self) -> float:
+        """Fraction of the last page in use"""
+        return self.last_page_height / self.page_height if self.page_height else 0.0
+
+
+def content_box(margins: dict = RESUME_MARGINS) -> Tuple[float, float]:
+    """Text width and height in points inside the page margins"""
+    width = (PAGE_WIDTH_IN - margins['left'] - margins['right']) * 72
+    height = (PAGE_HEIGHT_IN - margins['top'] - margins['bottom']) * 72
+    return width, height
+
+
+def _char_width(char: str) -> int:
+    width = CALIBRI_WIDTHS.get(char)
+    if width is None:
+        return EMOJI_WIDTH if ord(char) >= 0x2600 else DEFAULT_WIDTH
+    return width
+
+
+@lru_cache(maxsize=8192)
+def word_width_em(word: str) -> float:
+    """Advance width of a word in em (1/1000 units summed)"""
+    return sum(_char_width(char) for char in word) / 1000
+
+
+def text_width(text: str, size: float, bold: bool = False) -> float:
+    """Width of a single line of text in points"""
+    width = sum(word_width_em(word) for word in text.split(' ')) + word_width_em(' ') * text.count(' ')
+    return width * size * (BOLD_FACTOR if bold else 1.0)
+
+
+def wrap_line_count(segments: Iterable[Tuple[str, float, bool]], width: float) -> int:
+    """Lines needed for (text, size, bold) runs wrapped greedily at spaces and line breaks"""
+    lines, x = 1, 0.0
+    pending_space = 0.0
+    for text, size, bold in segments:
+        scale = size * (BOLD_FACTOR if bold else 1.0)
+        space = word_width_em(' ') * scale
+        for line_index, line in enumerate(text.split('\n')):
+            if line_index:
+                lines, x, pending_space = lines + 1, 0.0, 0.0
+            for word_index, word in enumerate(line.split(' ')):
+                if word_index:
+                    pending_space += space
+                if not word:
+                    continue
+                w = word_width_em(word) * scale
+                if x and x + pending_space + w > width:
+                    lines, x = lines + 1, 0.0
+                elif x:
+                    x += pending_space
+                pending_space = 0.0
+                # A word wider than the line is broken across lines
+                while x + w > width and w > width:
+                    lines, w = lines + 1, w - (width - x)
+                    x = 0.0
+                x += w
+    return lines
+
+
+def measure_paragraph(paragraph, width: float) -> Tuple[StyleMetrics, float, int]:
+    """(style metrics, line height, line count) for one paragraph"""
+    metrics = STYLE_METRICS.get(paragraph.style, STYLE_METRICS['ResumeBody'])
+    runs = paragraph.runs or ()
+    size = max([run.size or metrics.size for run in runs] or [metrics.size])
+    line_height = size * LINE_HEIGHT_EM * metrics.line_spacing
+    if not runs:
+        return metrics, line_height, 1
+    segments = ((run.text, run.size or metrics.size, bool(run.bold) or metrics.bold) for run in runs)
+    return metrics, line_height, wrap_line_count(segments, width)
+
+
+def flow_pages(measured: Sequence[Tuple[StyleMetrics, float, int]], page_height: float) -> LayoutEstimate:
+    """Place measured paragraphs line by line onto pages"""
+    pages, y, total_lines = 1, 0.0, 0
+    for metrics, line_height, lines in measured:
+        # Space before is dropped at the top of a page, space after at the bottom
+        if y:
+            y += metrics.before
+        for _ in range(lines):
+            if y + line_height > page_height and y:
+                pages, y = pages + 1, 0.0
+            y += line_height
+        y = min(y + metrics.after, page_height)
+        total_lines += lines
+    return LayoutEstimate(pages, total_lines, y, page_height)
+
+
+def estimate_layout(blocks: Iterable, margins: dict = RESUME_MARGINS) -> LayoutEstimate:
+    """Predict page count and line count for paragraph blocks (fragments are expanded)"""
+    width, height = content_box(margins)
+    return flow_pages([measure_paragraph(p, width) for p in iter_paragraphs(blocks)], height)
+
+
+def estimate_document(document, margins: dict = RESUME_MARGINS) -> LayoutEstimate:
+    """Predict the layout of a ResumeDocument as rendered by render_docx_blocks()"""
+    return estimate_layout(render_docx_blocks(document), margins)
+
+
+def is_bullet(paragraph) -> bool:
+    return bool(paragraph.runs) and paragraph.runs[0].text.startswith(BULLET_PREFIXES)
+
+
+def trim_order(paragraphs: Sequence, min_bullets: int = 1) -> List[int]:
+    """Indexes of droppable bullets, lowest priority first
+
+    Bullets are grouped into runs of consecutive bullet paragraphs. The last
+    bullets of each run go first, longest runs before shorter ones, and every
+    run keeps at least min_bullets.
+    """
+    runs, current = [], []
+    for index, paragraph in enumerate(paragraphs):
+        if is_bullet(paragraph):
+            current.append(index)
+        elif current:
+            runs.append(current)
+            current = []
+    if current:
+        runs.append(current)
+
+    # Rank by distance from the front of the run (deeper = lower priority), then later in the page first
+    candidates = [(position, index) for run in runs for position, index in enumerate(run) if position >= min_bullets]
+    return [index for position, index in sorted(candidates, key=lambda c: (-c[0], -c[1]))]
+
+
+def fit_to_pages(blocks: list, max_pages: int, margins: dict = RESUME_MARGINS,
+                 fixed_prefix: Sequence = (), min_bullets: int = 1) -> Tuple[list, List[str]]:
+    """Drop low-priority bullets until blocks (after fixed_prefix) fit in max_pages
+
+    Returns the blocks to render and the text of the bullets that were dropped.
+    Blocks that already fit are returned unchanged, fragments included.
+    """
+    width, height = content_box(margins)
+    prefix = [measure_paragraph(p, width) for p in iter_paragraphs(fixed_prefix)]
+    paragraphs = list(iter_paragraphs(blocks))
+    measured = [measure_paragraph(p, width) for p in paragraphs]
+    if flow_pages(prefix + measured, height).pages <= max_pages:
+        return blocks, []
+
+    dropped = set()
+    for index in trim_order(paragraphs, min_bullets):
+        dropped.add(index)
+        kept = [m for i, m in enumerate(measured) if i not in dropped]
+        if flow_pages(prefix + kept, height).pages <= max_pages:
+            break
+
+    # Trimmed output is flat: cached fragments are expanded into plain paragraphs
+    trimmed = [p for i, p in enumerate(paragraphs) if i not in dropped]
+    return trimmed, [paragraphs[i].runs[0].text for i in sorted(dropped)]
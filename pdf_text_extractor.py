@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+"""
+PDF Text Extractor - Pure-Python text extraction for resumes and job postings
+
+Reads text from PDF files without a converter subprocess or third-party
+library. Objects are indexed with a single scan of the file and parsed only
+when a page needs them; pages are decoded lazily, one at a time, so callers
+can stop as soon as they have enough text. FlateDecode streams go through
+zlib, and ToUnicode CMaps are honoured so Word/Google Docs exports (which use
+CID fonts) come out as readable text.
+
+Usage:
+    from pdf_text_extractor import extract_text_from_pdf, iter_pdf_pages
+    text = extract_text_from_pdf("resume.pdf", max_pages=10)
+"""
+
+import re
+import sys
+import zlib
+from typing import Dict, Iterator, List, Optional
+
+DEFAULT_MAX_PAGES = 50
+
+# Characters a resume or job posting reader needs; decoding stops once it has this many.
+# A real resume is a few thousand characters, so this only cuts off appended catalogues/scans.
+DOCUMENT_TEXT_CHARS = 100_000
+
+_OBJ_HEADER = re.compile(rb'(\d+)\s+(\d+)\s+obj\b')
+_REF_TAIL = re.compile(rb'\s+(\d+)\s+R(?![^\s/<>\[\]()%])')
+_NUMBER = re.compile(rb'[+-]?(\d+\.?\d*|\.\d+)')
+_STREAM_START = re.compile(rb'\s*stream\r?\n')
+_WHITESPACE = b' \t\r\n\f\x00'
+_DELIMITERS = b'()<>[]{}/%'
+_ESCAPES = {ord('n'): b'\n', ord('r'): b'\r', ord('t'): b'\t', ord('b'): b'\b',
+            ord('f'): b'\f', ord('('): b'(', ord(')'): b')', ord('\\'): b'\\'}
+
+
+class PdfError(Exception):
+    """Raised when a PDF can't be read (encrypted, malformed, ...)"""
+
+
+class Name(str):
+    """A PDF name object (/Type, /Page, ...), stored without the leading slash"""
+
+
+class Ref(tuple):
+    """An indirect reference 'N G R'"""
+
+
+class Stream:
+    """A PDF stream: its dictionary plus raw (still encoded) bytes"""
+
+    def __init__(self, attrs: Dict, raw: bytes):
+        self.attrs = attrs
+        self.raw = raw
+
+
+class _Operator(bytes):
+    """A content-stream operator keyword (BT, Tj, ...)"""
+
+
+class _Lexer:
+    """Tokenizer and object parser shared by file bodies and content streams"""
+
+    def __init__(self, data: bytes, pos: int = 0):
+        self.data = data
+        self.pos = pos
+
+    def _skip_whitespace(self):
+        data, n = self.data, len(self.data)
+        while self.pos < n:
+            c = data[self.pos]
+            if c in _WHITESPACE:
+                self.pos += 1
+            elif c == 0x25:  # % comment
+                end = data.find(b'\n', self.pos)
+                self.pos = n if end < 0 else end + 1
+            else:
+                break
+
+    def next_object(self):
+        """Parse the next object or operator; returns None at end of data"""
+        self._skip_whitespace()
+        data = self.data
+        if self.pos >= len(data):
+            return None
+        c = data[self.pos]
+
+        if c == 0x2F:  # /Name
+            start = self.pos + 1
+            self.pos = start
+            while self.pos < len(data) and data[self.pos] not in _WHITESPACE and data[self.pos] not in _DELIMITERS:
+                self.pos += 1
+            raw = data[start:self.pos]
+            return Name(re.sub(rb'#([0-9A-Fa-f]{2})', lambda m: bytes([int(m.group(1), 16)]), raw).decode('latin-1'))
+        if c == 0x28:  # (literal string)
+            return self._literal_string()
+        if data.startswith(b'<<', self.pos):
+            self.pos += 2
+            result = {}
+            while True:
+                self._skip_whitespace()
+                if data.startswith(b'>>', self.pos) or self.pos >= len(data):
+                    self.pos += 2
+                    return result
+                key = self.next_object()
+                result[key] = self.next_object()
+        if c == 0x3C:  # <hex string>
+            end = data.find(b'>', self.pos)
+            end = len(data) if end < 0 else end
+            hex_digits = re.sub(rb'[^0-9A-Fa-f]', b'', data[self.pos + 1:end])
+            self.pos = end + 1
+            if len(hex_digits) % 2:
+                hex_digits += b'0'
+            return bytes.fromhex(hex_digits.decode('ascii'))
+        if c == 0x5B:  # [array]
+            self.pos += 1
+            items = []
+            while True:
+                self._skip_whitespace()
+                if self.pos >= len(data) or data[self.pos] == 0x5D:
+                    self.pos += 1
+                    return items
+                items.append(self.next_object())
+        if c in b']>)}{':
+            self.pos += 1
+            return _Operator(bytes([c]))
+
+        # Number, keyword or operator
+        start = self.pos
+        while self.pos < len(data) and data[self.pos] not in _WHITESPACE and data[self.pos] not in _DELIMITERS:
+            self.pos += 1
+        token = data[start:self.pos]
+        if _NUMBER.fullmatch(token):
+            if b'.' not in token:
+                value = int(token)
+                # Look ahead for 'G R' to form an indirect reference
+                saved = self.pos
+                match = _REF_TAIL.match(data, self.pos)
+                if match and value >= 0:
+                    self.pos = match.end()
+                    return Ref((value, int(match.group(1))))
+                self.pos = saved
+                return value
+            return float(token)
+        if token == b'true':
+            return True
+        if token == b'false':
+            return False
+        if token == b'null':
+            return None
+        return _Operator(token)
+
+    def _literal_string(self) -> bytes:
+        data = self.data
+        self.pos += 1
+        depth = 1
+        out = bytearray()
+        while self.pos < len(data):
+            c = data[self.pos]
+            self.pos += 1
+            if c == 0x5C:  # backslash escape
+                if self.pos >= len(data):
+                    break
+                e = data[self.pos]
+                self.pos += 1
+                if e in _ESCAPES:
+                    out += _ESCAPES[e]
+                elif 0x30 <= e <= 0x37:
+                    digits = bytes([e])
+                    while len(digits) < 3 and self.pos < len(data) and 0x30 <= data[self.pos] <= 0x37:
+                        digits += bytes([data[self.pos]])
+                        self.pos += 1
+                    out.append(int(digits, 8) & 0xFF)
+                elif e == 0x0D:
+                    if data[self.pos:self.pos + 1] == b'\n':
+                        self.pos += 1
+                elif e != 0x0A:
+                    out.append(e)
+            elif c == 0x28:
+                depth += 1
+                out.append(c)
+            elif c == 0x29:
+                depth -= 1
+                if depth == 0:
+                    break
+                out.append(c)
+            else:
+                out.append(c)
+        return bytes(out)
+
+
+class _ToUnicode:
+    """Character-code to text mapping parsed from a ToUnicode CMap"""
+
+    def __init__(self, cmap: bytes):
+        self.mapping: Dict[bytes, str] = {}
+        self.code_lengths = set()
+        for block in re.findall(rb'begincodespacerange(.*?)endcodespacerange', cmap, re.S):
+            for low in re.findall(rb'<([0-9A-Fa-f]+)>\s*<[0-9A-Fa-f]+>', block):
+                self.code_lengths.add(len(low) // 2)
+        for block in re.findall(rb'beginbfchar(.*?)endbfchar', cmap, re.S):
+            for src, dst in re.findall(rb'<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]*)>', block):
+                self._add(bytes.fromhex(src.decode()), bytes.fromhex(dst.decode()))
+        for block in re.findall(rb'beginbfrange(.*?)endbfrange', cmap, re.S):
+            for lo, hi, dst in re.findall(rb'<([0-9A-Fa-f]+)>\s*<([0-9A-Fa-f]+)>\s*(<[0-9A-Fa-f]*>|\[[^\]]*\])', block):
+                lo_b = bytes.fromhex(lo.decode())
+                lo_i, hi_i, width = int(lo, 16), int(hi, 16), len(lo_b)
+                if dst.startswith(b'['):
+                    targets = [bytes.fromhex(t.decode()) for t in re.findall(rb'<([0-9A-Fa-f]*)>', dst)]
+                    for offset, target in enumerate(targets[:hi_i - lo_i + 1]):
+                        self._add((lo_i + offset).to_bytes(width, 'big'), target)
+                else:
+                    base = bytes.fromhex(dst[1:-1].decode())
+                    base_i = int.from_bytes(base, 'big') if base else 0
+                    for offset in range(min(hi_i - lo_i, 0xFFFF) + 1):
+                        self._add((lo_i + offset).to_bytes(width, 'big'),
+                                  (base_i + offset).to_bytes(max(len(base), 2), 'big'))
+        if not self.code_lengths:
+            self.code_lengths = {len(k) for k in self.mapping} or {1}
+
+    def _add(self, code: bytes, utf16: bytes):
+        self.mapping[code] = utf16.decode('utf-16-be', errors='ignore')
+        self.code_lengths.add(len(code))
+
+    def decode(self, data: bytes) -> str:
+        out = []
+        lengths = sorted(self.code_lengths, reverse=True)
+        i = 0
+        while i < len(data):
+            for length in lengths:
+                text = self.mapping.get(data[i:i + length])
+                if text is not None:
+                    out.append(text)
+                    i += length
+                    break
+            else:
+                i += min(lengths)
+        return ''.join(out)
+
+
+class PdfDocument:
+    """Lazily parsed PDF: objects are located up front but parsed on demand"""
+
+    def __init__(self, data: bytes):
+        if not data.lstrip()[:5].startswith(b'%PDF'):
+            raise PdfError("Not a PDF file (missing %PDF header)")
+        self.data = data
+        self._offsets: Dict[int, int] = {}
+        for match in _OBJ_HEADER.finditer(data):
+            # Later definitions win, matching incremental-update semantics
+            self._offsets[int(match.group(1))] = match.end()
+        self._objects: Dict[int, object] = {}
+        self._object_streams_loaded = set()
+        self._cmaps: Dict[int, Optional[_ToUnicode]] = {}
+        if re.search(rb'/Encrypt\s', data[-4096:]) or re.search(rb'trailer\s*<<[^>]*/Encrypt', data):
+            raise PdfError("Encrypted PDFs are not supported")
+
+    @classmethod
+    def open(cls, file_path: str) -> 'PdfDocument':
+        with open(file_path, 'rb') as f:
+            return cls(f.read())
+
+    # --- object access -------------------------------------------------
+
+    def get(self, num: int):
+        """Return the parsed object with the given number"""
+        if num in self._objects:
+            return self._objects[num]
+        offset = self._offsets.get(num)
+        if offset is None:
+            self._load_from_object_streams(num)
+            return self._objects.get(num)
+        lexer = _Lexer(self.data, offset)
+        obj = lexer.next_object()
+        if isinstance(obj, dict):
+            obj = self._maybe_stream(obj, lexer)
+        self._objects[num] = obj
+        return obj
+
+    def resolve(self, obj):
+        """Follow indirect references until a direct object is reached"""
+        seen = 0
+        while isinstance(obj, Ref) and seen < 32:
+            obj = self.get(obj[0])
+            seen += 1
+        return obj
+
+    def _maybe_stream(self, attrs: Dict, lexer: _Lexer):
+        match = _STREAM_START.match(self.data, lexer.pos)
+        if not match:
+            return attrs
+        start = match.end()
+        length = self.resolve(attrs.get('Length'))
+        end = start + length if isinstance(length, int) else -1
+        if end < 0 or self.data[end:end + 30].lstrip()[:9] != b'endstream':
+            end = self.data.find(b'endstream', start)
+            end = len(self.data) if end < 0 else end
+            while end > start and self.data[end - 1] in b'\r\n':
+                end -= 1
+        return Stream(attrs, self.data[start:end])
+
+    def _load_from_object_streams(self, wanted: int):
+        """Parse compressed object streams (PDF 1.5+) until the wanted object is found"""
+        for num in list(self._offsets):
+            if num in self._object_streams_loaded or wanted in self._objects:
+                continue
+            self._object_streams_loaded.add(num)
+            obj = self.get(num)
+            if not isinstance(obj, Stream) or obj.attrs.get('Type') != 'ObjStm':
+                continue
+            data = self.stream_data(obj)
+            count = self.resolve(obj.attrs.get('N')) or 0
+            first = self.resolve(obj.attrs.get('First')) or 0
+            header = _Lexer(data)
+            pairs = [(header.next_object(), header.next_object()) for _ in range(count)]
+            for obj_num, rel in pairs:
+                if isinstance(obj_num, int) and isinstance(rel, int) and obj_num not in self._objects:
+                    self._objects[obj_num] = _Lexer(data, first + rel).next_object()
+
+    def stream_data(self, stream: Stream) -> bytes:
+        """Decode a stream's filters (FlateDecode via zlib); unsupported filters yield b''"""
+        filters = self.resolve(stream.attrs.get('Filter'))
+        if filters is None:
+            return stream.raw
+        if not isinstance(filters, list):
+            filters = [filters]
+        data = stream.raw
+        for name in filters:
+            name = self.resolve(name)
+            if name in ('FlateDecode', 'Fl'):
+                try:
+                    data = zlib.decompress(data)
+                except zlib.error:
+                    # Tolerate truncated streams / trailing garbage
+                    data = zlib.decompressobj().decompress(data)
+            else:
+                return b''
+        return data
+
+    # --- pages ---------------------------------------------------------
+
+    def iter_pages(self) -> Iterator[Dict]:
+        """Yield page dictionaries in document order, each with inherited /Resources"""
+        root = None
+        trailer = self.data.rfind(b'trailer')
+        if trailer >= 0:
+            trailer_dict = _Lexer(self.data, trailer + 7).next_object()
+            if isinstance(trailer_dict, dict):
+                root = self.resolve(trailer_dict.get('Root'))
+        if root is None:
+            # Cross-reference streams keep the trailer inside an XRef stream object
+            for num in self._offsets:
+                obj = self.get(num)
+                attrs = obj.attrs if isinstance(obj, Stream) else obj
+                if isinstance(attrs, dict) and attrs.get('Type') == 'XRef' and 'Root' in attrs:
+                    root = self.resolve(attrs['Root'])
+                    break
+                if isinstance(attrs, dict) and attrs.get('Type') == 'Catalog':
+                    root = attrs
+                    break
+
+        pages_root = self.resolve(root.get('Pages')) if isinstance(root, dict) else None
+        if isinstance(pages_root, dict):
+            yield from self._walk_pages(pages_root, None, set())
+            return
+
+        # No usable catalog - fall back to every /Type /Page object in file order
+        for num in sorted(self._offsets, key=self._offsets.get):
+            obj = self.get(num)
+            if isinstance(obj, dict) and obj.get('Type') == 'Page':
+                yield obj
+
+    def _walk_pages(self, node: Dict, inherited_resources, seen) -> Iterator[Dict]:
+        resources = node.get('Resources', inherited_resources)
+        if node.get('Type') == 'Page' or 'Kids' not in node:
+            page = dict(node)
+            page.setdefault('Resources', resources)
+            yield page
+            return
+        for kid in self.resolve(node.get('Kids')) or []:
+            if isinstance(kid, Ref):
+                if kid in seen:
+                    continue
+                seen.add(kid)
+            kid = self.resolve(kid)
+            if isinstance(kid, dict):
+                yield from self._walk_pages(kid, resources, seen)
+
+    def page_text(self, page: Dict) -> str:
+        """Extract text from a single page's content streams"""
+        contents = self.resolve(page.get('Contents'))
+        if contents is None:
+            return ''
+        if not isinstance(contents, list):
+            contents = [contents]
+        data = b'\n'.join(self.stream_data(s) for s in (self.resolve(c) for c in contents) if isinstance(s, Stream))
+        fonts = self.resolve((self.resolve(page.get('Resources')) or {}).get('Font')) or {}
+        return self._content_text(data, fonts)
+
+    def _font_decoder(self, font_ref):
+        key = font_ref[0] if isinstance(font_ref, Ref) else id(font_ref)
+        if key not in self._cmaps:
+            font = self.resolve(font_ref)
+            cmap = self.resolve(font.get('ToUnicode')) if isinstance(font, dict) else None
+            self._cmaps[key] = _ToUnicode(self.stream_data(cmap)) if isinstance(cmap, Stream) else None
+        return self._cmaps[key]
+
+    def _content_text(self, data: bytes, fonts: Dict) -> str:
+        lexer = _Lexer(data)
+        lines: List[str] = []
+        current: List[str] = []
+        operands: List = []
+        decoder = None
+        last_y = None
+
+        def decode(value: bytes) -> str:
+            if decoder is not None:
+                return decoder.decode(value)
+            return value.decode('cp1252', errors='replace')
+
+        def new_line():
+            lines.append(''.join(current))
+            current.clear()
+
+        while True:
+            obj = lexer.next_object()
+            if obj is None and lexer.pos >= len(data):
+                break
+            if not isinstance(obj, _Operator):
+                operands.append(obj)
+                continue
+            op = bytes(obj)
+            if op == b'Tf' and len(operands) >= 2:
+                font_ref = fonts.get(operands[-2]) if isinstance(fonts, dict) else None
+                decoder = self._font_decoder(font_ref) if font_ref is not None else None
+            elif op == b'Tj' and operands and isinstance(operands[-1], bytes):
+                current.append(decode(operands[-1]))
+            elif op == b'TJ' and operands and isinstance(operands[-1], list):
+                for item in operands[-1]:
+                    if isinstance(item, bytes):
+                        current.append(decode(item))
+                    elif isinstance(item, (int, float)) and item < -200:
+                        current.append(' ')
+            elif op in (b"'", b'"') and operands and isinstance(operands[-1], bytes):
+                new_line()
+                current.append(decode(operands[-1]))
+            elif op == b'T*':
+                new_line()
+            elif op in (b'Td', b'TD') and len(operands) >= 2:
+                if isinstance(operands[-1], (int, float)) and abs(operands[-1]) > 0.5:
+                    new_line()
+                elif current and not current[-1].endswith(' '):
+                    current.append(' ')
+            elif op == b'Tm' and len(operands) >= 6:
+                y = operands[-1]
+                if last_y is not None and isinstance(y, (int, float)) and abs(y - last_y) > 0.5:
+                    new_line()
+                last_y = y
+            elif op == b'ET':
+                if current:
+                    new_line()
+            elif op == b'BI':
+                # Skip inline image data
+                end = data.find(b'EI', lexer.pos)
+                lexer.pos = len(data) if end < 0 else end + 2
+            operands.clear()
+
+        if current:
+            new_line()
+        return '\n'.join(line.rstrip() for line in lines if line.strip())
+
+
+def iter_pdf_pages(file_path: str, max_pages: Optional[int] = DEFAULT_MAX_PAGES) -> Iterator[str]:
+    """Lazily yield the text of each page, stopping after max_pages"""
+    doc = PdfDocument.open(file_path)
+    for index, page in enumerate(doc.iter_pages()):
+        if max_pages is not None and index >= max_pages:
+            return
+        yield doc.page_text(page)
+
+
+def extract_text_from_pdf(file_path: str, max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+                          enough_chars: Optional[int] = None) -> str:
+    """
+    Extract text from a PDF page by page.
+
+    Stops after max_pages pages, or earlier once at least enough_chars
+    characters have been collected (useful when only a preview is needed).
+    """
+    pages = []
+    total = 0
+    for text in iter_pdf_pages(file_path, max_pages):
+        if text:
+            pages.append(text)
+            total += len(text)
+        if enough_chars is not None and total >= enough_chars:
+            break
+    return '\n'.join(pages)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python pdf_text_extractor.py <file.pdf> [max_pages]")
+        sys.exit(1)
+    print(extract_text_from_pdf(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_MAX_PAGES))
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+DOCX Render Cache - Reuse rendered resumes whose render inputs have not changed
+
+DOCX output is deterministic (fixed zip and core-property timestamps, stable
+relationship ids), so a render is fully described by its inputs: the blocks,
+the standard header, the backend, the renderer version and the template. render_key() hashes those
+inputs. save_resume_docx() writes the key to a ".render-hash" sidecar next to
+every DOCX and stores the bytes in this cache under the key; a later render
+with the same key is skipped when the target is already up to date, or
+copied from the cache instead of being rendered again. Delivered resumes are
+copies, never hard links: users edit them, and an editor saving in place
+would otherwise write into the shared cache entry.
+
+The standard-format resume depends only on the career field, so every posting
+for the same field (whatever the company) shares one cached render.
+"""
+
+import hashlib
+import os
+import shutil
+from typing import Optional
+
+from ooxml_writer import RENDERER_VERSION, load_template
+
+DEFAULT_RENDER_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.resume_optimizer', 'render_cache')
+
+RENDER_HASH_SUFFIX = '.render-hash'
+
+
+def template_fingerprint() -> str:
+    """Fingerprint of the base template, or '' if it cannot be loaded"""
+    try:
+        return load_template().fingerprint
+    except (OSError, ValueError, KeyError):
+        return ''
+
+
+def render_key(blocks: list, with_standard_header: bool, backend: str, header_blocks: list = ()) -> str:
+    """SHA-256 of everything that determines a rendered DOCX's bytes
+
+    header_blocks is the standard header rendered when with_standard_header is
+    set; its content is hashed so editing the header invalidates old renders.
+    """
+    header = repr(list(header_blocks)) if with_standard_header else ''
+    digest = hashlib.sha256()
+    for part in (RENDERER_VERSION, backend, template_fingerprint(), repr(with_standard_header), header,
+                 repr(list(blocks))):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def read_render_hash(docx_path: str) -> Optional[str]:
+    """Render key recorded next to a DOCX, or None"""
+    try:
+        with open(docx_path + RENDER_HASH_SUFFIX, 'r', encoding='utf-8') as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def write_bytes_atomic(path: str, data: bytes):
+    """Replace path with data via a temporary file, so readers never see a partial file"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        _remove_quietly(tmp_path)
+        raise
+
+
+def copy_file_atomic(source: str, target: str):
+    """Replace target with a private copy of source via a temporary file"""
+    tmp_path = f"{target}.{os.getpid()}.tmp"
+    try:
+        shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, target)
+    except OSError:
+        _remove_quietly(tmp_path)
+        raise
+
+
+def write_render_hash(docx_path: str, key: str):
+    with open(docx_path + RENDER_HASH_SUFFIX, 'w', encoding='utf-8') as f:
+        f.write(key + '\n')
+
+
+class RenderCache:
+    """Directory of rendered DOCX files named by render key (sharded by the first two hex digits)"""
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = root or os.environ.get('RESUME_RENDER_CACHE') or DEFAULT_RENDER_CACHE_DIR
+        self.hits = 0
+        self.misses = 0
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key + '.docx')
+
+    def read(self, key: str) -> Optional[bytes]:
+        """Cached render bytes for key, or None"""
+        try:
+            with open(self.path_for(key), 'rb') as f:
+                data = f.read()
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def store(self, key: str, data: bytes):
+        """Add a render to the cache; failures only cost a future re-render"""
+        path = self.path_for(key)
+        if os.path.exists(path):
+            return
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_bytes_atomic(path, data)
+        except OSError as e:
+            print(f"WARNING: Could not store render in cache {self.root}: {e}")
+
+    def copy_into(self, key: str, target: str) -> bool:
+        """Place a copy of the cached render for key at target"""
+        path = self.path_for(key)
+        if not os.path.exists(path):
+            self.misses += 1
+            return False
+        try:
+            copy_file_atomic(path, target)
+        except OSError as e:
+            print(f"WARNING: Could not reuse cached render for {os.path.basename(target)}: {e}")
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+
+def _remove_quietly(path: str):
+    """Remove a file if it exists"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Result Bundles - One zip archive per optimization run instead of a folder of files
+
+With --bundle, save_results_to_files() collects every artifact of a run (the
+report .txt files, extra formats and the DOCX resumes) in memory and writes a
+single <output>.zip with one sequential write, plus a manifest.json listing
+each member's size, SHA-256 and the results key it came from. On network
+shares this replaces about a dozen small-file creates with one.
+
+ResultBundle reads a bundle lazily: opening it reads only the zip directory,
+and each member is decompressed when it is asked for.
+
+    with ResultBundle('resume_optimization_output_20240101_120000.zip') as bundle:
+        print(bundle.names())
+        resume = bundle.read_text('narrative_story_resume.txt')
+"""
+
+import hashlib
+import io
+import json
+import os
+import zipfile
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from render_cache import write_bytes_atomic
+
+BUNDLE_SUFFIX = '.zip'
+MANIFEST_NAME = 'manifest.json'
+BUNDLE_FORMAT_VERSION = 1
+
+# Already-compressed members are stored as-is
+STORED_EXTENSIONS = ('.docx', '.zip', '.png', '.jpg', '.jpeg', '.pdf')
+
+
+class ResultBundleWriter:
+    """Collects run artifacts in memory and writes them as one zip"""
+
+    def __init__(self):
+        self._members: Dict[str, bytes] = {}
+        self._entries: Dict[str, Dict] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._members
+
+    def add(self, name: str, data: bytes, **metadata):
+        """Add (or replace) a member; metadata is recorded in its manifest entry"""
+        if name == MANIFEST_NAME:
+            raise ValueError(f"{MANIFEST_NAME} is reserved for the bundle manifest")
+        self._members[name] = data
+        self._entries[name] = dict({'name': name, 'size': len(data),
+                                    'sha256': hashlib.sha256(data).hexdigest()}, **metadata)
+
+    def add_text(self, name: str, text: str, **metadata):
+        self.add(name, text.encode('utf-8'), **metadata)
+
+    def members(self) -> List[Tuple[str, bytes]]:
+        """(name, data) pairs in the order they were added"""
+        return list(self._members.items())
+
+    def manifest(self) -> Dict:
+        return {'format': BUNDLE_FORMAT_VERSION,
+                'created': datetime.now().isoformat(timespec='seconds'),
+                'files': [self._entries[name] for name in self._members]}
+
+    def to_bytes(self) -> bytes:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as package:
+            # Manifest first, so readers that stream the archive see it before the members
+            package.writestr(MANIFEST_NAME, json.dumps(self.manifest(), indent=2, ensure_ascii=False))
+            for name, data in self._members.items():
+                compression = zipfile.ZIP_STORED if name.lower().endswith(STORED_EXTENSIONS) else zipfile.ZIP_DEFLATED
+                package.writestr(name, data, compress_type=compression)
+        return buffer.getvalue()
+
+    def write(self, path: str) -> str:
+        """Write the bundle to path in one write (via a temporary file and rename)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        write_bytes_atomic(path, self.to_bytes())
+        return path
+
+
+class ResultBundle:
+    """Lazy reader for a result bundle"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._manifest: Optional[Dict] = None
+
+    def _archive(self) -> zipfile.ZipFile:
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(self.path)
+        return self._zip
+
+    @property
+    def manifest(self) -> Dict:
+        """The bundle manifest, read on first access"""
+        if self._manifest is None:
+            self._manifest = json.loads(self._archive().read(MANIFEST_NAME).decode('utf-8'))
+        return self._manifest
+
+    def names(self) -> List[str]:
+        """Member names in the order they were added (manifest excluded)"""
+        return [entry['name'] for entry in self.manifest['files']]
+
+    def __contains__(self, name: str) -> bool:
+        return any(entry['name'] == name for entry in self.manifest['files'])
+
+    def entry(self, name: str) -> Dict:
+        for entry in self.manifest['files']:
+            if entry['name'] == name:
+                return entry
+        raise KeyError(f"{name} is not in bundle {self.path}")
+
+    def open(self, name: str):
+        """Binary stream over one member, decompressed as it is read"""
+        self.entry(name)
+        return self._archive().open(name)
+
+    def read_bytes(self, name: str, verify: bool = True) -> bytes:
+        """Load one member, checking it against the manifest's SHA-256"""
+        entry = self.entry(name)
+        data = self._archive().read(name)
+        if verify and hashlib.sha256(data).hexdigest() != entry['sha256']:
+            raise ValueError(f"{name} in {self.path} does not match its manifest checksum")
+        return data
+
+    def read_text(self, name: str) -> str:
+        return self.read_bytes(name).decode('utf-8')
+
+    def extract(self, name: str, directory: str) -> str:
+        """Write one member into a directory and return its path"""
+        target = os.path.join(directory, os.path.basename(name))
+        os.makedirs(directory, exist_ok=True)
+        write_bytes_atomic(target, self.read_bytes(name))
+        return target
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def is_result_bundle(path: str) -> bool:
+    """True for a zip file that carries a result bundle manifest"""
+    if not path.lower().endswith(BUNDLE_SUFFIX) or not zipfile.is_zipfile(path):
+        return False
+    with zipfile.ZipFile(path) as package:
+        return MANIFEST_NAME in package.namelist()
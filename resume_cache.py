@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Resume Parse Cache - Persistent cache of parsed resume files
+
+The same candidate resume is read and parsed again for every job posting it is
+optimized against. This cache stores the extracted text and the
+extract_resume_information() result keyed by the file's SHA-256 content hash
+plus PARSER_VERSION, so a resume is parsed once no matter how many postings it
+is run against.
+
+A file-stat fast path (path + mtime + size) skips hashing entirely when the
+file hasn't changed since it was last seen.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from typing import Callable, Dict, Optional, Tuple
+
+# Bump whenever text extraction or extract_resume_information() changes output
+PARSER_VERSION = "6"
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.resume_optimizer', 'parse_cache.sqlite3')
+
+
+def hash_file(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Return the SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResumeParseCache:
+    """SQLite-backed cache from (content hash, parser version) to (text, resume info)"""
+
+    def __init__(self, db_path: Optional[str] = None, parser_version: str = PARSER_VERSION):
+        self.db_path = db_path or os.environ.get('RESUME_PARSE_CACHE') or DEFAULT_CACHE_PATH
+        self.parser_version = parser_version
+        self.hits = 0
+        self.misses = 0
+        self._conn = None
+        self._disabled = False
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the cache database on first use; disable caching if it can't be opened"""
+        if self._conn is not None or self._disabled:
+            return self._conn
+        try:
+            cache_dir = os.path.dirname(self.db_path)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            conn.execute("""CREATE TABLE IF NOT EXISTS file_stats (
+                                path TEXT PRIMARY KEY,
+                                mtime_ns INTEGER NOT NULL,
+                                size INTEGER NOT NULL,
+                                content_hash TEXT NOT NULL)""")
+            conn.execute("""CREATE TABLE IF NOT EXISTS parses (
+                                content_hash TEXT NOT NULL,
+                                parser_version TEXT NOT NULL,
+                                text TEXT NOT NULL,
+                                info_json TEXT NOT NULL,
+                                PRIMARY KEY (content_hash, parser_version))""")
+            conn.commit()
+            self._conn = conn
+        except (sqlite3.Error, OSError) as e:
+            print(f"WARNING: Resume parse cache disabled ({self.db_path}): {e}")
+            self._disabled = True
+        return self._conn
+
+    def content_hash(self, file_path: str) -> str:
+        """Hash a file, reusing the stored hash when its mtime and size are unchanged"""
+        path = os.path.abspath(file_path)
+        st = os.stat(path)
+        conn = self._connect()
+
+        if conn is not None:
+            row = conn.execute(
+                "SELECT content_hash FROM file_stats WHERE path = ? AND mtime_ns = ? AND size = ?",
+                (path, st.st_mtime_ns, st.st_size)).fetchone()
+            if row:
+                return row[0]
+
+        digest = hash_file(path)
+        if conn is not None:
+            try:
+                conn.execute("INSERT OR REPLACE INTO file_stats VALUES (?, ?, ?, ?)",
+                             (path, st.st_mtime_ns, st.st_size, digest))
+                conn.commit()
+            except sqlite3.Error as e:
+                print(f"WARNING: Could not update resume parse cache: {e}")
+        return digest
+
+    def get(self, content_hash: str) -> Optional[Tuple[str, Dict]]:
+        """Return cached (text, resume info) for a content hash, or None"""
+        conn = self._connect()
+        if conn is None:
+            return None
+        row = conn.execute(
+            "SELECT text, info_json FROM parses WHERE content_hash = ? AND parser_version = ?",
+            (content_hash, self.parser_version)).fetchone()
+        if not row:
+            return None
+        return row[0], json.loads(row[1])
+
+    def put(self, content_hash: str, text: str, info: Dict):
+        """Store parsed text and resume info for a content hash"""
+        conn = self._connect()
+        if conn is None:
+            return
+        try:
+            conn.execute("INSERT OR REPLACE INTO parses VALUES (?, ?, ?, ?)",
+                         (content_hash, self.parser_version, text, json.dumps(info)))
+            conn.commit()
+        except sqlite3.Error as e:
+            print(f"WARNING: Could not update resume parse cache: {e}")
+
+    def load(self, file_path: str, read_text: Callable[[str], str],
+             extract_info: Callable[[str], Dict]) -> Tuple[str, Dict]:
+        """Return (text, resume info) for a file, parsing it only on a cache miss"""
+        digest = self.content_hash(file_path)
+        cached = self.get(digest)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        text = read_text(file_path)
+        info = extract_info(text)
+        self.put(digest, text, info)
+        return text, info
+
+    def close(self):
+        """Close the underlying database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
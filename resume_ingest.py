@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Bulk Resume Ingestion - Parse a directory of resumes into JSON lines
+
+Usage:
+    python resume_windows.py ingest DIR --out resumes.jsonl [--jobs N]
+
+Walks DIR for .docx, .pdf and .txt resumes, extracts text and resume
+information in a process pool (files are submitted in chunks), and streams one
+JSON object per resume to the output file in completion order. Each record carries an
+"error" field that is null on success. If a worker process is killed, the
+chunks it had in flight are recorded as failed and the pool is restarted. Already-parsed files are served from
+the resume parse cache without touching the pool.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from resume_cache import ResumeParseCache
+from resume_windows import ResumeOptimizer, read_document_text
+from run_index import RunIndex
+
+RESUME_EXTENSIONS = ('.docx', '.pdf', '.txt')
+
+# Per-worker optimizer, created once by _init_worker
+_WORKER_OPTIMIZER = None
+
+
+def iter_resume_files(directory: str) -> Iterator[str]:
+    """Yield resume files under a directory in a stable order"""
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if name.lower().endswith(RESUME_EXTENSIONS) and not name.startswith('~$'):
+                yield os.path.join(root, name)
+
+
+def _init_worker():
+    """Create one quiet ResumeOptimizer per worker process"""
+    global _WORKER_OPTIMIZER
+    with contextlib.redirect_stdout(io.StringIO()):
+        _WORKER_OPTIMIZER = ResumeOptimizer()
+
+
+def _parse_chunk(chunk: List[Tuple[str, Optional[str]]]) -> List[Dict]:
+    """Parse a chunk of (path, content hash) pairs into ingestion records"""
+    if _WORKER_OPTIMIZER is None:
+        _init_worker()
+
+    records = []
+    for path, content_hash in chunk:
+        record = {'path': path, 'content_hash': content_hash, 'text': None, 'info': None, 'error': None}
+        try:
+            text = read_document_text(path)
+            record['text'] = text
+            record['info'] = _WORKER_OPTIMIZER._extract_resume_information_uncached(text)
+        except Exception as e:
+            record['error'] = f"{type(e).__name__}: {e}"
+        records.append(record)
+    return records
+
+
+def _failed_records(chunk: List[Tuple[str, Optional[str]]], error: str) -> List[Dict]:
+    """Error records for a chunk whose worker never returned"""
+    return [{'path': path, 'content_hash': content_hash, 'text': None, 'info': None, 'error': error}
+            for path, content_hash in chunk]
+
+
+def _new_pool(workers: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+
+def ingest_directory(directory: str, out_path: str, workers: Optional[int] = None,
+                     chunk_size: int = 32, cache: Optional[ResumeParseCache] = None,
+                     show_progress: bool = True) -> Dict[str, int]:
+    """Parse every resume under a directory and write JSON lines to out_path"""
+    paths = list(iter_resume_files(directory))
+    total = len(paths)
+    workers = workers or os.cpu_count() or 1
+    counts = {'total': total, 'parsed': 0, 'cached': 0, 'errors': 0}
+
+    def report(done):
+        if show_progress:
+            print(f"\r>>> Ingested {done}/{total} resumes ({counts['errors']} errors)",
+                  end='', file=sys.stderr, flush=True)
+
+    with open(out_path, 'w', encoding='utf-8') as out:
+        def emit(record):
+            out.write(json.dumps(record, ensure_ascii=False) + '\n')
+            if record['error']:
+                counts['errors'] += 1
+
+        # Serve cache hits directly, collect misses for the pool
+        pending = []
+        for path in paths:
+            content_hash = None
+            if cache is not None:
+                try:
+                    content_hash = cache.content_hash(path)
+                    cached = cache.get(content_hash)
+                except OSError:
+                    cached = None
+                if cached is not None:
+                    text, info = cached
+                    emit({'path': path, 'content_hash': content_hash, 'text': text, 'info': info, 'error': None})
+                    counts['cached'] += 1
+                    continue
+            pending.append((path, content_hash))
+        done = counts['cached']
+        report(done)
+
+        chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+        max_in_flight = workers * 2
+
+        def collect(future, chunk):
+            """Emit a finished chunk's records; returns True if its worker died"""
+            nonlocal done
+            try:
+                records, broken = future.result(), False
+            except BrokenProcessPool as e:
+                # Killed worker (SIGALRM, OOM killer, ...): fail the chunk, keep the run going
+                records, broken = _failed_records(chunk, f"BrokenProcessPool: {e}"), True
+            for record in records:
+                emit(record)
+                if not record['error']:
+                    counts['parsed'] += 1
+                    if cache is not None and record['content_hash']:
+                        cache.put(record['content_hash'], record['text'], record['info'])
+                done += 1
+            report(done)
+            return broken
+
+        pool = _new_pool(workers)
+        try:
+            chunk_iter = iter(chunks)
+            in_flight = {}
+            while True:
+                # Keep a bounded number of chunks queued so memory stays flat
+                while len(in_flight) < max_in_flight:
+                    chunk = next(chunk_iter, None)
+                    if chunk is None:
+                        break
+                    in_flight[pool.submit(_parse_chunk, chunk)] = chunk
+                if not in_flight:
+                    break
+
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                broken = False
+                for future in finished:
+                    broken = collect(future, in_flight.pop(future)) or broken
+                if broken:
+                    # Every other chunk in flight went down with the pool
+                    wait(in_flight)
+                    for future, chunk in in_flight.items():
+                        collect(future, chunk)
+                    in_flight = {}
+                    pool.shutdown(wait=True)
+                    print("\nWARNING: A worker process died; its chunks were marked as failed, restarting the pool",
+                          file=sys.stderr)
+                    pool = _new_pool(workers)
+        finally:
+            pool.shutdown(wait=True)
+
+    if show_progress:
+        print(file=sys.stderr)
+    return counts
+
+
+def run_ingest_command(argv: List[str]):
+    """Entry point for `resume_windows.py ingest`"""
+    parser = argparse.ArgumentParser(prog='resume_windows.py ingest',
+                                     description='Bulk-parse a directory of .docx/.pdf/.txt resumes into JSON lines')
+    parser.add_argument('directory', help='Directory containing resume files')
+    parser.add_argument('--out', '-o', default='resumes.jsonl',
+                        help='Output JSON lines file')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help='Number of worker processes (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=32,
+                        help='Resumes per worker task')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Do not read or update the resume parse cache')
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.directory):
+        print(f"ERROR: Not a directory: {args.directory}")
+        return 1
+
+    cache = None if args.no_cache else ResumeParseCache()
+    print(f">>> Ingesting resumes from: {args.directory}")
+    counts = ingest_directory(args.directory, args.out, args.jobs, args.chunk_size, cache)
+    if cache is not None:
+        cache.close()
+
+    print(f">>> Ingestion complete: {counts['total']} files "
+          f"({counts['parsed']} parsed, {counts['cached']} from cache, {counts['errors']} errors)")
+    print(f"    Results written to: {args.out}")
+    try:
+        RunIndex().append(args.out, 'ingest', source=os.path.abspath(args.directory),
+                          total=counts['total'], errors=counts['errors'])
+    except OSError as e:
+        print(f"WARNING: Could not record run in the run index: {e}")
+    # Non-zero when any resume failed, so scripts can tell (the records say which)
+    return 1 if counts['errors'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_ingest_command(sys.argv[1:]))
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Resume IR - Format-agnostic resume structure with text, Markdown, HTML and DOCX renderers
+
+The resume generators in resume_windows.py build a ResumeDocument (a header
+plus a list of sections holding paragraphs, bullet lists and links) instead of
+an f-string. Each renderer walks that tree once:
+
+    render_text(doc)         plain text, identical to the historical .txt output
+    render_markdown(doc)     GitHub-flavoured Markdown
+    render_html(doc)         standalone HTML page
+    render_docx_blocks(doc)  DocxParagraph blocks for ooxml_writer / python-docx
+
+Section.role tags what a section holds ('contact', 'summary', 'skills', ...), so
+later steps such as the combined resume can pick sections directly instead of
+re-parsing rendered text.
+"""
+
+import html
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional, Union
+
+from ooxml_writer import DocxParagraph, DocxRun
+
+URL_PATTERN = re.compile(r'https?://[^\s|]+')
+
+# Generator text blocks that start with their own heading, e.g. "FUTURE VISION:\n..."
+_HEADING_LINE = re.compile(r'^([A-Z0-9][A-Z0-9 &/\-]*):$')
+
+
+@dataclass
+class Link:
+    """A hyperlink; rendered as its URL in plain text"""
+    url: str
+    text: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        return self.text or self.url
+
+
+@dataclass
+class Paragraph:
+    """A run of text and links; text may span several lines"""
+    parts: List[Union[str, Link]]
+
+    @property
+    def text(self) -> str:
+        return ''.join(part.label if isinstance(part, Link) else part for part in self.parts)
+
+
+@dataclass
+class BulletList:
+    """A bulleted list of plain-text items"""
+    items: List[str]
+    marker: str = '•'
+
+
+Block = Union[Paragraph, BulletList]
+
+
+@dataclass
+class Section:
+    """A titled (or untitled) section; spaced adds a blank line after the heading in text output"""
+    heading: Optional[str]
+    blocks: List[Block] = field(default_factory=list)
+    role: str = ''
+    spaced: bool = False
+
+    def bullets(self) -> List[str]:
+        return [item for block in self.blocks if isinstance(block, BulletList) for item in block.items]
+
+    def plain_text(self) -> str:
+        """Paragraph text with lines joined by single spaces"""
+        lines = [line.strip() for block in self.blocks if isinstance(block, Paragraph)
+                 for line in block.text.split('\n')]
+        return ' '.join(line for line in lines if line)
+
+
+@dataclass
+class ResumeDocument:
+    """A complete resume: optional banner title and hook, name/headline header and sections"""
+    kind: str
+    name: str
+    headline: str
+    sections: List[Section] = field(default_factory=list)
+    title: Optional[str] = None
+    hook: Optional[str] = None
+
+    def section(self, role: str) -> Optional[Section]:
+        for section in self.sections:
+            if section.role == role:
+                return section
+        return None
+
+
+def paragraph_with_links(text: str) -> Paragraph:
+    """Build a Paragraph from text, turning bare URLs into Links"""
+    parts, position = [], 0
+    for match in URL_PATTERN.finditer(text):
+        if match.start() > position:
+            parts.append(text[position:match.start()])
+        parts.append(Link(match.group(0)))
+        position = match.end()
+    if position < len(text) or not parts:
+        parts.append(text[position:])
+    return Paragraph(parts)
+
+
+def lines_with_links(text: str) -> List[Paragraph]:
+    """One Paragraph per line of text, with URLs as Links"""
+    return [paragraph_with_links(line) for line in text.split('\n')]
+
+
+def section_from_text(text: str, role: str = '') -> Section:
+    """Wrap a generator text block, lifting a leading "HEADING:" line into the section heading"""
+    first_line, _, rest = text.partition('\n')
+    match = _HEADING_LINE.match(first_line)
+    if match and rest:
+        return Section(match.group(1), [Paragraph([rest])], role)
+    return Section(None, [Paragraph([text])], role)
+
+
+# --- Plain text ---------------------------------------------------------------
+
+def _block_text(block: Block) -> str:
+    if isinstance(block, BulletList):
+        return '\n'.join(f"{block.marker} {item}" for item in block.items)
+    return block.text
+
+
+def _section_text(section: Section) -> str:
+    body = '\n'.join(_block_text(block) for block in section.blocks)
+    if section.heading is None:
+        return body
+    return f"{section.heading}:" + ('\n\n' if section.spaced else '\n') + body
+
+
+def render_text(doc: ResumeDocument) -> str:
+    """Render the resume as plain text (sections separated by blank lines)"""
+    chunks = []
+    if doc.title is not None:
+        chunks.append(doc.title)
+    if doc.hook is not None:
+        chunks.append(doc.hook)
+    chunks.append(f"{doc.name}\n{doc.headline}")
+    chunks.extend(_section_text(section) for section in doc.sections)
+    return '\n\n'.join(chunks)
+
+
+# --- Markdown -----------------------------------------------------------------
+
+def _display_heading(heading: str) -> str:
+    return heading.title().replace("'S ", "'s ")
+
+
+def _markdown_inline(part: Union[str, Link]) -> str:
+    if isinstance(part, Link):
+        return f"<{part.url}>" if part.text is None else f"[{part.text}]({part.url})"
+    return part
+
+
+def _markdown_lines(paragraph: Paragraph) -> List[str]:
+    """Markdown lines for a paragraph; '•' lines inside text become list items"""
+    text = ''.join(_markdown_inline(part) for part in paragraph.parts)
+    lines = []
+    for line in text.split('\n'):
+        line = line.strip()
+        if line.startswith('• '):
+            lines.append(f"- {line[2:]}")
+        elif line:
+            lines.append(f"{line}  ")
+    return lines
+
+
+def render_markdown(doc: ResumeDocument) -> str:
+    """Render the resume as Markdown"""
+    out = [f"# {doc.name}", "", f"**{doc.headline}**", ""]
+    if doc.hook:
+        out += [f"> {doc.hook}", ""]
+    for section in doc.sections:
+        if section.heading:
+            out += [f"## {_display_heading(section.heading)}", ""]
+        for block in section.blocks:
+            if isinstance(block, BulletList):
+                out += [f"- {item}" for item in block.items]
+            else:
+                out += _markdown_lines(block)
+            out.append("")
+    return '\n'.join(out).rstrip() + '\n'
+
+
+# --- HTML ---------------------------------------------------------------------
+
+def _html_inline(part: Union[str, Link]) -> str:
+    if isinstance(part, Link):
+        return f'<a href="{html.escape(part.url)}">{html.escape(part.label)}</a>'
+    return html.escape(part)
+
+
+def _html_block(block: Block) -> str:
+    if isinstance(block, BulletList):
+        return '<ul>' + ''.join(f"<li>{html.escape(item)}</li>" for item in block.items) + '</ul>'
+    text = ''.join(_html_inline(part) for part in block.parts)
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    return '\n'.join(f"<p>{line}</p>" for line in lines)
+
+
+def render_html(doc: ResumeDocument) -> str:
+    """Render the resume as a standalone HTML page"""
+    body = [f"<h1>{html.escape(doc.name)}</h1>", f'<p class="headline">{html.escape(doc.headline)}</p>']
+    if doc.hook:
+        body.append(f'<blockquote class="hook">{html.escape(doc.hook)}</blockquote>')
+    for section in doc.sections:
+        body.append(f'<section class="{section.role or "section"}">')
+        if section.heading:
+            body.append(f"<h2>{html.escape(_display_heading(section.heading))}</h2>")
+        body.extend(_html_block(block) for block in section.blocks)
+        body.append('</section>')
+    return ('<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+            f"<title>{html.escape(doc.name)} - {html.escape(doc.headline)}</title>\n"
+            '<style>body{font-family:Calibri,Arial,sans-serif;max-width:50em;margin:2em auto}'
+            'h1,.headline,.hook,.contact{text-align:center}</style>\n'
+            '</head>\n<body>\n' + '\n'.join(body) + '\n</body>\n</html>\n')
+
+
+# --- DOCX ---------------------------------------------------------------------
+
+def _docx_paragraphs(paragraph: Paragraph, style: str, align: Optional[str] = None) -> List[DocxParagraph]:
+    """One DOCX paragraph per non-empty line, keeping links clickable"""
+    result, runs = [], []
+
+    def flush():
+        if runs:
+            result.append(DocxParagraph(style, tuple(runs), align))
+            runs.clear()
+
+    for part in paragraph.parts:
+        if isinstance(part, Link):
+            runs.append(DocxRun(part.label, url=part.url))
+            continue
+        for index, line in enumerate(part.split('\n')):
+            if index:
+                flush()
+            if line.strip():
+                runs.append(DocxRun(line.strip() if not runs else line))
+    flush()
+    return result
+
+
+def render_docx_blocks(doc: ResumeDocument) -> List[DocxParagraph]:
+    """Lay the resume out as DocxParagraph blocks in the Ryan Weiler format"""
+    blank = DocxParagraph()
+    blocks = []
+    if doc.hook:
+        blocks += [DocxParagraph('Title', (DocxRun(doc.hook, 16),), 'center'), blank]
+    blocks.append(DocxParagraph('Title', (DocxRun(doc.name, 26),), 'center'))
+    blocks.append(DocxParagraph('ResumeBody', (DocxRun(doc.headline),), 'center'))
+
+    for section in doc.sections:
+        centered = section.role == 'contact'
+        if section.heading and not centered:
+            blocks.append(DocxParagraph('ResumeHeading', (DocxRun(_display_heading(section.heading)),)))
+        for block in section.blocks:
+            if isinstance(block, BulletList):
+                blocks += [DocxParagraph('ResumeBody', (DocxRun(f"{block.marker} {item}"),)) for item in block.items]
+            else:
+                blocks += _docx_paragraphs(block, 'ResumeBody', 'center' if centered else None)
+        blocks.append(blank)
+    return blocks
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Hot-Folder Watch Mode - Optimize job postings as they land in an inbox folder
+
+Usage:
+    python resume_windows.py watch INBOX --resume me.docx [--outbox DIR] [--style 2]
+
+Polls INBOX for .txt, .docx and .pdf job postings using a stat cache (size +
+mtime), waits until a file has stopped changing for --settle seconds so
+half-copied files are never read, then runs the full optimization against the
+resume and publishes the results into the outbox. save_results_to_files()
+stages each result folder and renames it into place, so the outbox only ever
+contains complete folders. A ledger in the outbox records the content hash of every
+posting that was processed, so restarting the watcher does not redo old work.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from resume_cache import ResumeParseCache, hash_file
+from resume_windows import ResumeOptimizer, read_document_text
+from run_index import RunIndex
+
+POSTING_EXTENSIONS = ('.txt', '.docx', '.pdf')
+
+# Names written by editors, browsers and copy tools while a file is incomplete
+PARTIAL_SUFFIXES = ('.part', '.partial', '.tmp', '.crdownload', '.download', '.swp')
+
+LEDGER_NAME = '.watch_ledger.json'
+
+
+def is_posting_file(name: str) -> bool:
+    """Return True for job posting files the watcher should pick up"""
+    lower = name.lower()
+    if name.startswith(('.', '~$')) or lower.endswith(PARTIAL_SUFFIXES):
+        return False
+    return lower.endswith(POSTING_EXTENSIONS)
+
+
+def stat_signature(st: os.stat_result) -> Tuple[int, int]:
+    """Cheap change detector: (size, mtime in nanoseconds)"""
+    return st.st_size, st.st_mtime_ns
+
+
+class WatchLedger:
+    """Persistent record of processed postings, stored as JSON in the outbox"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"WARNING: Could not read watch ledger {path}: {e} - starting fresh")
+
+    def get(self, name: str) -> Optional[Dict]:
+        return self.entries.get(name)
+
+    def record(self, name: str, entry: Dict):
+        """Store an entry and rewrite the ledger atomically"""
+        self.entries[name] = entry
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+
+class HotFolderWatcher:
+    """Poll an inbox folder and optimize each new or changed job posting once"""
+
+    def __init__(self, optimizer: ResumeOptimizer, inbox: str, outbox: str, resume_path: str,
+                 target_role: str = "Software Engineer", target_company: str = "Target Company",
+                 style_choice: str = '3', settle_seconds: float = 2.0, quiet: bool = False):
+        self.optimizer = optimizer
+        self.inbox = inbox
+        self.outbox = outbox
+        self.resume_path = resume_path
+        self.target_role = target_role
+        self.target_company = target_company
+        self.style_choice = style_choice
+        self.settle_seconds = settle_seconds
+        self.quiet = quiet
+
+        os.makedirs(outbox, exist_ok=True)
+        self.ledger = WatchLedger(os.path.join(outbox, LEDGER_NAME))
+
+        # name -> (stat signature, time first seen with that signature)
+        self._pending: Dict[str, Tuple[Tuple[int, int], float]] = {}
+        # name -> stat signature that has already been handled
+        self._seen: Dict[str, Tuple[int, int]] = {}
+
+        self._resume_signature = None
+        self._resume_content = None
+
+    def resume_content(self) -> str:
+        """Load the resume once, reloading only if the file changes"""
+        if not os.path.isfile(self.resume_path):
+            # Literal resume text passed on the command line
+            return self.resume_path
+        signature = stat_signature(os.stat(self.resume_path))
+        if signature != self._resume_signature:
+            self._resume_content = self.optimizer.load_resume_file(self.resume_path)
+            self._resume_signature = signature
+        return self._resume_content
+
+    def _is_already_processed(self, name: str, path: str, signature: Tuple[int, int]) -> Optional[str]:
+        """Return the content hash if the posting still needs processing, None if the ledger covers it"""
+        entry = self.ledger.get(name)
+        if entry and tuple(entry.get('stat', ())) == signature:
+            return None
+        content_hash = hash_file(path)
+        if entry and entry.get('content_hash') == content_hash:
+            # Touched but not changed: remember the new stat so it isn't hashed again
+            self.ledger.record(name, dict(entry, stat=list(signature)))
+            return None
+        return content_hash
+
+    def poll(self, now: Optional[float] = None) -> List[str]:
+        """Scan the inbox once and process every posting that has settled"""
+        now = time.time() if now is None else now
+        processed = []
+
+        try:
+            entries = sorted(os.scandir(self.inbox), key=lambda e: e.name)
+        except OSError as e:
+            print(f"ERROR: Cannot read inbox {self.inbox}: {e}")
+            return processed
+
+        present = set()
+        for entry in entries:
+            if not entry.is_file() or not is_posting_file(entry.name):
+                continue
+            present.add(entry.name)
+            try:
+                signature = stat_signature(entry.stat())
+            except OSError:
+                continue
+            if self._seen.get(entry.name) == signature:
+                continue
+
+            # Debounce: the file must keep the same size and mtime for settle_seconds
+            pending = self._pending.get(entry.name)
+            if pending is None or pending[0] != signature:
+                self._pending[entry.name] = (signature, now)
+                if self.settle_seconds > 0:
+                    continue
+            elif now - pending[1] < self.settle_seconds:
+                continue
+
+            del self._pending[entry.name]
+            output_dir = self.process_posting(entry.name, entry.path, signature)
+            self._seen[entry.name] = signature
+            if output_dir:
+                processed.append(output_dir)
+
+        # Forget files that were removed so a re-added copy is considered again
+        for name in list(self._pending):
+            if name not in present:
+                del self._pending[name]
+        for name in list(self._seen):
+            if name not in present:
+                del self._seen[name]
+        return processed
+
+    def process_posting(self, name: str, path: str, signature: Tuple[int, int]) -> Optional[str]:
+        """Optimize one posting and publish its results atomically into the outbox"""
+        try:
+            content_hash = self._is_already_processed(name, path, signature)
+        except OSError as e:
+            print(f"WARNING: Could not read {name}: {e}")
+            return None
+        if content_hash is None:
+            return None
+
+        print(f">>> New job posting: {name}")
+        stem = os.path.splitext(name)[0]
+        final_dir = os.path.join(self.outbox, f"{stem}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{content_hash[:8]}")
+
+        entry = {'content_hash': content_hash, 'stat': list(signature),
+                 'processed_at': datetime.now().isoformat(timespec='seconds'),
+                 'output_dir': None, 'error': None}
+        try:
+            job_description = read_document_text(path)
+            if not job_description.strip():
+                raise ValueError("posting is empty")
+
+            output = io.StringIO() if self.quiet else None
+            with contextlib.redirect_stdout(output) if output else contextlib.nullcontext():
+                results = self.optimizer.process_complete_optimization(
+                    job_description, self.resume_content(), self.target_role,
+                    self.target_company, self.style_choice
+                )
+                # Staged and renamed into place by save_results_to_files itself
+                published = self.optimizer.save_results_to_files(results, final_dir)
+            if published is None:
+                raise OSError("results could not be saved")
+
+            entry['output_dir'] = os.path.basename(final_dir)
+            print(f"    ✅ Results published to: {final_dir}")
+        except Exception as e:
+            entry['error'] = f"{type(e).__name__}: {e}"
+            print(f"ERROR: Failed to optimize {name}: {e}")
+            final_dir = None
+
+        # Failed postings are recorded too and retried only when the file changes
+        self.ledger.record(name, entry)
+        return final_dir
+
+    def run(self, interval: float = 2.0, once: bool = False):
+        """Poll until interrupted (or a single pass with once=True)"""
+        print(f">>> Watching {self.inbox} for job postings (outbox: {self.outbox})")
+        if once:
+            # Nothing is being written mid-scan in a one-shot run, so don't wait
+            self.settle_seconds = 0
+            return self.poll()
+
+        processed = []
+        try:
+            while True:
+                processed.extend(self.poll())
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print(f"\n>>> Watch stopped: {len(processed)} postings optimized this session")
+        return processed
+
+
+def run_watch_command(argv: List[str]):
+    """Entry point for `resume_windows.py watch`"""
+    parser = argparse.ArgumentParser(prog='resume_windows.py watch',
+                                     description='Optimize each job posting dropped into an inbox folder')
+    parser.add_argument('inbox', help='Folder to watch for .txt/.docx/.pdf job postings')
+    parser.add_argument('--resume', '-r', required=True,
+                        help='Resume file path (or resume text)')
+    parser.add_argument('--outbox', default=None,
+                        help='Folder for results (default: INBOX_outbox next to the inbox)')
+    parser.add_argument('--role', default='Software Engineer',
+                        help='Target job role')
+    parser.add_argument('--company', '-c', default='Target Company',
+                        help='Target company name')
+    parser.add_argument('--style', choices=['1', '2', '3'], default='3',
+                        help='Resume style (1=story, 2=standard, 3=both)')
+    parser.add_argument('--interval', type=float, default=2.0,
+                        help='Seconds between inbox scans')
+    parser.add_argument('--settle', type=float, default=2.0,
+                        help='Seconds a file must stay unchanged before it is processed')
+    parser.add_argument('--once', action='store_true',
+                        help='Process what is in the inbox now and exit')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                        help='Hide the per-posting optimization log')
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.inbox):
+        print(f"ERROR: Not a directory: {args.inbox}")
+        return 1
+    outbox = args.outbox or os.path.normpath(args.inbox) + '_outbox'
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        optimizer = ResumeOptimizer(parse_cache=ResumeParseCache())
+    # Published result folders are logged like command line and browse runs
+    optimizer.run_index = RunIndex()
+    watcher = HotFolderWatcher(optimizer, args.inbox, outbox, args.resume, args.role,
+                               args.company, args.style, args.settle, args.quiet)
+    try:
+        watcher.resume_content()
+    except Exception as e:
+        print(f"ERROR: Failed to read resume: {e}")
+        return 1
+
+    watcher.run(args.interval, args.once)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_watch_command(sys.argv[1:]))
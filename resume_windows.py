@@ -6,28 +6,43 @@ Generates professionally formatted .docx resumes matching Ryan Weiler's template
 Usage:
     python resume_windows.py "job description text" --resume "current resume text"
     python resume_windows.py --browse  # Interactive file selection
+    python resume_windows.py ingest DIR --out resumes.jsonl  # Bulk-parse resumes
+    python resume_windows.py watch INBOX --resume me.docx  # Optimize postings as they arrive
+    python resume_windows.py - --resume me.docx --style 2 < job.txt  # Job description from stdin
+    producer | python resume_windows.py --stdin --style 2  # NUL-separated job/resume pairs
 """
 
+import io
 import os
 import sys
+import zipfile
+import copy
+import codecs
+import hashlib
+import weakref
 import argparse
+from itertools import groupby
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Optional
 import argparse
 
-# Optional imports with fallbacks
-try:
-    from docx import Document
-    from docx.shared import Inches, Pt, RGBColor
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from docx.oxml.shared import qn
-    from docx.oxml import OxmlElement
-    HAS_DOCX = True
-except ImportError:
-    print("WARNING: python-docx not installed. Run: pip install python-docx")
-    HAS_DOCX = False
+from ats_analysis import AtsReport, score_resume
+from artifact_store import DEFAULT_STORE_DIR, INDEX_NAME as STORE_INDEX_NAME, ArtifactStore
+from docx_to_txt_converter import extract_docx_text
+from ooxml_writer import (CORE_PROPERTIES_TIMESTAMP, DocxFragment, DocxParagraph, DocxRun, RESUME_STYLES,
+                          iter_paragraphs, normalize_docx_package, write_docx)
+from pdf_text_extractor import DOCUMENT_TEXT_CHARS, extract_text_from_pdf
+from page_fit import estimate_layout, fit_to_pages
+from render_cache import RenderCache, read_render_hash, render_key, write_bytes_atomic, write_render_hash
+from resume_cache import ResumeParseCache
+from result_bundle import BUNDLE_SUFFIX, ResultBundleWriter
+from run_index import RunIndex
+from staged_output import StagedOutput, unique_output_dir
+from resume_ir import (BulletList, Link, Paragraph, ResumeDocument, Section, lines_with_links,
+                       render_docx_blocks, render_html, render_markdown, render_text, section_from_text)
 
+# Optional imports with fallbacks
 try:
     import tkinter as tk
     from tkinter import filedialog, messagebox
@@ -49,10 +64,141 @@ class JobAnalysis:
     role_type: str
 
 
+# Byte-order marks checked before probing (UTF-32 first: its LE BOM starts with UTF-16's)
+_TEXT_BOMS = [
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+# Bytes left undefined by cp1252; their presence means the file is really latin-1
+_CP1252_UNDEFINED = frozenset(b'\x81\x8d\x8f\x90\x9d')
+
+ENCODING_PROBE_BYTES = 64 * 1024
+
+LINKEDIN_URL = "https://www.linkedin.com/in/ryan-weiler-7a3119190/"
+GITHUB_URL = "https://github.com/ryan-wlr"
+
+# Extra resume formats save_results_to_files can render from the ResumeDocuments
+EXPORT_FORMATS = ('md', 'html', 'docx')
+
+# Results key -> file name written by save_results_to_files
+RESULT_FILES = {
+    '1_job_analysis': 'job_analysis_report.txt',
+    '2_resume_flaws': 'resume_analysis_flaws.txt', 
+    '3_impact_rewrite': 'resume_impact_version.txt',
+    '4_ats_optimized': 'resume_ats_optimized.txt',
+    '5_enhanced_skills': 'enhanced_skills_section.txt',
+    '6_keyword_experience': 'keyword_enhanced_experience.txt',
+    '7_narrative_resume': 'narrative_story_resume.txt',
+    '7_enhanced_resume': 'enhanced_standard_resume.txt',
+    '7_combined_resume': 'combined_comprehensive_resume.txt',
+    '8_enhanced_resume': 'enhanced_standard_resume.txt',
+    '8_narrative_only': 'narrative_only_reference.txt',
+    '9_enhanced_only': 'enhanced_only_reference.txt',
+    '7_tailored_resume': 'tailored_resume_final.txt',
+    '8_executive_summary': 'optimization_executive_summary.txt',
+    '9_executive_summary': 'optimization_executive_summary.txt',
+    '10_executive_summary': 'optimization_executive_summary.txt'
+}
+
+# Results keys holding complete resume texts (plus the ResumeDocument keys of the run)
+RESUME_VARIANT_KEYS = ('3_impact_rewrite', '4_ats_optimized')
+
+# ResumeDocument keys whose document becomes optimized_resume.docx, in order of preference
+PRIMARY_RESUME_KEYS = ('7_combined_resume', '7_narrative_resume', '7_enhanced_resume')
+
+# Serialized base resume documents (margins, styles, fixed header block),
+# built once per process and cloned for every render
+_BASE_DOCUMENT_CACHE: Dict[str, bytes] = {}
+
+HYPERLINK_RELTYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
+
+# Prebuilt <w:hyperlink><w:r><w:rPr/><w:t/></w:r></w:hyperlink>, deep-copied per link
+_HYPERLINK_TEMPLATE = None
+
+# Per document part: URL -> relationship id, so repeated links share one relationship
+_HYPERLINK_REL_IDS = weakref.WeakKeyDictionary()
+
+# Static standard-format sections per (field, section), see static_section()
+_STATIC_FRAGMENTS: Dict[tuple, DocxFragment] = {}
+
+# python-docx core properties pinned like the direct writer's, for byte-identical renders
+FIXED_CORE_TIMESTAMP = datetime.strptime(CORE_PROPERTIES_TIMESTAMP, '%Y-%m-%dT%H:%M:%SZ')
+
+# 'ooxml' streams document.xml directly; 'python-docx' builds it through the object model
+DOCX_BACKEND = os.environ.get('RESUME_DOCX_BACKEND', 'ooxml')
+
+
+def detect_text_encoding(data: bytes, probe_size: int = ENCODING_PROBE_BYTES) -> str:
+    """Guess the encoding of a text buffer from its BOM and a bounded prefix probe"""
+    for bom, encoding in _TEXT_BOMS:
+        if data.startswith(bom):
+            return encoding
+    
+    prefix = data[:probe_size]
+    
+    # BOM-less UTF-16: plain ASCII text leaves a NUL in every other byte
+    if prefix.count(0) > len(prefix) // 4:
+        return 'utf-16-le' if prefix[1::2].count(0) > prefix[0::2].count(0) else 'utf-16-be'
+    
+    # Incremental decoder so a multi-byte sequence cut off at the probe boundary isn't an error
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(prefix, final=len(prefix) == len(data))
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    
+    if _CP1252_UNDEFINED.isdisjoint(prefix):
+        return 'cp1252'
+    return 'latin-1'
+
+
+def decode_text_bytes(data: bytes) -> str:
+    """Decode a text buffer in a single pass using the detected encoding"""
+    return data.decode(detect_text_encoding(data), errors='replace')
+
+
+def read_document_text(file_path: str) -> str:
+    """Read plain text from a job description or resume file (.docx, .pdf or text)"""
+    if file_path.lower().endswith('.docx'):
+        # Stream headers, body (incl. tables/text boxes) and footers out of the zip
+        return extract_docx_text(file_path)
+    if file_path.lower().endswith('.pdf'):
+        # Pages are decoded lazily, up to DEFAULT_MAX_PAGES or DOCUMENT_TEXT_CHARS characters
+        return extract_text_from_pdf(file_path, enough_chars=DOCUMENT_TEXT_CHARS)
+    with open(file_path, 'rb') as f:
+        return decode_text_bytes(f.read())
+
+
 class ResumeOptimizer:
     """AI-powered resume optimization system with Windows compatibility"""
     
-    def __init__(self):
+    def __init__(self, parse_cache: Optional[ResumeParseCache] = None, render_cache: Optional[RenderCache] = None):
+        self.parse_cache = parse_cache
+        self.render_cache = render_cache
+        self._resume_info_memo = {}
+        # ResumeDocuments behind the resume texts of the last optimization run
+        self.resume_documents: Dict[str, ResumeDocument] = {}
+        # Optional DocxRenderFarm; when set, save_resume_docx queues renders on it
+        self.render_farm = None
+        # Page budget for DOCX resumes; bullets are trimmed to fit when set
+        self.max_pages: Optional[int] = None
+        # ResultBundleWriter collecting output files while save_results_to_files bundles
+        self.output_bundle = None
+        # Optional ArtifactStore; when set, save_results_to_files stores runs there instead of in folders
+        self.artifact_store = None
+        # StagedOutput receiving a folder run's files until they are published
+        self.staged_output = None
+        # Optional RunIndex; when set, every saved run is logged to it
+        self.run_index = None
+        # AtsReport per resume variant of the last run, and the key of the best-scoring one
+        self.ats_reports: Dict[str, AtsReport] = {}
+        self.best_ats_variant: Optional[str] = None
+        # Inputs of the last optimization run (hashes, role, company, style, field)
+        self.run_info: Dict[str, str] = {}
         print(">>> AI Resume Optimizer initialized successfully!")
         print(">>> Ready to create ATS-optimized, recruiter-friendly resumes!")
         
@@ -1033,11 +1179,17 @@ The optimized resume now better aligns with modern hiring practices and should s
     def create_enhanced_resume(self, resume_content: str, job_analysis: JobAnalysis, 
                               target_role: str, target_company: str) -> str:
         """Create enhanced professional resume version"""
+        return render_text(self.build_enhanced_resume_document(resume_content, job_analysis, target_role, target_company))
+    
+    def build_enhanced_resume_document(self, resume_content: str, job_analysis: JobAnalysis, 
+                                       target_role: str, target_company: str) -> ResumeDocument:
+        """Build the enhanced professional resume as a ResumeDocument"""
         print("\n>>> CREATING ENHANCED PROFESSIONAL RESUME...")
         
         # Detect field for context
         detected_field = self.detect_career_field(target_role.lower())
         field_data = self.get_field_data(detected_field)
+        field_display = detected_field.replace('_', ' ')
         
         # Extract key skills for summary (first few items from first skill category)
         first_skill_line = field_data['skills'][0] if field_data['skills'] else ""
@@ -1045,49 +1197,45 @@ The optimized resume now better aligns with modern hiring practices and should s
             key_skills = first_skill_line.split(':')[1].split(',')[:4]
             key_skills = [skill.strip() for skill in key_skills]
         else:
-            key_skills = [detected_field.replace('_', ' ')]
-        
-        enhanced_resume = f"""RYAN THOMAS WEILER
-{field_data['experience_title'].split('|')[0].strip()}
-
-CONTACT INFORMATION:
-Phone: (561) 906-2118 | Email: ryan_wlr@yahoo.com
-LinkedIn: https://www.linkedin.com/in/ryan-weiler-7a3119190/
-GitHub: https://github.com/ryan-wlr
-
-PROFESSIONAL SUMMARY:
-Results-driven {detected_field.replace('_', ' ')} professional with proven expertise in {', '.join(key_skills)}. 
-Demonstrated track record of delivering high-impact solutions and driving measurable results in fast-paced environments. 
-Seeking to leverage technical excellence and leadership capabilities as {target_role} at {target_company}.
-
-CORE TECHNICAL COMPETENCIES:
-{chr(10).join(['• ' + skill for skill in field_data['skills']])}
-
-PROFESSIONAL EXPERIENCE:
-
-{field_data['experience_title']}
-{chr(10).join(['• ' + bullet for bullet in field_data['experience_bullets']])}
-
-EDUCATION:
-{field_data['education']}
-
-KEY PROJECTS & ACCOMPLISHMENTS:
-{chr(10).join(['• ' + project for project in field_data['projects']])}
-
-ACHIEVEMENTS:
-• Consistently exceeded performance expectations in all roles and responsibilities
-• Recognized for technical excellence and professional growth within field
-• Contributed to successful completion of high-priority projects and initiatives
-• Demonstrated commitment to continuous learning and skill development
-
-This resume is optimized for {target_role} positions with emphasis on technical skills,
-leadership capabilities, and measurable contributions to organizational success."""
-
-        return enhanced_resume
+            key_skills = [field_display]
+        
+        summary = (f"Results-driven {field_display} professional with proven expertise in {', '.join(key_skills)}. \n"
+                   f"Demonstrated track record of delivering high-impact solutions and driving measurable results in fast-paced environments. \n"
+                   f"Seeking to leverage technical excellence and leadership capabilities as {target_role} at {target_company}.")
+        
+        return ResumeDocument('enhanced', "RYAN THOMAS WEILER", field_data['experience_title'].split('|')[0].strip(), [
+            Section("CONTACT INFORMATION", [
+                Paragraph(["Phone: (561) 906-2118 | Email: ryan_wlr@yahoo.com"]),
+                Paragraph(["LinkedIn: ", Link(LINKEDIN_URL)]),
+                Paragraph(["GitHub: ", Link(GITHUB_URL)]),
+            ], 'contact'),
+            Section("PROFESSIONAL SUMMARY", [Paragraph([summary])], 'summary'),
+            Section("CORE TECHNICAL COMPETENCIES", [BulletList(field_data['skills'])], 'skills'),
+            Section("PROFESSIONAL EXPERIENCE", [
+                Paragraph([field_data['experience_title']]),
+                BulletList(field_data['experience_bullets']),
+            ], 'experience', spaced=True),
+            Section("EDUCATION", [Paragraph([field_data['education']])], 'education'),
+            Section("KEY PROJECTS & ACCOMPLISHMENTS", [BulletList(field_data['projects'])], 'projects'),
+            Section("ACHIEVEMENTS", [BulletList([
+                "Consistently exceeded performance expectations in all roles and responsibilities",
+                "Recognized for technical excellence and professional growth within field",
+                "Contributed to successful completion of high-priority projects and initiatives",
+                "Demonstrated commitment to continuous learning and skill development",
+            ])], 'achievements'),
+            Section(None, [Paragraph([
+                f"This resume is optimized for {target_role} positions with emphasis on technical skills,\n"
+                f"leadership capabilities, and measurable contributions to organizational success."
+            ])], 'footer'),
+        ])
     
     def create_combined_resume(self, narrative_content: str, enhanced_content: str, 
                              target_role: str, target_company: str) -> str:
-        """Create a comprehensive resume that combines storytelling narrative with professional sections"""
+        """Create a comprehensive resume that combines storytelling narrative with professional sections
+        
+        Text entry point kept for callers holding rendered resumes; the pipeline
+        uses build_combined_resume_document with the documents themselves.
+        """
         print("\n>>> CREATING COMBINED STORYTELLING + PROFESSIONAL RESUME...")
         
         # Extract key elements from both versions
@@ -1153,61 +1301,72 @@ leadership capabilities, and measurable contributions to organizational success.
             elif current_section == 'projects' and line.startswith('•'):
                 story_projects.append(line[1:].strip())
         
-        # Create the combined resume
-        combined_resume = f"""COMPREHENSIVE CAREER RESUME - {target_role.upper()}
-
-{story_hook}
-
-RYAN THOMAS WEILER
-{target_role} Professional
-
-CONTACT INFORMATION:
-📞 (561) 906-2118 | ✉️ ryan_wlr@yahoo.com
-🔗 LinkedIn: https://www.linkedin.com/in/ryan-weiler-7a3119190/ | 💻 GitHub: https://github.com/ryan-wlr
-
-PROFESSIONAL SUMMARY:
-{professional_summary.strip()}
-
-CAREER NARRATIVE & VISION:
-{story_narrative.strip()}
-
-CORE TECHNICAL COMPETENCIES:
-{chr(10).join(['• ' + skill for skill in enhanced_skills[:6]])}
-
-SIGNATURE ACHIEVEMENTS:
-{chr(10).join(['• ' + achievement for achievement in story_achievements[:5]])}
-
-PROFESSIONAL EXPERIENCE:
-{chr(10).join(['• ' + exp for exp in enhanced_experience[:8]])}
-
-KEY PROJECTS & INNOVATIONS:
-{chr(10).join(['• ' + project for project in story_projects[:6]])}
-
-EDUCATION:
-University of Central Florida — B.S. Computer Science, 2013 (Dean's List, GPA 3.8)
-Valencia College — A.A., 2011 (Dean's List, GPA 3.7)
-
-PROFESSIONAL DEVELOPMENT:
-• Continuous learning in {target_role.lower()} technologies and methodologies
-• Active participation in professional development and industry conferences
-• Commitment to staying current with emerging trends and best practices
-• Leadership development through mentoring and cross-functional collaboration
-
-FUTURE VISION:
-Leveraging proven expertise and innovative problem-solving to drive meaningful impact as {target_role} at {target_company}, 
-while continuing to grow professionally and contribute to organizational success through technical excellence and leadership.
-
----
-This comprehensive resume combines compelling career storytelling with detailed professional qualifications,
-optimized for both ATS systems and human recruiters seeking {target_role} candidates."""
-
-        return combined_resume
+        return render_text(self._combined_resume_document(
+            story_hook, professional_summary.strip(), story_narrative.strip(), enhanced_skills,
+            story_achievements, enhanced_experience, story_projects, target_role, target_company))
+    
+    def build_combined_resume_document(self, narrative: ResumeDocument, enhanced: ResumeDocument,
+                                       target_role: str, target_company: str) -> ResumeDocument:
+        """Combine the narrative and enhanced documents section by section"""
+        print("\n>>> CREATING COMBINED STORYTELLING + PROFESSIONAL RESUME...")
+        
+        def bullets(doc, role):
+            section = doc.section(role)
+            return [item.strip() for item in section.bullets()] if section else []
+        
+        def text(doc, role):
+            section = doc.section(role)
+            return section.plain_text() if section else ""
+        
+        return self._combined_resume_document(
+            narrative.hook or "", text(enhanced, 'summary'), text(narrative, 'narrative'),
+            bullets(enhanced, 'skills'), bullets(narrative, 'achievements'),
+            bullets(enhanced, 'experience'), bullets(narrative, 'projects'), target_role, target_company)
+    
+    def _combined_resume_document(self, story_hook: str, professional_summary: str, story_narrative: str,
+                                  skills: list, achievements: list, experience: list, projects: list,
+                                  target_role: str, target_company: str) -> ResumeDocument:
+        """Lay out the combined resume from its extracted parts"""
+        return ResumeDocument('combined', "RYAN THOMAS WEILER", f"{target_role} Professional", [
+            Section("CONTACT INFORMATION", [
+                Paragraph(["📞 (561) 906-2118 | ✉️ ryan_wlr@yahoo.com"]),
+                Paragraph(["🔗 LinkedIn: ", Link(LINKEDIN_URL), " | 💻 GitHub: ", Link(GITHUB_URL)]),
+            ], 'contact'),
+            Section("PROFESSIONAL SUMMARY", [Paragraph([professional_summary])], 'summary'),
+            Section("CAREER NARRATIVE & VISION", [Paragraph([story_narrative])], 'narrative'),
+            Section("CORE TECHNICAL COMPETENCIES", [BulletList(skills[:6])], 'skills'),
+            Section("SIGNATURE ACHIEVEMENTS", [BulletList(achievements[:5])], 'achievements'),
+            Section("PROFESSIONAL EXPERIENCE", [BulletList(experience[:8])], 'experience'),
+            Section("KEY PROJECTS & INNOVATIONS", [BulletList(projects[:6])], 'projects'),
+            Section("EDUCATION", [Paragraph([
+                "University of Central Florida — B.S. Computer Science, 2013 (Dean's List, GPA 3.8)\n"
+                "Valencia College — A.A., 2011 (Dean's List, GPA 3.7)"
+            ])], 'education'),
+            Section("PROFESSIONAL DEVELOPMENT", [BulletList([
+                f"Continuous learning in {target_role.lower()} technologies and methodologies",
+                "Active participation in professional development and industry conferences",
+                "Commitment to staying current with emerging trends and best practices",
+                "Leadership development through mentoring and cross-functional collaboration",
+            ])], 'development'),
+            Section("FUTURE VISION", [Paragraph([
+                f"Leveraging proven expertise and innovative problem-solving to drive meaningful impact as {target_role} at {target_company}, \n"
+                f"while continuing to grow professionally and contribute to organizational success through technical excellence and leadership."
+            ])], 'vision'),
+            Section(None, [Paragraph([
+                f"---\nThis comprehensive resume combines compelling career storytelling with detailed professional qualifications,\n"
+                f"optimized for both ATS systems and human recruiters seeking {target_role} candidates."
+            ])], 'footer'),
+        ], title=f"COMPREHENSIVE CAREER RESUME - {target_role.upper()}", hook=story_hook)
     
     def create_narrative_resume(self, resume_content: str, job_analysis: JobAnalysis, 
                               target_role: str, target_company: str) -> str:
         """Create a story-driven resume that shows career progression and narrative"""
+        return render_text(self.build_narrative_resume_document(resume_content, job_analysis, target_role, target_company))
+    
+    def build_narrative_resume_document(self, resume_content: str, job_analysis: JobAnalysis, 
+                                        target_role: str, target_company: str) -> ResumeDocument:
+        """Build the story-driven resume as a ResumeDocument"""
         print("\n>>> CREATING NARRATIVE-DRIVEN RESUME...")
-        
         # Extract actual resume information
         resume_info = self.extract_resume_information(resume_content)
         
@@ -1233,42 +1392,43 @@ optimized for both ATS systems and human recruiters seeking {target_role} candid
             # Fall back to personalized story if template doesn't exist
             story_elements = self.generate_personalized_story(resume_info, detected_field, target_role, target_company)
         
-        narrative_resume = f"""CAREER STORY RESUME - {target_role.upper()}
-
-{story_elements['opening_hook']}
-
-{resume_info['name']}
-{story_elements['title']}
-
-CONTACT INFORMATION:
-{resume_info['contact_info']}
-
-{story_elements['professional_narrative']}
-
-CAREER JOURNEY & IMPACT STORY:
-
-{story_elements['career_progression']}
-
-KEY ACHIEVEMENTS THAT DEFINE MY STORY:
-{chr(10).join(['• ' + achievement for achievement in story_elements['signature_achievements']])}
-
-TECHNICAL EXPERTISE DEVELOPED THROUGH MY JOURNEY:
-{chr(10).join(['• ' + skill for skill in story_elements['skills']])}
-
-EDUCATION THAT SHAPED MY PATH:
-{story_elements['education']}
-
-DEFINING PROJECTS & MILESTONES:
-{chr(10).join(['• ' + project for project in story_elements['story_projects']])}
-
-{story_elements['closing_vision']}
-
-This resume tells the story of a professional journey marked by continuous growth, 
-meaningful impact, and unwavering commitment to excellence in {detected_field.replace('_', ' ')}."""
-
-        return narrative_resume
+        return ResumeDocument('narrative', resume_info['name'], story_elements['title'], [
+            Section("CONTACT INFORMATION", lines_with_links(resume_info['contact_info']), 'contact'),
+            section_from_text(story_elements['professional_narrative'], 'narrative'),
+            Section("CAREER JOURNEY & IMPACT STORY", [Paragraph([story_elements['career_progression']])],
+                    'journey', spaced=True),
+            Section("KEY ACHIEVEMENTS THAT DEFINE MY STORY", [BulletList(story_elements['signature_achievements'])],
+                    'achievements'),
+            Section("TECHNICAL EXPERTISE DEVELOPED THROUGH MY JOURNEY", [BulletList(story_elements['skills'])], 'skills'),
+            Section("EDUCATION THAT SHAPED MY PATH", [Paragraph([story_elements['education']])], 'education'),
+            Section("DEFINING PROJECTS & MILESTONES", [BulletList(story_elements['story_projects'])], 'projects'),
+            section_from_text(story_elements['closing_vision'], 'vision'),
+            Section(None, [Paragraph([
+                f"This resume tells the story of a professional journey marked by continuous growth, \n"
+                f"meaningful impact, and unwavering commitment to excellence in {detected_field.replace('_', ' ')}."
+            ])], 'footer'),
+        ], title=f"CAREER STORY RESUME - {target_role.upper()}", hook=story_elements['opening_hook'])
+    
+    def load_resume_file(self, file_path: str) -> str:
+        """Read a resume file, through the parse cache when one is attached (the command line attaches one)"""
+        if self.parse_cache is None:
+            content = read_document_text(file_path)
+            info = self._extract_resume_information_uncached(content)
+        else:
+            content, info = self.parse_cache.load(file_path, read_document_text, self._extract_resume_information_uncached)
+        self._resume_info_memo[hashlib.sha256(content.encode('utf-8')).hexdigest()] = info
+        return content
     
     def extract_resume_information(self, resume_content: str) -> dict:
+        """Extract key information from the actual resume content (memoized per content)"""
+        content_hash = hashlib.sha256(resume_content.encode('utf-8')).hexdigest()
+        info = self._resume_info_memo.get(content_hash)
+        if info is None:
+            info = self._extract_resume_information_uncached(resume_content)
+            self._resume_info_memo[content_hash] = info
+        return copy.deepcopy(info)
+    
+    def _extract_resume_information_uncached(self, resume_content: str) -> dict:
         """Extract key information from the actual resume content"""
         lines = resume_content.strip().split('\n')
         info = {
@@ -1778,8 +1938,12 @@ My {display_field.lower()} story continues with {story_elements['future_emotion'
 
     def process_complete_optimization(self, job_description: str, resume_content: str, 
                                     target_role: str = "Software Engineer", 
-                                    target_company: str = "Target Company") -> Dict[str, str]:
-        """Execute complete resume optimization workflow with narrative storytelling"""
+                                    target_company: str = "Target Company",
+                                    style_choice: Optional[str] = None) -> Dict[str, str]:
+        """Execute complete resume optimization workflow with narrative storytelling
+        
+        style_choice ("1", "2" or "3") skips the interactive style prompt.
+        """
         
         print(">>> STARTING COMPLETE RESUME OPTIMIZATION PROCESS")
         print(f"    Target Role: {target_role}")
@@ -1793,10 +1957,21 @@ My {display_field.lower()} story continues with {story_elements['future_emotion'
         print("    2. STANDARD RESUME - Enhanced professional format")
         print("    3. BOTH VERSIONS - Create narrative and standard resumes")
         
-        style_choice = input("Choose resume style (1, 2, or 3): ").strip()
+        if style_choice is None:
+            style_choice = input("Choose resume style (1, 2, or 3): ").strip()
+        else:
+            print(f"Choose resume style (1, 2, or 3): {style_choice}")
         
         # Step 1: Analyze job requirements
         job_analysis = self.analyze_job_posting(job_description, target_role, target_company)
+        self.run_info = {
+            'job_sha256': hashlib.sha256(job_description.encode('utf-8')).hexdigest(),
+            'resume_sha256': hashlib.sha256(resume_content.encode('utf-8')).hexdigest(),
+            'role': target_role,
+            'company': target_company,
+            'style': style_choice if style_choice in ("1", "2") else "3",
+            'field': self.current_detected_field,
+        }
         
         # Step 2: Execute all optimization strategies
         results = {}
@@ -1834,23 +2009,37 @@ OPTIMIZATION RECOMMENDATIONS:
         results['6_keyword_experience'] = self.enhance_experience_with_keywords(resume_content, job_analysis)
         
         # Create different resume versions based on user choice
+        # Resume versions are built as ResumeDocuments and rendered to text here;
+        # save_results_to_files renders the same documents to any extra formats
+        documents = {}
         if style_choice == "1":
             # Story resume only
-            results['7_narrative_resume'] = self.create_narrative_resume(resume_content, job_analysis, target_role, target_company)
+            documents['7_narrative_resume'] = self.build_narrative_resume_document(resume_content, job_analysis, target_role, target_company)
         elif style_choice == "2":
             # Standard resume only
-            results['7_enhanced_resume'] = self.create_enhanced_resume(resume_content, job_analysis, target_role, target_company)
+            documents['7_enhanced_resume'] = self.build_enhanced_resume_document(resume_content, job_analysis, target_role, target_company)
         else:
             # Option 3: Combined version with both narrative and professional sections
-            narrative_content = self.create_narrative_resume(resume_content, job_analysis, target_role, target_company)
-            enhanced_content = self.create_enhanced_resume(resume_content, job_analysis, target_role, target_company)
+            narrative_document = self.build_narrative_resume_document(resume_content, job_analysis, target_role, target_company)
+            enhanced_document = self.build_enhanced_resume_document(resume_content, job_analysis, target_role, target_company)
             
             # Create a combined resume that includes both storytelling and professional elements
-            results['7_combined_resume'] = self.create_combined_resume(narrative_content, enhanced_content, target_role, target_company)
+            documents['7_combined_resume'] = self.build_combined_resume_document(narrative_document, enhanced_document, target_role, target_company)
             
             # Also save individual versions for reference
-            results['8_narrative_only'] = narrative_content
-            results['9_enhanced_only'] = enhanced_content
+            documents['8_narrative_only'] = narrative_document
+            documents['9_enhanced_only'] = enhanced_document
+        
+        for key, document in documents.items():
+            results[key] = render_text(document)
+        self.resume_documents = documents
+        
+        # Score every resume variant quietly and keep the best one for ATS uploads
+        self.ats_reports = {key: score_resume(results[key]) for key in RESUME_VARIANT_KEYS + tuple(documents)}
+        self.best_ats_variant = max(self.ats_reports, key=lambda key: self.ats_reports[key].score)
+        best = self.ats_reports[self.best_ats_variant]
+        print(f"    ATS check: {RESULT_FILES[self.best_ats_variant]} scores best ({best.score}/100, {best.compatibility})")
+        ats_ranking = sorted(self.ats_reports.items(), key=lambda item: -item[1].score)
         
         # Step 3: Create executive summary
         summary_key = '8_executive_summary' if style_choice in ["1", "2"] else '10_executive_summary'
@@ -1877,6 +2066,10 @@ OPTIMIZATION RESULTS:
 • Strengthened value proposition with quantified achievements and results
 {("• Compelling career narrative that shows professional growth and future vision" if style_choice in ["1", "3"] else "")}
 
+ATS SCORES (best first):
+{chr(10).join(f"• {RESULT_FILES[key]}: {report.score}/100 ({report.compatibility})" for key, report in ats_ranking)}
+RECOMMENDED FOR ATS UPLOAD: {RESULT_FILES[self.best_ats_variant]}
+
 NEXT STEPS:
 1. Review optimized resume version(s) for accuracy and personal preferences
 2. Customize cover letter using provided job analysis insights  
@@ -1893,49 +2086,121 @@ RECOMMENDED USAGE:
 
         return results
     
-    def save_results_to_files(self, results: Dict[str, str], output_dir: str = "resume_optimization_output"):
-        """Save all optimization results to organized files"""
+    def save_results_to_files(self, results: Dict[str, str], output_dir: str = "resume_optimization_output",
+                              formats: tuple = (), bundle: bool = False) -> str:
+        """Save all optimization results to organized files
+        
+        formats adds renders of each resume version in EXPORT_FORMATS ('md',
+        'html', 'docx') next to its .txt file. bundle=True writes every file
+        plus a manifest into a single output_dir + '.zip' instead of a folder.
+        With an artifact_store attached the files go into the store instead.
+        Returns the folder or bundle path, or the store path and run id; None
+        if a file failed to save and the folder was not published.
+        """
+        if not bundle and self.artifact_store is None:
+            # Files are staged in a hidden sibling folder that is renamed into place when complete
+            self.staged_output = StagedOutput(output_dir)
+            try:
+                self._save_results(results, self.staged_output.staging_dir, formats)
+            except BaseException:
+                self.staged_output.abort()
+                raise
+            finally:
+                staged, self.staged_output = self.staged_output, None
+            # Indexed only once published, which may be when the last farm render is written
+            staged.on_commit = lambda: self.index_run(output_dir, 'folder', results)
+            if staged.close():
+                print(f"    >>> Published {output_dir}")
+            elif staged.errors:
+                return None
+            else:
+                print(f"    >>> {output_dir} will be published when its DOCX renders finish")
+            return output_dir
+        
+        self.output_bundle = ResultBundleWriter()
+        try:
+            self._save_results(results, output_dir, formats)
+            if self.artifact_store is not None:
+                store = self.artifact_store
+                before = store.new_blobs
+                run_id = store.add_run(self.output_bundle.members(), **self.run_info)
+                added = store.new_blobs - before
+                print(f"    >>> Stored run {run_id} in {store.root} "
+                      f"({added} new, {len(self.output_bundle.members()) - added} already stored)")
+                self.index_run(store.root, 'store', results, run_id=run_id)
+                return f"{store.root} (run {run_id})"
+            bundle_path = self.output_bundle.write(output_dir + BUNDLE_SUFFIX)
+        finally:
+            self.output_bundle = None
+        print(f"    >>> Bundled into {bundle_path}")
+        self.index_run(bundle_path, 'bundle', results)
+        return bundle_path
+    
+    def index_run(self, path: str, kind: str, results: Dict[str, str], **details):
+        """Append a saved run to the attached run index"""
+        if self.run_index is None:
+            return
+        info = {key: self.run_info.get(key) for key in ('role', 'company', 'style', 'field')}
+        try:
+            self.run_index.append(path, kind, keys=sorted(results), **info, **details)
+        except OSError as e:
+            print(f"WARNING: Could not record run in the run index: {e}")
+    
+    def write_output_text(self, output_dir: str, filename: str, text: str, **metadata):
+        """Write one text artifact to the output folder, the open result bundle or the staged output"""
+        if self.output_bundle is not None:
+            self.output_bundle.add_text(filename, text, **metadata)
+            return
+        if self.staged_output is not None:
+            self.staged_output.write_text(filename, text)
+            return
+        with open(os.path.join(output_dir, filename), 'w', encoding='utf-8') as f:
+            f.write(text)
+    
+    def _save_results(self, results: Dict[str, str], output_dir: str, formats: tuple):
+        """Write the result files and DOCX resumes for save_results_to_files"""
         
         # Create output directory
-        os.makedirs(output_dir, exist_ok=True)
+        if self.output_bundle is None:
+            os.makedirs(output_dir, exist_ok=True)
         
         # File mapping with descriptive names
-        file_mapping = {
-            '1_job_analysis': 'job_analysis_report.txt',
-            '2_resume_flaws': 'resume_analysis_flaws.txt', 
-            '3_impact_rewrite': 'resume_impact_version.txt',
-            '4_ats_optimized': 'resume_ats_optimized.txt',
-            '5_enhanced_skills': 'enhanced_skills_section.txt',
-            '6_keyword_experience': 'keyword_enhanced_experience.txt',
-            '7_narrative_resume': 'narrative_story_resume.txt',
-            '7_enhanced_resume': 'enhanced_standard_resume.txt',
-            '7_combined_resume': 'combined_comprehensive_resume.txt',
-            '8_enhanced_resume': 'enhanced_standard_resume.txt',
-            '8_narrative_only': 'narrative_only_reference.txt',
-            '9_enhanced_only': 'enhanced_only_reference.txt',
-            '7_tailored_resume': 'tailored_resume_final.txt',
-            '8_executive_summary': 'optimization_executive_summary.txt',
-            '9_executive_summary': 'optimization_executive_summary.txt',
-            '10_executive_summary': 'optimization_executive_summary.txt'
-        }
+        file_mapping = RESULT_FILES
         
-        print(f"\n>>> Saving optimization results to '{output_dir}' folder:")
+        target = self.staged_output.final_dir if self.staged_output is not None else output_dir
+        print(f"\n>>> Saving optimization results to '{target}' {'folder' if self.output_bundle is None else 'store' if self.artifact_store is not None else 'bundle'}:")
         
         # Save each result file
         for key, filename in file_mapping.items():
             if key in results:
-                file_path = os.path.join(output_dir, filename)
                 try:
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(results[key])
+                    self.write_output_text(output_dir, filename, results[key], key=key)
                     print(f"    >>> {filename}")
                 except Exception as e:
                     print(f"    ERROR: Failed to save {filename}: {e}")
         
-        print(f"\n>>> All files saved successfully!")
+        if formats:
+            self.save_resume_exports(results, output_dir, file_mapping, formats)
+        
+        # Staged writes run in a thread pool: wait for them before reporting success
+        failed = self.staged_output.flush() if self.staged_output is not None else {}
+        for filename, error in failed.items():
+            print(f"    ERROR: Failed to save {filename}: {error}")
+        if failed:
+            print(f"\nERROR: {len(failed)} file(s) failed to save - the folder will not be published")
+        else:
+            print(f"\n>>> All files saved successfully!")
+        
+        # The main DOCX renders the run's primary ResumeDocument; results built
+        # without one fall back to the field template and narrative text below
+        documents = self.resume_documents_for(results)
+        primary = next((documents[key] for key in PRIMARY_RESUME_KEYS if key in documents), None)
+        if primary is not None:
+            print(f"\n>>> Creating formatted DOCX resume:")
+            self.create_docx_from_document(primary, output_dir)
         
         # Create formatted .docx resume(s) based on what was generated
-        if '7_combined_resume' in results:
+        elif '7_combined_resume' in results:
             # Option 3: Combined version - create one comprehensive DOCX
             print(f"\n>>> Creating combined comprehensive DOCX file:")
             combined_results = {k: v for k, v in results.items()}
@@ -1974,6 +2239,40 @@ RECOMMENDED USAGE:
             # Fallback - create with whatever content is available
             self.create_formatted_docx_resume(results, output_dir)
     
+    def resume_documents_for(self, results: Dict[str, str]) -> Dict[str, ResumeDocument]:
+        """The ResumeDocuments of the last run, skipping any left over from a run other than results"""
+        return {key: document for key, document in self.resume_documents.items()
+                if results.get(key) == render_text(document)}
+    
+    def create_docx_from_document(self, document: ResumeDocument, output_dir: str,
+                                  filename: str = 'optimized_resume.docx'):
+        """Render a ResumeDocument straight to a formatted .docx resume"""
+        try:
+            blocks = self.fit_docx_blocks(render_docx_blocks(document))
+            self.save_resume_docx(os.path.join(output_dir, filename), blocks)
+            print(f"    >>> {filename} ({document.kind} resume)")
+        except Exception as e:
+            print(f"ERROR: Error creating .docx resume: {e}")
+    
+    def save_resume_exports(self, results: Dict[str, str], output_dir: str, file_mapping: Dict[str, str], formats: tuple):
+        """Render each resume version's ResumeDocument to the requested extra formats"""
+        renderers = {'md': render_markdown, 'html': render_html}
+        for key, document in self.resume_documents_for(results).items():
+            if key not in file_mapping:
+                continue
+            stem = os.path.splitext(file_mapping[key])[0]
+            for fmt in formats:
+                filename = f"{stem}.{fmt}"
+                file_path = os.path.join(output_dir, filename)
+                try:
+                    if fmt == 'docx':
+                        self.save_resume_docx(file_path, self.fit_docx_blocks(render_docx_blocks(document)))
+                    else:
+                        self.write_output_text(output_dir, filename, renderers[fmt](document), key=key)
+                    print(f"    >>> {filename}")
+                except Exception as e:
+                    print(f"    ERROR: Failed to save {filename}: {e}")
+    
     def detect_career_field(self, content: str) -> str:
         """Intelligently detect career field from job content and generate appropriate data"""
         content_lower = content.lower()
@@ -3030,22 +3329,7 @@ RECOMMENDED USAGE:
 
     def create_formatted_docx_resume(self, results: Dict[str, str], output_dir: str):
         """Create a properly formatted .docx resume matching Ryan_Weiler_Resume.docx style"""
-        if not HAS_DOCX:
-            print("WARNING: Skipping .docx creation - python-docx not available")
-            return
-        
         try:
-            # Create new document
-            doc = Document()
-            
-            # Set up document margins to match original
-            sections = doc.sections
-            for section in sections:
-                section.top_margin = Inches(0.5)
-                section.bottom_margin = Inches(0.5)
-                section.left_margin = Inches(0.7)
-                section.right_margin = Inches(0.7)
-            
             # Use the previously detected field from mock_response
             detected_field = getattr(self, 'current_detected_field', 'software_engineer')
             field_data = self.get_field_data(detected_field)
@@ -3056,11 +3340,12 @@ RECOMMENDED USAGE:
             print(f"    >>> Using {detected_field}-specific resume content with real companies")
             field_data = self.get_field_data(detected_field)
             # Create standard DOCX format with proper company experience
-            self.build_standard_docx(doc, field_data, results, detected_field)
+            blocks = self.build_standard_blocks(field_data, include_header=False, field=detected_field)
+            blocks = self.fit_docx_blocks(blocks, with_standard_header=True)
             
             # Save the document
             docx_path = os.path.join(output_dir, 'optimized_resume.docx')
-            doc.save(docx_path)
+            self.save_resume_docx(docx_path, blocks, with_standard_header=True)
             print(f"    >>> optimized_resume.docx (Ryan Weiler format)")
             
         except Exception as e:
@@ -3068,22 +3353,7 @@ RECOMMENDED USAGE:
     
     def create_formatted_docx_resume_specific(self, results: Dict[str, str], output_dir: str, filename: str):
         """Create a properly formatted .docx resume with specific filename"""
-        if not HAS_DOCX:
-            print("WARNING: Skipping .docx creation - python-docx not available")
-            return
-        
         try:
-            # Create new document
-            doc = Document()
-            
-            # Set up document margins to match original
-            sections = doc.sections
-            for section in sections:
-                section.top_margin = Inches(0.5)
-                section.bottom_margin = Inches(0.5)
-                section.left_margin = Inches(0.7)
-                section.right_margin = Inches(0.7)
-            
             # Use the previously detected field from mock_response
             detected_field = getattr(self, 'current_detected_field', 'software_engineer')
             field_data = self.get_field_data(detected_field)
@@ -3091,82 +3361,249 @@ RECOMMENDED USAGE:
             print(f"    >>> Detected field: {detected_field}")
             
             # Check if narrative resume exists (storytelling mode)
+            with_standard_header = True
             if '7_narrative_resume' in results:
                 print(f"    >>> Using narrative storytelling content")
                 narrative_content = results['7_narrative_resume']
-                # Create storytelling DOCX format
-                self.build_narrative_docx(doc, narrative_content)
+                # Create storytelling DOCX format (header comes from the narrative itself)
+                blocks = self.build_narrative_blocks(narrative_content)
+                with_standard_header = False
             elif '7_enhanced_resume' in results:
                 print(f"    >>> Using enhanced standard content")
                 # For standard resumes, we need to create content differently
                 # Since enhanced resume is typically text, we'll use standard format
                 field_data = self.get_field_data(detected_field)
-                self.build_standard_docx(doc, field_data, results, detected_field)
+                blocks = self.build_standard_blocks(field_data, include_header=False, field=detected_field)
             else:
                 print(f"    >>> Using {detected_field}-specific resume content")
                 field_data = self.get_field_data(detected_field)
                 # Create standard DOCX format
-                self.build_standard_docx(doc, field_data, results, detected_field)
+                blocks = self.build_standard_blocks(field_data, include_header=False, field=detected_field)
+            
+            blocks = self.fit_docx_blocks(blocks, with_standard_header)
             
             # Save the document with custom filename
             docx_path = os.path.join(output_dir, filename)
-            doc.save(docx_path)
+            self.save_resume_docx(docx_path, blocks, with_standard_header)
             print(f"    >>> {filename} (Ryan Weiler format)")
             
         except Exception as e:
             print(f"ERROR: Error creating .docx resume: {e}")
     
-    def add_hyperlink(self, paragraph, url, text):
-        """Add a clickable hyperlink to a paragraph"""
-        # Create hyperlink relationship
-        part = paragraph.part
-        r_id = part.relate_to(url, "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink", is_external=True)
-        
-        # Create the hyperlink element
-        hyperlink = OxmlElement('w:hyperlink')
-        hyperlink.set(qn('r:id'), r_id)
-        
-        # Create run element for the hyperlink text
-        run = OxmlElement('w:r')
-        
-        # Add run properties (font formatting)
-        rPr = OxmlElement('w:rPr')
-        
-        # Set color to blue
-        color = OxmlElement('w:color')
-        color.set(qn('w:val'), '0563C1')  # Standard hyperlink blue
-        rPr.append(color)
+    def fit_docx_blocks(self, blocks: list, with_standard_header: bool = False) -> list:
+        """Report the estimated page count and trim bullets to self.max_pages if set"""
+        header = self.standard_header_blocks() if with_standard_header else []
+        estimate = estimate_layout(header + blocks)
+        print(f"    >>> Estimated length: {estimate.pages} page(s), {estimate.lines} lines")
+        if self.max_pages is None or estimate.pages <= self.max_pages:
+            return blocks
+        
+        blocks, dropped = fit_to_pages(blocks, self.max_pages, fixed_prefix=header)
+        fitted = estimate_layout(header + blocks).pages
+        print(f"    >>> Trimmed {len(dropped)} lowest-priority bullets to fit {self.max_pages} page(s) (now {fitted})")
+        return blocks
+    
+    def save_resume_docx(self, docx_path, blocks: list, with_standard_header: bool = False):
+        """Write resume blocks to a .docx path (or binary file object)
+        
+        While save_results_to_files is bundling, the bytes go into the bundle.
+        Each render's input hash is recorded in a .render-hash sidecar: a target
+        that is already up to date is left alone, and a render found in the
+        render cache is copied into place instead of rendered again.
+        With a render farm attached the job is queued and written by its pool.
+        """
+        if hasattr(docx_path, 'write'):
+            docx_path.write(self.render_docx_bytes(blocks, with_standard_header))
+            return
         
-        # Set underline
-        underline = OxmlElement('w:u')
-        underline.set(qn('w:val'), 'single')
-        rPr.append(underline)
+        header = self.standard_header_blocks() if with_standard_header else []
+        key = render_key(blocks, with_standard_header, DOCX_BACKEND, header)
+        if self.render_cache is None:
+            self.render_cache = RenderCache()
+        
+        if self.output_bundle is not None:
+            # Bundled runs take the bytes from the render cache when they can
+            data = self.render_cache.read(key)
+            if data is None:
+                data = self.render_docx_bytes(blocks, with_standard_header)
+                self.render_cache.store(key, data)
+            self.output_bundle.add(os.path.basename(docx_path), data, render_key=key)
+            return
         
-        # Set font
-        font = OxmlElement('w:rFonts')
-        font.set(qn('w:ascii'), 'Calibri')
-        font.set(qn('w:hAnsi'), 'Calibri')
-        rPr.append(font)
+        if os.path.exists(docx_path) and read_render_hash(docx_path) == key:
+            return
+        if self.render_cache.copy_into(key, docx_path):
+            write_render_hash(docx_path, key)
+            return
         
-        # Set font size
-        size = OxmlElement('w:sz')
-        size.set(qn('w:val'), '24')  # 12pt = 24 half-points
-        rPr.append(size)
+        if self.render_farm is not None:
+            # A staged folder is published only after its queued renders are written
+            staged = self.staged_output
+            if staged is not None:
+                staged.hold()
+            self.render_farm.submit(docx_path, blocks, with_standard_header,
+                                    lambda path, data: self.record_docx_render(path, key, data),
+                                    finished=None if staged is None else lambda path: staged.release())
+            return
         
-        run.append(rPr)
+        data = self.render_docx_bytes(blocks, with_standard_header)
+        write_bytes_atomic(docx_path, data)
+        self.record_docx_render(docx_path, key, data)
+    
+    def record_docx_render(self, docx_path: str, key: str, data: bytes):
+        """Write the render-hash sidecar and keep the render for reuse"""
+        write_render_hash(docx_path, key)
+        self.render_cache.store(key, data)
+    
+    def render_docx_bytes(self, blocks: list, with_standard_header: bool = False) -> bytes:
+        """Render resume blocks to deterministic .docx bytes with the configured backend
         
-        # Add the text
-        text_elem = OxmlElement('w:t')
-        text_elem.text = text
-        run.append(text_elem)
+        The direct OOXML writer is used unless RESUME_DOCX_BACKEND=python-docx;
+        python-docx is also the fallback if the writer cannot load its template.
+        """
+        if DOCX_BACKEND == 'ooxml':
+            try:
+                header = self.standard_header_blocks() if with_standard_header else []
+                buffer = io.BytesIO()
+                write_docx(buffer, header + blocks)
+                return buffer.getvalue()
+            except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+                print(f"WARNING: Direct DOCX writer unavailable ({e}) - using python-docx")
+        
+        doc = self.new_resume_document(with_standard_header)
+        self.render_blocks_to_document(doc, blocks)
+        buffer = io.BytesIO()
+        doc.save(buffer)
+        return normalize_docx_package(buffer.getvalue())
+    
+    def new_resume_document(self, with_standard_header: bool = False):
+        """Return a fresh Document cloned from the cached base document
+        
+        The base (margins, and optionally the standard name/contact header) is
+        built and serialized once per process; each render only re-parses it.
+        """
+        from docx import Document
+        from docx.shared import Inches
+        
+        key = 'standard_header' if with_standard_header else 'blank'
+        data = _BASE_DOCUMENT_CACHE.get(key)
+        if data is None:
+            doc = Document()
+            doc.core_properties.created = doc.core_properties.modified = FIXED_CORE_TIMESTAMP
+            
+            # Set up document margins to match original
+            for section in doc.sections:
+                section.top_margin = Inches(0.5)
+                section.bottom_margin = Inches(0.5)
+                section.left_margin = Inches(0.7)
+                section.right_margin = Inches(0.7)
+            
+            self.add_resume_styles(doc)
+            if with_standard_header:
+                self.add_standard_header(doc)
+            
+            buffer = io.BytesIO()
+            doc.save(buffer)
+            data = _BASE_DOCUMENT_CACHE[key] = buffer.getvalue()
+        return Document(io.BytesIO(data))
+    
+    def add_resume_styles(self, doc):
+        """Define the ResumeBody, ResumeHeading and ResumeLink styles if the document lacks them"""
+        from docx.oxml import parse_xml
+        from docx.oxml.ns import nsdecls, qn
+        
+        styles_element = doc.styles.element
+        existing = {style.get(qn('w:styleId')) for style in styles_element.findall(qn('w:style'))}
+        for style_id, style_xml in RESUME_STYLES.items():
+            if style_id not in existing:
+                styles_element.append(parse_xml(style_xml.replace('<w:style ', f'<w:style {nsdecls("w")} ', 1)))
+    
+    def render_blocks_to_document(self, doc, blocks: list):
+        """Append resume blocks to a python-docx Document"""
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+        from docx.shared import Pt, RGBColor
+        
+        self.add_resume_styles(doc)
+        for block in iter_paragraphs(blocks):
+            para = doc.add_paragraph()
+            if block.style:
+                para.style = doc.styles[block.style]
+            for is_link, group in groupby(block.runs, key=lambda run: bool(run.url)):
+                if is_link:
+                    # Add clickable hyperlinks in one call
+                    links = [(run.url, run.text) for run in group]
+                    try:
+                        self.add_hyperlinks(para, links)
+                    except Exception as e:
+                        # Fallback to styled text if hyperlinks fail
+                        print(f"Warning: Could not create hyperlinks for {', '.join(url for url, _ in links)}: {e}")
+                        for url, text in links:
+                            url_run = para.add_run(text)
+                            url_run.font.name = 'Calibri'
+                            url_run.font.size = Pt(12)
+                            url_run.font.color.rgb = RGBColor(0, 0, 255)
+                            url_run.font.underline = True
+                    continue
+                for run in group:
+                    text_run = para.add_run(run.text)
+                    if run.size:
+                        text_run.font.name = 'Calibri'
+                        text_run.font.size = Pt(run.size)
+                    if run.bold:
+                        text_run.bold = True
+            if block.align == 'center':
+                para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    
+    def add_hyperlink(self, paragraph, url, text):
+        """Add a clickable hyperlink to a paragraph"""
+        return self.add_hyperlinks(paragraph, [(url, text)])[0]
+    
+    def add_hyperlinks(self, paragraph, links):
+        """Append clickable hyperlinks for a list of (url, text) pairs to a paragraph
+        
+        Each link is a deep copy of one prebuilt element styled with ResumeLink,
+        and a URL already linked from the same part reuses its relationship id.
+        """
+        global _HYPERLINK_TEMPLATE
+        from docx.oxml import OxmlElement
+        from docx.oxml.ns import qn
+        
+        if _HYPERLINK_TEMPLATE is None:
+            template = OxmlElement('w:hyperlink')
+            run = OxmlElement('w:r')
+            # Blue, underlined Calibri 12pt comes from the ResumeLink character style
+            rPr = OxmlElement('w:rPr')
+            style = OxmlElement('w:rStyle')
+            style.set(qn('w:val'), 'ResumeLink')
+            rPr.append(style)
+            run.append(rPr)
+            run.append(OxmlElement('w:t'))
+            template.append(run)
+            _HYPERLINK_TEMPLATE = template
         
-        hyperlink.append(run)
-        paragraph._p.append(hyperlink)
+        part = paragraph.part
+        rel_ids = _HYPERLINK_REL_IDS.setdefault(part, {})
+        hyperlinks = []
+        for url, text in links:
+            r_id = rel_ids.get(url)
+            if r_id is None:
+                # Create hyperlink relationship
+                r_id = rel_ids[url] = part.relate_to(url, HYPERLINK_RELTYPE, is_external=True)
+            
+            hyperlink = copy.deepcopy(_HYPERLINK_TEMPLATE)
+            hyperlink.set(qn('r:id'), r_id)
+            hyperlink[0][-1].text = text
+            paragraph._p.append(hyperlink)
+            hyperlinks.append(hyperlink)
         
-        return hyperlink
+        return hyperlinks
     
     def build_narrative_docx(self, doc, narrative_content):
         """Build DOCX using narrative storytelling content"""
+        self.render_blocks_to_document(doc, self.build_narrative_blocks(narrative_content))
+    
+    def build_narrative_blocks(self, narrative_content) -> List[DocxParagraph]:
+        """Lay out narrative storytelling content as resume paragraph blocks"""
         
         # Parse narrative content to extract sections
         lines = narrative_content.split('\n')
@@ -3210,24 +3647,17 @@ RECOMMENDED USAGE:
                 elif current_section == 'experience' and line.startswith('•'):
                     sections['experience'].append(line[1:].strip())
         
+        blocks = []
+        blank = DocxParagraph()
+        
         # 1. Opening Hook (if present)
         if sections['hook']:
-            hook_para = doc.add_paragraph()
-            hook_para.style = doc.styles['Title']
-            hook_run = hook_para.add_run(sections['hook'])
-            hook_run.font.name = 'Calibri'
-            hook_run.font.size = Pt(16)
-            hook_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            doc.add_paragraph()
+            blocks.append(DocxParagraph('Title', (DocxRun(sections['hook'], 16),), 'center'))
+            blocks.append(blank)
         
         # 2. NAME
         name = sections['name'] if sections['name'] else "Ryan Thomas Weiler"
-        name_para = doc.add_paragraph()
-        name_para.style = doc.styles['Title']
-        name_run = name_para.add_run(name)
-        name_run.font.name = 'Calibri'
-        name_run.font.size = Pt(26)
-        name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        blocks.append(DocxParagraph('Title', (DocxRun(name, 26),), 'center'))
         
         # 3. CONTACT INFO (NO DUPLICATES)
         contact_text = sections['contact'].strip() if sections['contact'] else "📞 (561) 906-2118 | ✉️ ryan_wlr@yahoo.com"
@@ -3236,9 +3666,7 @@ RECOMMENDED USAGE:
         contact_lines = contact_text.split('\n')
         for contact_line in contact_lines:
             if contact_line.strip():
-                contact_para = doc.add_paragraph()
-                contact_para.style = doc.styles['Normal']
-                contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+                runs = []
                 
                 # Parse line for URLs and create clickable hyperlinks
                 if 'https://' in contact_line:
@@ -3247,12 +3675,10 @@ RECOMMENDED USAGE:
                     
                     # Add text before first URL
                     if parts[0].strip():
-                        contact_run = contact_para.add_run(parts[0])
-                        contact_run.font.name = 'Calibri'
-                        contact_run.font.size = Pt(12)
+                        runs.append(DocxRun(parts[0]))
                     
                     # Process each URL
-                    for i, part in enumerate(parts[1:]):
+                    for part in parts[1:]:
                         # Find where URL ends (space, pipe, or end of string)
                         url_end = len(part)
                         for char_idx, char in enumerate(part):
@@ -3265,224 +3691,133 @@ RECOMMENDED USAGE:
                         remaining_text = part[url_end:]
                         
                         # Add clickable hyperlink
-                        try:
-                            self.add_hyperlink(contact_para, url, url)
-                        except Exception as e:
-                            # Fallback to styled text if hyperlink fails
-                            print(f"Warning: Could not create hyperlink for {url}: {e}")
-                            url_run = contact_para.add_run(url)
-                            url_run.font.name = 'Calibri'
-                            url_run.font.size = Pt(12)
-                            url_run.font.color.rgb = RGBColor(0, 0, 255)
-                            url_run.font.underline = True
+                        runs.append(DocxRun(url, url=url))
                         
                         # Add remaining text after URL
                         if remaining_text.strip():
-                            text_run = contact_para.add_run(remaining_text)
-                            text_run.font.name = 'Calibri'
-                            text_run.font.size = Pt(12)
+                            runs.append(DocxRun(remaining_text))
                 else:
                     # No URLs, just add as regular text
-                    contact_run = contact_para.add_run(contact_line.strip())
-                    contact_run.font.name = 'Calibri'
-                    contact_run.font.size = Pt(12)
+                    runs.append(DocxRun(contact_line.strip()))
+                blocks.append(DocxParagraph('ResumeBody', tuple(runs), 'center'))
         
-        doc.add_paragraph()
+        blocks.append(blank)
         
         # 4. PROFESSIONAL NARRATIVE
         if sections['narrative']:
-            narrative_header = doc.add_paragraph()
-            narrative_header.style = doc.styles['Heading 1']
-            narrative_run = narrative_header.add_run("Professional Narrative")
-            narrative_run.font.name = 'Calibri'
-            narrative_run.font.size = Pt(14)
-            
-            narrative_para = doc.add_paragraph()
-            narrative_para.style = doc.styles['Normal']
-            narrative_text_run = narrative_para.add_run(sections['narrative'].strip())
-            narrative_text_run.font.name = 'Calibri'
-            narrative_text_run.font.size = Pt(12)
-            doc.add_paragraph()
+            blocks.append(DocxParagraph('ResumeHeading', (DocxRun("Professional Narrative"),)))
+            blocks.append(DocxParagraph('ResumeBody', (DocxRun(sections['narrative'].strip()),)))
+            blocks.append(blank)
         
         # 5. TECHNICAL SKILLS
         if sections['skills']:
-            skills_header = doc.add_paragraph()
-            skills_header.style = doc.styles['Heading 1']
-            skills_run = skills_header.add_run("Technical Competencies")
-            skills_run.font.name = 'Calibri'
-            skills_run.font.size = Pt(14)
-            
+            blocks.append(DocxParagraph('ResumeHeading', (DocxRun("Technical Competencies"),)))
             for skill in sections['skills'][:6]:
-                skill_para = doc.add_paragraph()
-                skill_para.style = doc.styles['Normal']
-                skill_run = skill_para.add_run(f"• {skill}")
-                skill_run.font.name = 'Calibri'
-                skill_run.font.size = Pt(12)
-            doc.add_paragraph()
+                blocks.append(DocxParagraph('ResumeBody', (DocxRun(f"• {skill}"),)))
+            blocks.append(blank)
         
         # 6. EDUCATION
-        edu_header = doc.add_paragraph()
-        edu_header.style = doc.styles['Heading 1']
-        edu_run = edu_header.add_run("Education")
-        edu_run.font.name = 'Calibri'
-        edu_run.font.size = Pt(14)
+        blocks.append(DocxParagraph('ResumeHeading', (DocxRun("Education"),)))
         
         # Use extracted education from narrative, or fallback to field data
         if sections['education']:
             for edu_line in sections['education']:
-                edu_para = doc.add_paragraph()
-                edu_para.style = doc.styles['Normal']
-                edu_run = edu_para.add_run(edu_line)
-                edu_run.font.name = 'Calibri'
-                edu_run.font.size = Pt(12)
+                blocks.append(DocxParagraph('ResumeBody', (DocxRun(edu_line),)))
         else:
             # Fallback to actual field data instead of hardcoded education
             detected_field = getattr(self, 'current_detected_field', 'data_scientist')
             field_data = self.get_field_data(detected_field)
-            edu_para = doc.add_paragraph()
-            edu_para.style = doc.styles['Normal']
-            edu_run = edu_para.add_run(field_data['education'])
-            edu_run.font.name = 'Calibri'
-            edu_run.font.size = Pt(12)
-        doc.add_paragraph()
+            blocks.append(DocxParagraph('ResumeBody', (DocxRun(field_data['education']),)))
+        blocks.append(blank)
         
         # 7. EXPERIENCE
         if sections['experience']:
-            exp_header = doc.add_paragraph()
-            exp_header.style = doc.styles['Heading 1']
-            exp_run = exp_header.add_run("Professional Experience")
-            exp_run.font.name = 'Calibri'
-            exp_run.font.size = Pt(14)
-            
+            blocks.append(DocxParagraph('ResumeHeading', (DocxRun("Professional Experience"),)))
             for exp in sections['experience'][:8]:
-                exp_para = doc.add_paragraph()
-                exp_para.style = doc.styles['Normal']
-                exp_run = exp_para.add_run(f"• {exp}")
-                exp_run.font.name = 'Calibri'
-                exp_run.font.size = Pt(12)
-            doc.add_paragraph()
+                blocks.append(DocxParagraph('ResumeBody', (DocxRun(f"• {exp}"),)))
+            blocks.append(blank)
         
         # 8. REFERENCES
-        ref_header = doc.add_paragraph()
-        ref_header.style = doc.styles['Heading 1']
-        ref_run = ref_header.add_run("References")
-        ref_run.font.name = 'Calibri'
-        ref_run.font.size = Pt(14)
-        
-        ref_para = doc.add_paragraph()
-        ref_para.style = doc.styles['Normal']
-        ref_run = ref_para.add_run("Available upon request")
-        ref_run.font.name = 'Calibri'
-        ref_run.font.size = Pt(12)
+        blocks.append(DocxParagraph('ResumeHeading', (DocxRun("References"),)))
+        blocks.append(DocxParagraph('ResumeBody', (DocxRun("Available upon request"),)))
+        return blocks
     
-    def build_standard_docx(self, doc, field_data, results, detected_field):
-        """Build DOCX using standard format with field-specific data"""
-        
-        # 1. NAME (using Title style - 26pt, centered)
-        name_para = doc.add_paragraph()
-        name_para.style = doc.styles['Title']
-        name_run = name_para.add_run("Ryan Thomas Weiler")
-        name_run.font.name = 'Calibri'
-        name_run.font.size = Pt(26)
-        name_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        # 2. CONTACT INFO (centered, Normal style with 12pt font)
-        contact_para = doc.add_paragraph()
-        contact_para.style = doc.styles['Normal']
-        contact_run = contact_para.add_run("📞 (561) 906-2118 | ✉️ ryan_wlr@yahoo.com")
-        contact_run.font.name = 'Calibri'
-        contact_run.font.size = Pt(12)
-        contact_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        
-        social_para = doc.add_paragraph()
-        social_para.style = doc.styles['Normal']
-        social_run = social_para.add_run("🔗 LinkedIn: https://www.linkedin.com/in/ryan-weiler-7a3119190/ | 💻 GitHub: https://github.com/ryan-wlr")
-        social_run.font.name = 'Calibri'
-        social_run.font.size = Pt(12)
-        social_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        doc.add_paragraph()
-        
-        # 3. EDUCATION SECTION (using Heading 1 style - 14pt, bold)
-        edu_header = doc.add_paragraph()
-        edu_header.style = doc.styles['Heading 1']
-        edu_run = edu_header.add_run("Education")
-        edu_run.font.name = 'Calibri'
-        edu_run.font.size = Pt(14)
-        
-        edu_detail = doc.add_paragraph()
-        edu_detail.style = doc.styles['Normal']
-        edu_text_run = edu_detail.add_run(field_data['education'])
-        edu_text_run.font.name = 'Calibri'
-        edu_text_run.font.size = Pt(12)
-        doc.add_paragraph()
-        
-        # 4. EXPERIENCE & PROJECTS SECTION (using Heading 1 style - 14pt)
-        exp_header = doc.add_paragraph()
-        exp_header.style = doc.styles['Heading 1']
-        exp_run = exp_header.add_run("Experience & Projects (Continuous Timeline)")
-        exp_run.font.name = 'Calibri'
-        exp_run.font.size = Pt(14)
-        
-        # Add main experience using dynamic field-specific data
-        experiences = [
-            {
-                'title': field_data['experience_title'],
-                'bullets': field_data['experience_bullets']
-            },
-            {
-                'title': "University Projects & Research",
-                'bullets': field_data['projects']
-            }
+    def standard_header_blocks(self) -> List[DocxParagraph]:
+        """Fixed name, contact and social header of the standard format"""
+        return [
+            # 1. NAME (using Title style - 26pt, centered)
+            DocxParagraph('Title', (DocxRun("Ryan Thomas Weiler", 26),), 'center'),
+            # 2. CONTACT INFO (centered, ResumeBody style - 12pt)
+            DocxParagraph('ResumeBody', (DocxRun("📞 (561) 906-2118 | ✉️ ryan_wlr@yahoo.com"),), 'center'),
+            DocxParagraph('ResumeBody', (DocxRun("🔗 LinkedIn: https://www.linkedin.com/in/ryan-weiler-7a3119190/ | 💻 GitHub: https://github.com/ryan-wlr"),), 'center'),
+            DocxParagraph(),
         ]
+    
+    def add_standard_header(self, doc):
+        """Add the fixed name, contact and social header of the standard format"""
+        self.render_blocks_to_document(doc, self.standard_header_blocks())
+    
+    def build_standard_docx(self, doc, field_data, results, detected_field, include_header=True):
+        """Build DOCX using standard format with field-specific data
         
-        for exp in experiences:
-            # Job title (Normal style, bold, 12pt)
-            job_para = doc.add_paragraph()
-            job_para.style = doc.styles['Normal']
-            job_run = job_para.add_run(exp['title'])
-            job_run.font.name = 'Calibri'
-            job_run.font.size = Pt(12)
-            job_run.bold = True
-            
-            # Bullets (Normal style with proper dash, 12pt)
-            for bullet in exp['bullets']:
-                bullet_para = doc.add_paragraph()
-                bullet_para.style = doc.styles['Normal']
-                bullet_run = bullet_para.add_run(f"- {bullet}")
-                bullet_run.font.name = 'Calibri'
-                bullet_run.font.size = Pt(12)
-        
-        doc.add_paragraph()
-        
-        # 5. SKILLS SECTION (using Heading 1 style - 14pt)
-        skills_header = doc.add_paragraph()
-        skills_header.style = doc.styles['Heading 1']
-        skills_run = skills_header.add_run("Technical Skills")
-        skills_run.font.name = 'Calibri'
-        skills_run.font.size = Pt(14)
-        
-        # Skills content using dynamic field-specific data
-        for skill in field_data['skills']:
-            skill_para = doc.add_paragraph()
-            skill_para.style = doc.styles['Normal']
-            skill_run = skill_para.add_run(f"• {skill}")
-            skill_run.font.name = 'Calibri'
-            skill_run.font.size = Pt(12)
-        
-        doc.add_paragraph()
-        
-        # 6. REFERENCES SECTION (using Heading 1 style - 14pt)
-        ref_header = doc.add_paragraph()
-        ref_header.style = doc.styles['Heading 1']
-        ref_run = ref_header.add_run("References")
-        ref_run.font.name = 'Calibri'
-        ref_run.font.size = Pt(14)
-        
-        ref_para = doc.add_paragraph()
-        ref_para.style = doc.styles['Normal']
-        ref_text_run = ref_para.add_run("Available upon request")
-        ref_text_run.font.name = 'Calibri'
-        ref_text_run.font.size = Pt(12)
+        Pass include_header=False when doc was cloned with the standard header.
+        """
+        self.render_blocks_to_document(doc, self.build_standard_blocks(field_data, include_header))
+    
+    def static_section(self, field: Optional[str], section: str, build_blocks) -> list:
+        """Return a section that depends only on the career field
+        
+        With a field the section is a DocxFragment cached per (field, section),
+        so its XML is rendered once per process; without one the blocks are
+        built inline.
+        """
+        if field is None:
+            return build_blocks()
+        fragment = _STATIC_FRAGMENTS.get((field, section))
+        if fragment is None:
+            fragment = _STATIC_FRAGMENTS[(field, section)] = DocxFragment(('standard', field, section), tuple(build_blocks()))
+        return [fragment]
+    
+    def build_standard_blocks(self, field_data, include_header=True, field: Optional[str] = None) -> list:
+        """Lay out the standard format with field-specific data as paragraph blocks
+        
+        Pass the field that field_data came from to reuse its cached static sections.
+        """
+        blocks = self.standard_header_blocks() if include_header else []
+        blank = DocxParagraph()
+        
+        # 3. EDUCATION SECTION (using ResumeHeading style - 14pt, bold)
+        blocks.extend(self.static_section(field, 'education', lambda: [
+            DocxParagraph('ResumeHeading', (DocxRun("Education"),)),
+            DocxParagraph('ResumeBody', (DocxRun(field_data['education']),)),
+            blank,
+        ]))
+        
+        # 4. EXPERIENCE & PROJECTS SECTION (using ResumeHeading style - 14pt)
+        blocks.append(DocxParagraph('ResumeHeading', (DocxRun("Experience & Projects (Continuous Timeline)"),)))
+        
+        # Main experience: job title (ResumeBody style, bold) and bullets (proper dash)
+        blocks.append(DocxParagraph('ResumeBody', (DocxRun(field_data['experience_title'], bold=True),)))
+        for bullet in field_data['experience_bullets']:
+            blocks.append(DocxParagraph('ResumeBody', (DocxRun(f"- {bullet}"),)))
+        
+        blocks.extend(self.static_section(field, 'projects', lambda: [
+            DocxParagraph('ResumeBody', (DocxRun("University Projects & Research", bold=True),)),
+        ] + [DocxParagraph('ResumeBody', (DocxRun(f"- {bullet}"),)) for bullet in field_data['projects']]))
+        
+        blocks.append(blank)
+        
+        # 5. SKILLS SECTION (using ResumeHeading style - 14pt)
+        blocks.extend(self.static_section(field, 'skills', lambda: [
+            DocxParagraph('ResumeHeading', (DocxRun("Technical Skills"),)),
+        ] + [DocxParagraph('ResumeBody', (DocxRun(f"• {skill}"),)) for skill in field_data['skills']] + [
+            blank,
+        ]))
+        
+        # 6. REFERENCES SECTION (using ResumeHeading style - 14pt)
+        blocks.append(DocxParagraph('ResumeHeading', (DocxRun("References"),)))
+        blocks.append(DocxParagraph('ResumeBody', (DocxRun("Available upon request"),)))
+        return blocks
 
     def browse_for_job_description(self) -> Optional[str]:
         """Open file browser to select job description file with error handling"""
@@ -3516,15 +3851,7 @@ RECOMMENDED USAGE:
                 
                 # Read file content based on extension
                 try:
-                    if file_path.lower().endswith('.txt'):
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                    elif file_path.lower().endswith('.docx') and HAS_DOCX:
-                        doc = Document(file_path)
-                        content = '\n'.join([paragraph.text for paragraph in doc.paragraphs])
-                    else:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
+                    content = read_document_text(file_path)
                     
                     print(f"Loaded {len(content)} characters from job description")
                     return content
@@ -3575,17 +3902,9 @@ RECOMMENDED USAGE:
             if file_path:
                 print(f"Selected resume: {os.path.basename(file_path)}")
                 
-                # Read file content based on extension
+                # Read file content through the parse cache (parsed once per file version)
                 try:
-                    if file_path.lower().endswith('.docx') and HAS_DOCX:
-                        doc = Document(file_path)
-                        content = '\n'.join([paragraph.text for paragraph in doc.paragraphs])
-                    elif file_path.lower().endswith('.txt'):
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                    else:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
+                    content = self.load_resume_file(file_path)
                     
                     print(f"Loaded {len(content)} characters from resume")
                     return content
@@ -3691,7 +4010,7 @@ Familiar with Django, Flask, pandas, and algorithmic trading systems."""
         )
         
         # Save results
-        output_dir = f"resume_optimization_output_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        output_dir = unique_output_dir("resume_optimization_output", self.run_info.get('job_sha256', ''))
         self.save_results_to_files(results, output_dir)
         
         # Open output directory if possible
@@ -3706,7 +4025,126 @@ Familiar with Django, Flask, pandas, and algorithmic trading systems."""
             print(f">>> Manually open the '{output_dir}' folder to view results.")
 
 
+def read_stdin_text() -> str:
+    """Read the whole of stdin in one call and decode it"""
+    return decode_text_bytes(sys.stdin.buffer.read())
+
+
+def iter_stdin_records(data: bytes, fields_per_record: int = 2):
+    """Split a NUL-delimited stream into records of decoded fields
+    
+    A trailing NUL after the last field is optional. An incomplete final
+    record raises ValueError after the complete records have been yielded.
+    """
+    fields = data.split(b'\0')
+    if fields and fields[-1] == b'':
+        fields.pop()
+    for start in range(0, len(fields) - fields_per_record + 1, fields_per_record):
+        yield tuple(decode_text_bytes(field) for field in fields[start:start + fields_per_record])
+    if len(fields) % fields_per_record:
+        raise ValueError(f"Incomplete record at end of input ({len(fields) % fields_per_record} of {fields_per_record} fields)")
+
+
+def parse_export_formats(value: str) -> tuple:
+    """argparse type for --formats: 'md,html' -> ('md', 'html')"""
+    formats = tuple(dict.fromkeys(fmt.strip().lower().lstrip('.') for fmt in value.split(',') if fmt.strip()))
+    unknown = [fmt for fmt in formats if fmt not in EXPORT_FORMATS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown format(s) {', '.join(unknown)}; choose from {', '.join(EXPORT_FORMATS)}")
+    return formats
+
+
+def export_stored_run(store_dir: str, directory: str, run_id: Optional[int] = None) -> int:
+    """Materialize a run from the artifact store (the latest one by default) as a folder"""
+    if not os.path.exists(os.path.join(store_dir, STORE_INDEX_NAME)):
+        print(f"ERROR: No artifact store at {store_dir}")
+        return 1
+    with ArtifactStore(store_dir) as store:
+        if run_id is None:
+            latest = store.latest_run()
+            if latest is None:
+                print(f"ERROR: Artifact store {store_dir} has no runs")
+                return 1
+            run_id = latest['id']
+        try:
+            paths = store.export(run_id, directory)
+        except KeyError as e:
+            print(f"ERROR: {e.args[0]}")
+            return 1
+    print(f">>> Exported run {run_id} from {store_dir} to {directory} ({len(paths)} files)")
+    return 0
+
+
+def run_stdin_batch(optimizer: 'ResumeOptimizer', args) -> int:
+    """Optimize every NUL-delimited job/resume pair read from stdin in this process"""
+    data = sys.stdin.buffer.read()
+    
+    if args.resume:
+        # One resume for every posting: stdin carries job descriptions only
+        resume_content = optimizer.load_resume_file(args.resume) if os.path.isfile(args.resume) else args.resume
+        pairs = ((job, resume_content) for (job,) in iter_stdin_records(data, 1))
+    else:
+        pairs = iter(iter_stdin_records(data, 2))
+    
+    # One timestamp + hash stem per batch, so concurrent batches never share folders
+    batch_stem = unique_output_dir(args.output)
+    processed = 0
+    if args.render_jobs:
+        # Opt-in: DOCX files render in worker processes while the next records are optimized
+        from docx_render_farm import DocxRenderFarm
+        optimizer.render_farm = DocxRenderFarm(args.render_jobs)
+    failed = 0
+    bad_input = False
+    index = 0
+    try:
+        while True:
+            # Only reading the next record can mean malformed input
+            try:
+                job_description, resume_content = next(pairs)
+            except StopIteration:
+                break
+            except ValueError as e:
+                print(f"ERROR: {e}")
+                bad_input = True
+                break
+            index += 1
+            if not job_description.strip() or not resume_content.strip():
+                print(f"WARNING: Skipping record {index} - empty job description or resume")
+                continue
+            print(f"\n>>> STDIN RECORD {index}: {len(job_description)} chars job, {len(resume_content)} chars resume")
+            # A failing record is reported and the batch moves on to the next one
+            try:
+                results = optimizer.process_complete_optimization(
+                    job_description, resume_content, args.role, args.company, args.style or '3'
+                )
+                output_dir = f"{batch_stem}_{index:03d}"
+                saved = optimizer.save_results_to_files(results, output_dir, args.formats, args.bundle)
+            except Exception as e:
+                print(f"ERROR: Record {index} failed: {type(e).__name__}: {e}")
+                failed += 1
+                continue
+            if saved is None:
+                failed += 1
+                continue
+            processed += 1
+    finally:
+        if optimizer.render_farm is not None:
+            optimizer.render_farm.close()
+            optimizer.render_farm = None
+    
+    print(f"\n>>> STDIN BATCH COMPLETE: {processed} optimizations, {failed} failed")
+    return 1 if failed or bad_input else 0
+
+
 def main():
+    # Bulk subcommands are dispatched before the single-job argument parser
+    if len(sys.argv) > 1 and sys.argv[1] == 'ingest':
+        from resume_ingest import run_ingest_command
+        return run_ingest_command(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == 'watch':
+        from resume_watch import run_watch_command
+        return run_watch_command(sys.argv[2:])
+    
     parser = argparse.ArgumentParser(description='AI-Powered Resume Optimizer')
     parser.add_argument('job_description', nargs='?', 
                        help='Job description text or file path')
@@ -3723,45 +4161,94 @@ def main():
                        help='Output directory')
     parser.add_argument('--browse', '-b', action='store_true',
                        help='Use interactive file browser mode')
+    parser.add_argument('--stdin', action='store_true',
+                       help='Read NUL-separated job/resume pairs from stdin (job descriptions only if --resume is given)')
+    parser.add_argument('--style', choices=['1', '2', '3'],
+                       help='Resume style (1=story, 2=standard, 3=both); skips the style prompt')
+    parser.add_argument('--render-jobs', type=int, default=None,
+                       help='Render DOCX files in N worker processes in --stdin mode (default: render inline)')
+    parser.add_argument('--max-pages', type=int, default=None,
+                       help='Trim the lowest-priority bullets until each DOCX resume is estimated to fit this many pages')
+    parser.add_argument('--bundle', action='store_true',
+                       help='Write each run as a single .zip with a manifest instead of a folder of files')
+    parser.add_argument('--formats', type=parse_export_formats, default=(),
+                       help=f"Also write each resume as these formats, comma-separated ({','.join(EXPORT_FORMATS)})")
+    parser.add_argument('--store', nargs='?', const=DEFAULT_STORE_DIR, default=None, metavar='DIR',
+                       help=f'Keep runs in a deduplicated artifact store instead of timestamped folders (default: {DEFAULT_STORE_DIR})')
+    parser.add_argument('--export', metavar='DIR',
+                       help='Write a stored run out as a folder of files and exit (see --run)')
+    parser.add_argument('--run', type=int, default=None,
+                       help='Run id for --export (default: the latest stored run)')
     
     args = parser.parse_args()
     
+    if args.stdin and '-' in (args.job_description, args.resume):
+        parser.error("--stdin already reads every record from stdin; give --resume as a file or text, not -")
+    if args.job_description == '-' and args.resume == '-':
+        parser.error("only one of the job description and --resume can be read from stdin")
+    if args.resume == '-' and not args.job_description:
+        parser.error("--resume - needs a job description argument (interactive mode also reads stdin)")
+    if args.store and args.bundle:
+        parser.error("--store keeps runs in the artifact store, not bundles; use --store DIR --export DIR to get a folder")
+    
+    if args.export:
+        return export_stored_run(args.store or DEFAULT_STORE_DIR, args.export, args.run)
+    
     print(">>> AI-POWERED RESUME OPTIMIZER")
     print("    Creating ATS-optimized, recruiter-friendly resumes with .docx output")
     print("    Compatible with Windows console")
     print()
     
-    optimizer = ResumeOptimizer()
-    
+    # The persistent parse cache is for command-line runs; library users pass their own
+    optimizer = ResumeOptimizer(parse_cache=ResumeParseCache())
+    optimizer.max_pages = args.max_pages
+    optimizer.run_index = RunIndex()
+    if not args.store:
+        return run_cli(optimizer, args)
+    # The store's SQLite connection is released however the run ends
+    optimizer.artifact_store = ArtifactStore(args.store)
+    with optimizer.artifact_store:
+        return run_cli(optimizer, args)
+
+
+def run_cli(optimizer: 'ResumeOptimizer', args) -> Optional[int]:
+    """Run the mode selected on the command line with a configured optimizer"""
     # Handle different modes
     if args.browse:
         optimizer.run_browse_mode()
         return
     
-    # Command line file handling
-    if args.job_description and os.path.isfile(args.job_description):
+    if args.stdin:
+        return run_stdin_batch(optimizer, args)
+    
+    # Command line file handling ('-' reads the whole of stdin in one call)
+    if args.job_description == '-':
+        job_description = read_stdin_text()
+        print(f">>> Read job description from stdin: {len(job_description)} characters")
+    elif args.job_description and os.path.isfile(args.job_description):
         print(f">>> Reading job description from file: {args.job_description}")
         try:
-            with open(args.job_description, 'r', encoding='utf-8') as f:
-                job_description = f.read()
+            job_description = read_document_text(args.job_description)
             print(f"    Loaded {len(job_description)} characters")
         except Exception as e:
             print(f"ERROR: Failed to read job description file: {e}")
-            return
+            return 1
     elif args.job_description:
         job_description = args.job_description
     else:
         job_description = None
         
-    if args.resume and os.path.isfile(args.resume):
+    if args.resume == '-':
+        resume_content = read_stdin_text()
+        print(f">>> Read resume from stdin: {len(resume_content)} characters")
+    elif args.resume and os.path.isfile(args.resume):
         print(f">>> Reading resume from file: {args.resume}")
         try:
-            with open(args.resume, 'r', encoding='utf-8') as f:
-                resume_content = f.read()
+            resume_content = optimizer.load_resume_file(args.resume)
             print(f"    Loaded {len(resume_content)} characters")
         except Exception as e:
             print(f"ERROR: Failed to read resume file: {e}")
-            return
+            return 1
     elif args.resume:
         resume_content = args.resume
     else:
@@ -3889,28 +4376,39 @@ Skills:
     # Validate that we have both job description and resume
     if not job_description or not job_description.strip():
         print("ERROR: Job description is required.")
-        return
+        return 1
         
     if not resume_content or not resume_content.strip():
         print("ERROR: Resume content is required.")
-        return
+        return 1
     
-    # Process optimization
+    # Process optimization (stdin is consumed, so the style prompt can't be answered)
+    style_choice = args.style
+    if style_choice is None and '-' in (args.job_description, args.resume):
+        style_choice = '3'
     results = optimizer.process_complete_optimization(
-        job_description, resume_content, args.role, args.company
+        job_description, resume_content, args.role, args.company, style_choice
     )
     
     # Save results with timestamp
-    output_dir = f"{args.output}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    optimizer.save_results_to_files(results, output_dir)
+    output_dir = unique_output_dir(args.output, optimizer.run_info.get('job_sha256', ''))
+    output_dir = optimizer.save_results_to_files(results, output_dir, args.formats, args.bundle)
+    if output_dir is None:
+        print("ERROR: Results could not be saved")
+        return 1
     
     print(f"\n>>> OPTIMIZATION COMPLETE!")
     print(f"    Results saved to: {output_dir}")
     print(f"    Files created: 8 analysis files + 1 formatted .docx resume")
-    print(f"    Open the folder to view your optimized resume!")
+    if args.store:
+        print(f"    Write the run out as a folder with: --store {args.store} --export DIR")
+    else:
+        print(f"    Open the {'bundle' if args.bundle else 'folder'} to view your optimized resume!")
 
 def build_narrative_docx(self, doc, narrative_content):
     """Build DOCX using narrative storytelling content"""
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Pt
     
     # Parse narrative content to extract sections
     lines = narrative_content.split('\n')
@@ -4062,6 +4560,8 @@ def build_narrative_docx(self, doc, narrative_content):
 
 def build_standard_docx(self, doc, field_data, results, detected_field):
     """Build DOCX using standard format with field-specific data"""
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.shared import Pt
     
     # 1. NAME (using Title style - 26pt, centered)
     name_para = doc.add_paragraph()
@@ -4176,4 +4676,4 @@ def build_standard_docx(self, doc, field_data, results, detected_field):
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
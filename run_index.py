@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Run Index - Append-only log of optimization runs, so tools stop scanning for output folders
+
+The command line, browse and watch modes attach a RunIndex to the optimizer,
+and save_results_to_files() then appends one JSON line per run to
+resume_runs.jsonl in the working directory: where the run went (folder,
+bundle or artifact store), when, and the role, company, style and career
+field it was optimized for. Bulk ingests log their JSON lines output as kind
+'ingest'. The check scripts and ats_analysis.py ask the index for the
+latest run instead of listing the working directory and sorting every
+browse_mode_output_* name.
+
+The index is read backwards from its end, so latest() reads one block no
+matter how many runs are logged; field and company queries stop at the first
+match. Runs from before the index existed are still found by
+latest_output_folder(), which falls back to the old directory scan.
+
+    index = RunIndex()
+    run = index.latest(field='data_scientist')
+    print(run['path'], run['company'])
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+RUN_INDEX_NAME = 'resume_runs.jsonl'
+
+# Bytes read per step when walking the index from its end
+READ_BLOCK_SIZE = 8192
+
+
+class RunIndex:
+    """JSONL log of runs with newest-first queries"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.environ.get('RESUME_RUN_INDEX') or RUN_INDEX_NAME
+
+    def append(self, path: str, kind: str = 'folder', **details) -> Dict:
+        """Log a run written to path; details are stored as given (role, company, style, field, ...)"""
+        record = dict({'path': os.path.abspath(path), 'kind': kind,
+                       'created': datetime.now().isoformat(timespec='seconds')}, **details)
+        line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # A single O_APPEND write keeps lines from concurrent runs whole
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+        finally:
+            os.close(fd)
+        return record
+
+    def _reverse_lines(self) -> Iterator[bytes]:
+        """Index lines from last to first, read in blocks from the end of the file"""
+        try:
+            f = open(self.path, 'rb')
+        except OSError:
+            return
+        with f:
+            position = f.seek(0, os.SEEK_END)
+            remainder = b''
+            while position > 0:
+                step = min(READ_BLOCK_SIZE, position)
+                position -= step
+                f.seek(position)
+                lines = (f.read(step) + remainder).split(b'\n')
+                remainder = lines.pop(0)
+                for line in reversed(lines):
+                    if line.strip():
+                        yield line
+            if remainder.strip():
+                yield remainder
+
+    def runs(self, **filters) -> Iterator[Dict]:
+        """Runs newest first whose fields equal every filter value"""
+        for line in self._reverse_lines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # a torn or hand-edited line
+            if all(record.get(key) == value for key, value in filters.items()):
+                yield record
+
+    def latest(self, prefix: Optional[str] = None, existing: bool = True, **filters) -> Optional[Dict]:
+        """Newest run matching filters (and whose output name starts with prefix), or None
+
+        existing=True skips runs whose output has since been deleted.
+        """
+        for record in self.runs(**filters):
+            if prefix and not os.path.basename(record['path']).startswith(prefix):
+                continue
+            if existing and not os.path.exists(record['path']):
+                continue
+            return record
+        return None
+
+    def by_field(self, field: str, limit: Optional[int] = None) -> List[Dict]:
+        return self._take(self.runs(field=field), limit)
+
+    def by_company(self, company: str, limit: Optional[int] = None) -> List[Dict]:
+        return self._take(self.runs(company=company), limit)
+
+    @staticmethod
+    def _take(records: Iterator[Dict], limit: Optional[int]) -> List[Dict]:
+        taken = []
+        for record in records:
+            if limit is not None and len(taken) >= limit:
+                break
+            taken.append(record)
+        return taken
+
+
+def latest_output_folder(prefix: str = 'browse_mode_output_', directory: str = '.') -> Optional[str]:
+    """Newest output folder named prefix*, from the run index or (for older runs) a directory scan"""
+    record = RunIndex(os.path.join(directory, RUN_INDEX_NAME)).latest(prefix=prefix, kind='folder')
+    if record is not None:
+        return record['path']
+    folders = [f for f in os.listdir(directory) if f.startswith(prefix) and os.path.isdir(os.path.join(directory, f))]
+    return os.path.normpath(os.path.join(directory, sorted(folders)[-1])) if folders else None
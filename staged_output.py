@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Staged Output - Publish a run's output folder all at once, or not at all
+
+save_results_to_files() used to create the output folder first and then write
+each file into it, so a crash mid-run left a half-written folder that the
+check scripts would happily pick up as the latest run. StagedOutput writes
+everything into a hidden .staging_* sibling instead: text files go through a
+small thread pool, DOCX renders land there as usual, and on commit every file
+is fsynced in the same pool, the staging directory is fsynced once, and it is
+renamed to the final name in one step. If anything failed the staging
+directory is removed and nothing is published.
+
+Renders queued on a DocxRenderFarm are held with hold()/release(); the folder
+is published when the last of them has been written, and on_commit runs then.
+flush() waits for the queued text writes so failures can be reported before
+anything claims success.
+
+unique_output_dir() names folders with a timestamp plus a short hash of the
+process, the clock and the run inputs, so parallel batch workers starting in
+the same second never share a folder.
+"""
+
+import hashlib
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+# Threads writing and syncing the files of one run
+WRITE_WORKERS = 4
+
+STAGING_PREFIX = '.staging_'
+
+
+def unique_output_dir(prefix: str, salt: str = '') -> str:
+    """prefix_YYYYMMDD_HHMMSS_<8 hex>; the hash covers pid, nanosecond clock and salt"""
+    token = hashlib.sha256(f"{os.getpid()}:{time.time_ns()}:{salt}".encode('utf-8')).hexdigest()[:8]
+    return f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{token}"
+
+
+def _write_file(path: str, data: bytes):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def _fsync_file(path: str):
+    with open(path, 'rb') as f:
+        os.fsync(f.fileno())
+
+
+def _fsync_directory(path: str):
+    """Persist a directory's entries (not supported on Windows, where it is skipped)"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class StagedOutput:
+    """Hidden staging folder that is renamed to final_dir once every file is written"""
+
+    def __init__(self, final_dir: str, workers: int = WRITE_WORKERS):
+        self.final_dir = final_dir
+        parent, name = os.path.split(os.path.abspath(final_dir))
+        self.staging_dir = os.path.join(parent, f"{STAGING_PREFIX}{name}_{os.getpid()}")
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+        os.makedirs(self.staging_dir)
+        self.committed = False
+        self.errors: Dict[str, str] = {}
+        # Called once the folder has been published (possibly from a render callback)
+        self.on_commit: Optional[Callable[[], None]] = None
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._writes: Dict[str, object] = {}
+        self._held = 0
+        self._closed = False
+
+    def write_text(self, filename: str, text: str):
+        self.write_bytes(filename, text.encode('utf-8'))
+
+    def write_bytes(self, filename: str, data: bytes):
+        """Queue a file write into the staging folder"""
+        self._writes[filename] = self._pool.submit(_write_file, os.path.join(self.staging_dir, filename), data)
+
+    def flush(self) -> Dict[str, str]:
+        """Wait for the queued writes; returns {filename: error} for those that failed"""
+        failed = {}
+        for filename, future in self._writes.items():
+            error = future.exception()
+            if error is not None:
+                failed[filename] = str(error)
+        self._writes.clear()
+        self.errors.update(failed)
+        return failed
+
+    def hold(self):
+        """Delay publishing until a matching release() (a render still in flight)"""
+        self._held += 1
+
+    def release(self):
+        self._held -= 1
+        if self._closed and self._held == 0:
+            self._commit()
+
+    def close(self) -> bool:
+        """Publish now, or as soon as held renders finish; returns True once published"""
+        self._closed = True
+        if self._held == 0:
+            self._commit()
+        return self.committed
+
+    def abort(self):
+        """Discard everything staged"""
+        self._closed = True
+        self._pool.shutdown(wait=True)
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+
+    def _commit(self):
+        # Failures an earlier flush() returned have already been reported by its caller
+        failed = self.flush()
+        if self.errors:
+            for filename, error in failed.items():
+                print(f"    ERROR: Failed to save {filename}: {error}")
+            print(f"ERROR: Output not published to {self.final_dir}")
+            self.abort()
+            return
+
+        # One sync pass over everything staged, including DOCX files written directly
+        paths = [os.path.join(self.staging_dir, name) for name in os.listdir(self.staging_dir)]
+        list(self._pool.map(_fsync_file, paths))
+        self._pool.shutdown(wait=True)
+        _fsync_directory(self.staging_dir)
+
+        if os.path.isdir(self.final_dir):
+            self._merge_into_existing(paths)
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(self.final_dir)), exist_ok=True)
+            os.rename(self.staging_dir, self.final_dir)
+        _fsync_directory(os.path.dirname(os.path.abspath(self.final_dir)))
+        self.committed = True
+        if self.on_commit is not None:
+            self.on_commit()
+
+    def _merge_into_existing(self, paths: List[str]):
+        """Saving into a folder that already exists: replace its files one by one"""
+        for path in paths:
+            os.replace(path, os.path.join(self.final_dir, os.path.basename(path)))
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+        _fsync_directory(self.final_dir)
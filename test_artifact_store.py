@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Test the content-addressed artifact store"""
+
+import sys
+import os
+import io
+import contextlib
+import tempfile
+import shutil
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import resume_windows
+from resume_windows import ResumeOptimizer, export_stored_run
+from render_cache import RenderCache
+from artifact_store import ArtifactStore, content_sha256
+
+JOB = "Seeking a data scientist with Python, SQL and machine learning experience."
+RESUME = "Jane Q Public\nSkills: Python, SQL\nEducation: Example University, 2012"
+
+
+def test_blobs_are_deduplicated():
+    """Identical content is stored once and runs are indexed newest first"""
+    print("🔍 Testing blob deduplication and run index...")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        with ArtifactStore(temp_dir) as store:
+            first = store.add_run([('a.txt', b'shared'), ('b.txt', b'one')], role='Welder', company='Acme', style='2')
+            second = store.add_run([('a.txt', b'shared'), ('b.txt', b'two')], role='Welder', company='Globex', style='2')
+            assert (store.new_blobs, store.reused_blobs) == (3, 1)
+
+            sha = content_sha256(b'shared')
+            assert store.blob_path(sha) == os.path.join(temp_dir, 'blobs', sha[:2], sha)
+            assert store.read_blob(sha) == b'shared'
+
+            assert [run['id'] for run in store.runs()] == [second, first]
+            assert store.latest_run()['company'] == 'Globex'
+            assert store.latest_run(company='Acme')['id'] == first
+            assert store.runs(company='Nobody') == []
+            assert [f['name'] for f in store.run_files(first)] == ['a.txt', 'b.txt']
+            assert store.stats() == {'runs': 2, 'files': 4, 'blobs': 3, 'bytes': 12}
+            try:
+                store.runs(salary='high')
+                assert False, "unknown filter should raise"
+            except ValueError:
+                pass
+
+            out = os.path.join(temp_dir, 'export')
+            paths = store.export(first, out)
+            with open(os.path.join(out, 'b.txt'), 'rb') as f:
+                assert f.read() == b'one'
+            assert len(paths) == 2
+            # Exports are copies, so editing one cannot change the shared blob
+            with open(paths[1], 'r+b') as f:
+                f.write(b'ONE')
+            assert store.read_blob(store.run_files(first)[1]['sha256']) == b'one'
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ Blobs are stored once per content")
+
+
+def test_pipeline_stores_and_exports_runs():
+    """--store keeps runs in the store and --export writes the same files a folder run has"""
+    print("🔍 Testing stored optimization runs...")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        store_dir = os.path.join(temp_dir, 'store')
+        with contextlib.redirect_stdout(io.StringIO()):
+            optimizer = ResumeOptimizer(render_cache=RenderCache(os.path.join(temp_dir, 'cache')))
+            results = optimizer.process_complete_optimization(JOB, RESUME, "data scientist", "Acme", '2')
+            folder = optimizer.save_results_to_files(results, os.path.join(temp_dir, 'folder_run'))
+
+            optimizer.artifact_store = ArtifactStore(store_dir)
+            for company in ("Acme", "Globex"):
+                results = optimizer.process_complete_optimization(JOB, RESUME, "data scientist", company, '2')
+                label = optimizer.save_results_to_files(results, os.path.join(temp_dir, 'unused'))
+        assert label == f"{store_dir} (run 2)"
+        assert not os.path.exists(os.path.join(temp_dir, 'unused'))
+
+        store = optimizer.artifact_store
+        run = store.latest_run()
+        assert (run['company'], run['style'], run['field']) == ("Globex", "2", optimizer.current_detected_field)
+        assert run['job_sha256'] == content_sha256(JOB.encode('utf-8'))
+        stats = store.stats()
+        assert stats['blobs'] < stats['files']  # the standard DOCX and company-free reports are shared
+        print(f"   2 runs: {stats['files']} files in {stats['blobs']} blobs")
+
+        export_dir = os.path.join(temp_dir, 'exported')
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert export_stored_run(store_dir, export_dir, run_id=1) == 0
+            assert export_stored_run(store_dir, export_dir, run_id=99) == 1
+            assert export_stored_run(os.path.join(temp_dir, 'missing'), export_dir) == 1
+        folder_files = sorted(f for f in os.listdir(folder) if not f.endswith('.render-hash'))
+        assert sorted(os.listdir(export_dir)) == folder_files
+        for name in folder_files:
+            if name.endswith('.docx'):
+                with open(os.path.join(folder, name), 'rb') as a, open(os.path.join(export_dir, name), 'rb') as b:
+                    assert a.read() == b.read(), name
+        store.close()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ Stored runs export back to ordinary folders")
+
+
+def test_main_closes_the_store():
+    """The command line run closes the store's SQLite connection when it ends"""
+    print("🔍 Testing artifact store cleanup in main()...")
+    temp_dir = tempfile.mkdtemp()
+    opened = []
+
+    class TrackedStore(ArtifactStore):
+        def __init__(self, root=None):
+            super().__init__(root)
+            opened.append(self)
+
+    original = (resume_windows.ArtifactStore, sys.argv, sys.stdin, os.getcwd())
+    try:
+        resume_windows.ArtifactStore = TrackedStore
+        sys.argv = ['resume_windows.py', '--stdin', '--style', '2', '--store', os.path.join(temp_dir, 'store')]
+        sys.stdin = io.TextIOWrapper(io.BytesIO(f"{JOB}\0{RESUME}\0".encode('utf-8')))
+        os.chdir(temp_dir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert resume_windows.main() == 0
+    finally:
+        resume_windows.ArtifactStore, sys.argv, sys.stdin = original[:3]
+        os.chdir(original[3])
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    assert len(opened) == 1 and opened[0]._conn is None
+    print("✅ The store is closed after the run")
+
+
+def test_store_rejects_bundle():
+    """--store with --bundle is a usage error rather than a silently ignored flag"""
+    print("🔍 Testing --store --bundle rejection...")
+    temp_dir = tempfile.mkdtemp()
+    original = (sys.argv, sys.stderr)
+    try:
+        sys.argv = ['resume_windows.py', JOB, '--resume', RESUME, '--style', '2',
+                    '--store', os.path.join(temp_dir, 'store'), '--bundle']
+        sys.stderr = io.StringIO()
+        try:
+            resume_windows.main()
+            assert False, "expected a usage error"
+        except SystemExit as e:
+            assert e.code == 2
+        assert '--store keeps runs in the artifact store' in sys.stderr.getvalue()
+        assert os.listdir(temp_dir) == []
+    finally:
+        sys.argv, sys.stderr = original
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ --store --bundle rejected")
+
+
+if __name__ == "__main__":
+    test_blobs_are_deduplicated()
+    test_pipeline_stores_and_exports_runs()
+    test_main_closes_the_store()
+    test_store_rejects_bundle()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Test batch ATS scoring of every run under a directory"""
+
+import sys
+import os
+import io
+import csv
+import json
+import contextlib
+import subprocess
+import tempfile
+import shutil
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ats_analysis import RESUME_TEXT_FILES, discover_runs, main, score_resume
+from artifact_store import ArtifactStore
+from resume_windows import RESULT_FILES, ResumeOptimizer
+from render_cache import RenderCache
+
+JOB = "Seeking a data analyst with SQL, Python and dashboard experience."
+RESUME = "Jane Q Public\nSkills: Python, SQL\nEducation: Example University, 2012"
+
+
+def make_runs(root):
+    """Two folders (one nested), one bundle and one artifact-store run, plus entries that are not runs"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        optimizer = ResumeOptimizer(render_cache=RenderCache(os.path.join(root, '.cache')))
+        results = optimizer.process_complete_optimization(JOB, RESUME, "data analyst", "Acme", '3')
+        optimizer.save_results_to_files(results, os.path.join(root, 'browse_mode_output_a'))
+        optimizer.save_results_to_files(results, os.path.join(root, 'browse_mode_output_b'), bundle=True)
+        optimizer.artifact_store = ArtifactStore(os.path.join(root, 'resume_artifacts'))
+        optimizer.save_results_to_files(results, os.path.join(root, 'stored'))
+        optimizer.artifact_store.close()
+    # Runs filed away in nested folders are found too
+    shutil.copytree(os.path.join(root, 'browse_mode_output_a'), os.path.join(root, 'archive', '2024', 'run_c'))
+    os.makedirs(os.path.join(root, 'empty_folder'))
+    with open(os.path.join(root, 'notes.txt'), 'w', encoding='utf-8') as f:
+        f.write("not a run")
+    return results
+
+
+def test_discover_runs():
+    """Folders, bundles and stored runs are found; other entries are ignored"""
+    print("🔍 Testing run discovery...")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        make_runs(temp_dir)
+        runs = discover_runs(temp_dir)
+        assert [(run['run'], run['kind']) for run in runs] == [
+            (os.path.join('archive', '2024', 'run_c'), 'folder'), ('browse_mode_output_a', 'folder'),
+            ('browse_mode_output_b.zip', 'bundle'), ('resume_artifacts#1', 'store')], runs
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ Every kind of run is discovered")
+
+
+def test_batch_report_matches_single_scores():
+    """--all writes the same rows with one or several workers, scored like score_resume"""
+    print("🔍 Testing ats_analysis --all...")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        results = make_runs(temp_dir)
+        reports = {}
+        for jobs in (1, 2):
+            prefix = os.path.join(temp_dir, f"report_{jobs}")
+            with contextlib.redirect_stdout(io.StringIO()):
+                assert main(['--all', temp_dir, '--jobs', str(jobs), '--report', prefix]) == 0
+            with open(f"{prefix}.csv", encoding='utf-8', newline='') as f:
+                rows = list(csv.DictReader(f))
+            with open(f"{prefix}.json", encoding='utf-8') as f:
+                reports[jobs] = json.load(f)
+            assert len(rows) == len(reports[jobs]['rows'])
+
+        assert reports[1]['rows'] == reports[2]['rows'] and reports[1]['aggregate'] == reports[2]['aggregate']
+        rows = reports[1]['rows']
+        assert {row['kind'] for row in rows} == {'folder', 'bundle', 'store'}
+
+        expected = {RESULT_FILES[key]: score_resume(text).score for key, text in results.items()
+                    if RESULT_FILES.get(key) in RESUME_TEXT_FILES}
+        for row in rows:
+            assert row['score'] == expected[row['file']], row
+        assert len(rows) == 4 * len(expected)
+
+        aggregate = reports[1]['aggregate']
+        assert aggregate['all']['count'] == len(rows)
+        assert sum(aggregate['all']['histogram'].values()) == len(rows)
+        assert sum(aggregate['all']['levels'].values()) == len(rows)
+        assert aggregate['by_file'][RESUME_TEXT_FILES[0]]['count'] == 4
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ Batch report matches per-resume scores")
+
+
+def test_exit_status():
+    """The command exits non-zero when there is nothing to score"""
+    print("🔍 Testing --all exit status...")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'ats_analysis.py')
+        completed = subprocess.run([sys.executable, script, '--all', temp_dir], cwd=temp_dir,
+                                   capture_output=True, text=True)
+        assert completed.returncode == 1 and "No runs found" in completed.stdout
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ Empty roots exit with status 1")
+
+
+if __name__ == "__main__":
+    test_discover_runs()
+    test_batch_report_matches_single_scores()
+    test_exit_status()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Test the quiet ATS scoring API and best-variant selection"""
+
+import sys
+import os
+import io
+import contextlib
+import atexit
+import tempfile
+import shutil
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Renders go to a throwaway cache, never the shared ~/.resume_optimizer one
+os.environ['RESUME_RENDER_CACHE'] = tempfile.mkdtemp(prefix='render_cache_')
+atexit.register(shutil.rmtree, os.environ['RESUME_RENDER_CACHE'], True)
+
+from ats_analysis import AtsReport, analyze_ats_compatibility, print_ats_report, score_resume
+from resume_windows import RESULT_FILES, ResumeOptimizer
+
+RESUME_TEXT = ("Jane Doe\nEmail: jane@example.com\n\nExperience\n• Led 4 projects over 3 years\n"
+               "• Cut costs 20%\n\nEducation\nState University\n\nSkills\nPython, SQL\n")
+JOB = "Seeking a data analyst with SQL, Python and dashboard experience."
+RESUME = "Jane Q Public\nSkills: Python, SQL\nEducation: Example University, 2012"
+
+
+def test_score_resume_is_quiet_and_structured():
+    """score_resume returns an AtsReport and prints nothing"""
+    print("🔍 Testing score_resume...")
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        report = score_resume(RESUME_TEXT)
+    assert output.getvalue() == ""
+    assert isinstance(report, AtsReport)
+    assert report.sections == {'contact': True, 'experience': True, 'education': True, 'skills': True}
+    assert (report.bullet_count, report.metric_count, report.emoji_count) == (2, 1, 0)  # "3 years" has a space
+    assert report.score == 100 and report.compatibility == "EXCELLENT"
+    assert report.issues == [] and "Has skills section" in report.strengths
+
+    empty = score_resume("")
+    assert empty.word_count == 0 and empty.keyword_density == 0 and empty.compatibility == "POOR"
+    print("✅ score_resume is silent and structured")
+
+
+def test_presenter_matches_report():
+    """analyze_ats_compatibility prints the report and returns the legacy tuple"""
+    print("🔍 Testing the ATS presenter...")
+    report = score_resume(RESUME_TEXT)
+    printed, presented = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        result = analyze_ats_compatibility(RESUME_TEXT, "Sample")
+    with contextlib.redirect_stdout(presented):
+        print_ats_report(report, "Sample")
+    assert result == (report.score, report.compatibility, report.strengths, report.issues)
+    assert printed.getvalue() == presented.getvalue()
+    assert "🟢 ATS COMPATIBILITY SCORE: 100/100 (EXCELLENT)" in printed.getvalue()
+    print("✅ Presenter prints the report")
+
+
+def test_pipeline_picks_best_variant():
+    """process_complete_optimization scores every variant and names the best one"""
+    print("🔍 Testing best-variant selection...")
+    with contextlib.redirect_stdout(io.StringIO()):
+        optimizer = ResumeOptimizer()
+        results = optimizer.process_complete_optimization(JOB, RESUME, "data analyst", "Acme", '3')
+
+    assert set(optimizer.ats_reports) == {'3_impact_rewrite', '4_ats_optimized', '7_combined_resume',
+                                          '8_narrative_only', '9_enhanced_only'}
+    for key, report in optimizer.ats_reports.items():
+        assert report == score_resume(results[key])
+    best = optimizer.best_ats_variant
+    assert optimizer.ats_reports[best].score == max(r.score for r in optimizer.ats_reports.values())
+    assert f"RECOMMENDED FOR ATS UPLOAD: {RESULT_FILES[best]}" in results['10_executive_summary']
+    print(f"   best: {RESULT_FILES[best]} ({optimizer.ats_reports[best].score}/100)")
+    print("✅ The best-scoring variant is recommended")
+
+
+if __name__ == "__main__":
+    test_score_resume_is_quiet_and_structured()
+    test_presenter_matches_report()
+    test_pipeline_picks_best_variant()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Test the table-driven ATS scanner against the per-term counting it replaced"""
+
+import sys
+import os
+import io
+import re
+import glob
+import random
+import contextlib
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ats_analysis import (COMMON_KEYWORDS, GRAPHICS_INDICATORS, NARRATIVE_PHRASES, PROBLEMATIC_CHARS,
+                          REQUIRED_SECTIONS, analyze_ats_compatibility, pattern_table, scan_resume)
+
+
+def legacy_counts(content):
+    """The counting done by analyze_ats_compatibility before the scanner, one pass per term"""
+    lines = content.split('\n')
+    text = content.lower()
+    return {
+        'sections': {section: any(any(keyword in line.lower() for keyword in keywords) for line in lines)
+                     for section, keywords in REQUIRED_SECTIONS.items()},
+        'emoji_count': sum(line.count(char) for line in lines for char in PROBLEMATIC_CHARS),
+        'graphics_found': any(any(indicator in line.lower() for indicator in GRAPHICS_INDICATORS) for line in lines),
+        'keyword_count': sum(text.count(keyword) for keyword in COMMON_KEYWORDS),
+        'word_count': len(text.split()),
+        'bullet_count': len([line for line in lines if line.strip().startswith('•') or line.strip().startswith('-')]),
+        'metric_count': len(re.findall(r'\d+(?:%|\+|years?|months?)', content.lower())),
+        'narrative_count': sum(text.count(phrase) for phrase in NARRATIVE_PHRASES),
+    }
+
+
+def scanner_counts(content):
+    scan = scan_resume(content)
+    return {
+        'sections': scan.sections,
+        'emoji_count': scan.emoji_count,
+        'graphics_found': scan.graphics_count > 0,
+        'keyword_count': scan.keyword_count,
+        'word_count': scan.word_count,
+        'bullet_count': scan.bullet_count,
+        'metric_count': scan.metric_count,
+        'narrative_count': scan.narrative_count,
+    }
+
+
+def fuzz_texts(count, seed=48):
+    """Random texts built from the analyzer's own terms, overlapping fragments and awkward whitespace"""
+    rng = random.Random(seed)
+    pieces = (list(COMMON_KEYWORDS) + list(NARRATIVE_PHRASES) + list(GRAPHICS_INDICATORS) + PROBLEMATIC_CHARS
+              + [kw for kws in REQUIRED_SECTIONS.values() for kw in kws]
+              + ['EXPERIENCE', 'Skills', 'Develop', 'chapchapter', 'leadlead', 'skillsskills', 'my my journey',
+                 '12', '5+', '3 years', '10years', '6 months', '99%', '7month', '2024', '1x2%', '%',
+                 '•', '-', '--', '• ', '- ', '✉', '️', 'İ', 'ΣΑΣ', 'e-mail', 'a@b.c',
+                 ' ', ' ', ' ', '\n', '\n', '\n  ', '\t', '\r\n', ' ', ' ', '\x0c', 'x', 'word'])
+    for _ in range(count):
+        yield ''.join(rng.choice(pieces) for _ in range(rng.randint(0, 60)))
+
+
+def sample_texts():
+    """Text files shipped with the repo and in recent output folders"""
+    root = os.path.dirname(os.path.abspath(__file__))
+    paths = glob.glob(os.path.join(root, '*.txt')) + glob.glob(os.path.join(root, '*_output_*', '*.txt'))
+    for path in sorted(paths)[:300]:
+        with open(path, encoding='utf-8', errors='replace') as f:
+            yield f.read()
+
+
+def test_scanner_matches_legacy_counts():
+    """Every count equals the per-term str.count / re.findall / line-scan result"""
+    print("🔍 Testing scanner parity with per-term counting...")
+    checked = 0
+    for content in list(fuzz_texts(3000)) + list(sample_texts()):
+        assert scanner_counts(content) == legacy_counts(content), repr(content[:200])
+        checked += 1
+    print(f"✅ {checked} texts counted identically")
+
+
+def test_overlaps_and_shared_terms():
+    """Terms never overlap themselves, and a term listed twice is searched once"""
+    print("🔍 Testing overlap and shared-term handling...")
+    scan = scan_resume("💻💻 chapchapter skillsskills\n  - 1x2% 10years")
+    assert scan.emoji_count == 4  # '💻' is listed twice
+    assert scan.narrative_count == 1
+    assert scan.keyword_count == 2
+    assert scan.metric_count == 2 and scan.bullet_count == 1 and scan.word_count == 6
+
+    table = pattern_table()
+    assert dict(table.roles['experience']) == {'section:experience': 1, 'keyword': 1}
+    assert dict(table.roles['💻']) == {'emoji': 2}
+    assert 'university' in table.presence_only and 'experience' not in table.presence_only
+    print("✅ Overlaps and shared terms are handled like str.count")
+
+
+def test_scores_unchanged():
+    """analyze_ats_compatibility still scores known resumes the same"""
+    print("🔍 Testing analyzer scores...")
+    story = ("My Journey\nEmail: jane@example.com\nI have always been driven by a passion for design.\n"
+             "Experience\n• Led 5 projects over 3 years\n• Improved throughput 40%\nEducation\nState University\n"
+             "Skills\n💻 Python, 🔥 SQL\n")
+    plain = "Jane Doe\nPhone: 555\n- Built systems\n"
+    with contextlib.redirect_stdout(io.StringIO()):
+        story_result = analyze_ats_compatibility(story, "Story")
+        plain_result = analyze_ats_compatibility(plain, "Plain")
+    # Results recorded from the per-term implementation
+    assert story_result == (89, 'EXCELLENT',
+                            ['Has contact section', 'Has experience section', 'Has education section',
+                             'Has skills section', 'Text-only format', 'Good keyword density (11.8%)',
+                             'Uses 2 bullet points', 'Contains 1 quantified metrics'],
+                            ['Contains 3 emojis (ATS may not parse)']), story_result
+    assert plain_result == (50, 'POOR',
+                            ['Has contact section', 'Clean text formatting', 'Text-only format',
+                             'Good keyword density (14.3%)', 'Uses 1 bullet points', 'Fact-based professional style'],
+                            ['Missing experience section', 'Missing education section', 'Missing skills section']), plain_result
+    print("✅ Scores are unchanged")
+
+
+if __name__ == "__main__":
+    test_scanner_matches_legacy_counts()
+    test_overlaps_and_shared_terms()
+    test_scores_unchanged()
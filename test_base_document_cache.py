@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Test the cached base document used for DOCX rendering"""
+
+import sys
+import os
+import io
+import zipfile
+import tempfile
+import shutil
+import atexit
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Renders go to a throwaway cache, never the shared ~/.resume_optimizer one
+os.environ['RESUME_RENDER_CACHE'] = tempfile.mkdtemp(prefix='render_cache_')
+atexit.register(shutil.rmtree, os.environ['RESUME_RENDER_CACHE'], True)
+
+import resume_windows
+from resume_windows import ResumeOptimizer
+from docx import Document
+from docx.shared import Inches
+
+
+def document_xml(doc):
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return zipfile.ZipFile(buffer).read('word/document.xml')
+
+
+def test_clone_matches_fresh_build():
+    """A render from the cached base must equal one built from scratch"""
+    print("🔍 Testing base document cache...")
+
+    optimizer = ResumeOptimizer()
+    field_data = optimizer.get_field_data('software_engineer')
+
+    fresh = Document()
+    for section in fresh.sections:
+        section.top_margin = Inches(0.5)
+        section.bottom_margin = Inches(0.5)
+        section.left_margin = Inches(0.7)
+        section.right_margin = Inches(0.7)
+    optimizer.build_standard_docx(fresh, field_data, {}, 'software_engineer')
+
+    cloned = optimizer.new_resume_document(with_standard_header=True)
+    optimizer.build_standard_docx(cloned, field_data, {}, 'software_engineer', include_header=False)
+
+    assert document_xml(fresh) == document_xml(cloned)
+    assert 'standard_header' in resume_windows._BASE_DOCUMENT_CACHE
+    print("✅ Cloned render identical to fresh build")
+
+
+def test_clones_are_independent():
+    """Appending to one clone must not leak into the next render"""
+    optimizer = ResumeOptimizer()
+    first = optimizer.new_resume_document(with_standard_header=True)
+    first.add_paragraph("Only in the first render")
+    second = optimizer.new_resume_document(with_standard_header=True)
+
+    assert len(second.paragraphs) == len(first.paragraphs) - 1
+    assert second.paragraphs[0].text == "Ryan Thomas Weiler"
+    assert second.sections[0].left_margin == Inches(0.7)
+
+    blank = optimizer.new_resume_document()
+    assert blank.paragraphs == []
+    assert blank.sections[0].top_margin == Inches(0.5)
+    print("✅ Clones are independent")
+
+
+def test_repeated_renders_to_disk():
+    """Both DOCX entry points should keep producing complete resumes"""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        optimizer = ResumeOptimizer()
+        optimizer.current_detected_field = 'software_engineer'
+        for i in range(3):
+            optimizer.create_formatted_docx_resume_specific({'7_enhanced_resume': 'x'}, temp_dir, f'standard_{i}.docx')
+        optimizer.create_formatted_docx_resume({}, temp_dir)
+
+        texts = [[p.text for p in Document(os.path.join(temp_dir, name)).paragraphs]
+                 for name in ('standard_0.docx', 'standard_2.docx', 'optimized_resume.docx')]
+        assert texts[0] == texts[1] == texts[2]
+        assert texts[0].count("Ryan Thomas Weiler") == 1
+        print("✅ Repeated renders identical")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_clone_matches_fresh_build()
+    test_clones_are_independent()
+    test_repeated_renders_to_disk()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Test batch DOCX to TXT conversion"""
+
+import sys
+import os
+import json
+import tempfile
+import shutil
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from docx import Document
+from docx_to_txt_converter import _convert_quietly, batch_convert
+
+
+def test_batch_convert_with_skip():
+    """Batch conversion should convert new files and skip up-to-date outputs"""
+    print("🔍 Testing batch DOCX conversion...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        incoming = os.path.join(temp_dir, 'incoming')
+        os.makedirs(os.path.join(incoming, 'monday'))
+        for i in range(4):
+            doc = Document()
+            doc.add_paragraph(f"Applicant {i}")
+            doc.add_paragraph("Skills: Plumbing, Pipefitting")
+            folder = os.path.join(incoming, 'monday') if i % 2 else incoming
+            doc.save(os.path.join(folder, f'applicant_{i}.docx'))
+        with open(os.path.join(incoming, 'corrupt.docx'), 'wb') as f:
+            f.write(b'not a zip')
+
+        out_dir = os.path.join(temp_dir, 'converted')
+        manifest = batch_convert([incoming], out_dir=out_dir, jobs=2)
+
+        assert manifest['stats']['converted'] == 4
+        assert manifest['stats']['errors'] == 1
+        assert manifest['stats']['files_per_second'] > 0
+        with open(os.path.join(out_dir, 'monday', 'applicant_3_converted.txt'), encoding='utf-8') as f:
+            assert f.read() == "Applicant 3\nSkills: Plumbing, Pipefitting"
+        with open(os.path.join(out_dir, 'conversion_manifest.json'), encoding='utf-8') as f:
+            assert json.load(f)['stats']['converted'] == 4
+        print("✅ First run converted 4 files and recorded 1 error")
+
+        # Second run: everything already converted is skipped
+        pattern = os.path.join(incoming, '**', 'applicant_*.docx')
+        manifest = batch_convert([pattern], out_dir=out_dir, jobs=2)
+        assert manifest['stats']['converted'] == 0
+        assert manifest['stats']['skipped'] == 4
+        print("✅ Second run skipped up-to-date outputs")
+
+        # Forcing reconverts
+        manifest = batch_convert([pattern], out_dir=out_dir, jobs=2, force=True)
+        assert manifest['stats']['converted'] == 4
+        print("✅ --force reconverts everything")
+
+        # Same-named files from different folders stay apart, or are refused when they would collide
+        doc = Document()
+        doc.add_paragraph("Applicant 3 resubmitted")
+        doc.save(os.path.join(incoming, 'applicant_3.docx'))
+        manifest = batch_convert([incoming], out_dir=out_dir, jobs=2, force=True)
+        assert manifest['stats']['converted'] == 5
+        assert os.path.exists(os.path.join(out_dir, 'applicant_3_converted.txt'))
+        assert os.path.exists(os.path.join(out_dir, 'monday', 'applicant_3_converted.txt'))
+        flat = [os.path.join(incoming, 'applicant_3.docx'), os.path.join(incoming, 'monday', 'applicant_3.docx')]
+        assert batch_convert(flat, out_dir=out_dir, jobs=2, force=True) is None
+        print("✅ Output paths never collide")
+
+        # A file that disappears after being listed is one failed entry
+        entry = _convert_quietly((os.path.join(incoming, 'gone.docx'), os.path.join(out_dir, 'gone_converted.txt')))
+        assert entry['status'] == 'error' and entry['error'].startswith('Failed to read')
+        print("✅ Missing inputs are recorded per file")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_batch_convert_with_skip()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Test the bulk hyperlink API and per-part relationship dedupe"""
+
+import sys
+import os
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from resume_windows import ResumeOptimizer, HYPERLINK_RELTYPE
+from docx.oxml.ns import qn
+
+LINKEDIN = "https://www.linkedin.com/in/ryan-weiler-7a3119190/"
+GITHUB = "https://github.com/ryan-wlr"
+
+
+def hyperlink_rels(doc):
+    return [rel for rel in doc.part.rels.values() if rel.reltype == HYPERLINK_RELTYPE]
+
+
+def test_add_hyperlinks_dedupes_relationships():
+    """Repeated URLs should share one relationship while each link gets its own element"""
+    print("🔍 Testing bulk hyperlinks...")
+
+    optimizer = ResumeOptimizer()
+    doc = optimizer.new_resume_document()
+    contact = doc.add_paragraph()
+    links = optimizer.add_hyperlinks(contact, [(LINKEDIN, "LinkedIn"), (GITHUB, "GitHub"), (LINKEDIN, "Profile")])
+
+    footer = doc.add_paragraph()
+    optimizer.add_hyperlink(footer, GITHUB, GITHUB)
+
+    assert len(hyperlink_rels(doc)) == 2
+    assert links[0].get(qn('r:id')) == links[2].get(qn('r:id')) != links[1].get(qn('r:id'))
+    assert [link.text for link in contact.hyperlinks] == ["LinkedIn", "GitHub", "Profile"]
+    assert footer.hyperlinks[0].url == GITHUB
+    print("✅ 4 links, 2 relationships")
+
+    # Elements are copies: changing one link must not touch the others
+    links[0][0][-1].text = "Changed"
+    assert links[2][0][-1].text == "Profile"
+    for link in links:
+        assert link[0][0][0].get(qn('w:val')) == 'ResumeLink'
+
+    # A new document gets its own relationships
+    other = optimizer.new_resume_document()
+    optimizer.add_hyperlink(other.add_paragraph(), LINKEDIN, "LinkedIn")
+    assert len(hyperlink_rels(other)) == 1
+    print("✅ Link elements independent, relationships scoped per document")
+
+
+if __name__ == "__main__":
+    test_add_hyperlinks_dedupes_relationships()
@@ -4,11 +4,17 @@
 import sys
 import os
 import tempfile
+import atexit
+import shutil
 from docx import Document
 
 # Add the current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# Renders go to a throwaway cache, never the shared ~/.resume_optimizer one
+os.environ['RESUME_RENDER_CACHE'] = tempfile.mkdtemp(prefix='render_cache_')
+atexit.register(shutil.rmtree, os.environ['RESUME_RENDER_CACHE'], True)
+
 from resume_windows import ResumeOptimizer
 
 def test_combined_docx():
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Test tagged DOCX block extraction (headers, tables, text boxes, footers)"""
+
+import sys
+import os
+import tempfile
+import shutil
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from docx import Document
+from docx.oxml import parse_xml
+from docx_to_txt_converter import iter_docx_blocks, DocxBlock
+from resume_windows import ResumeOptimizer, read_document_text
+
+# A text box as Word writes it: a DrawingML copy plus a VML fallback copy
+TEXTBOX_XML = """
+<w:p xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+     xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"
+     xmlns:wps="http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+     xmlns:v="urn:schemas-microsoft-com:vml">
+  <w:r>
+    <mc:AlternateContent>
+      <mc:Choice Requires="wps">
+        <wps:txbx>
+          <w:txbxContent>
+            <w:p><w:r><w:t>Certifications:</w:t></w:r></w:p>
+            <w:p><w:r><w:t>AWS Solutions Architect</w:t></w:r></w:p>
+          </w:txbxContent>
+        </wps:txbx>
+      </mc:Choice>
+      <mc:Fallback>
+        <v:textbox>
+          <w:txbxContent>
+            <w:p><w:r><w:t>Certifications:</w:t></w:r></w:p>
+            <w:p><w:r><w:t>AWS Solutions Architect</w:t></w:r></w:p>
+          </w:txbxContent>
+        </v:textbox>
+      </mc:Fallback>
+    </mc:AlternateContent>
+  </w:r>
+</w:p>
+"""
+
+
+def build_two_column_resume(path):
+    """Resume template with contact info in the header and skills in a table"""
+    doc = Document()
+    doc.sections[0].header.paragraphs[0].text = "Jane Doe | jane.doe@email.com | (555) 123-4567"
+    doc.sections[0].footer.paragraphs[0].text = "References available upon request"
+
+    doc.add_paragraph("Professional Summary")
+    table = doc.add_table(rows=1, cols=2)
+    table.cell(0, 0).text = "Skills:"
+    table.cell(0, 1).paragraphs[0].text = "Python, SQL"
+    table.cell(0, 1).add_paragraph("Docker, Kubernetes")
+    doc.element.body.insert(len(doc.element.body) - 1, parse_xml(TEXTBOX_XML))
+    doc.add_paragraph("Experience")
+    doc.save(path)
+
+
+def test_blocks_in_reading_order():
+    """Header, body, table cells, text box and footer should all be tagged"""
+    print("🔍 Testing tagged DOCX blocks...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, 'two_column.docx')
+        build_two_column_resume(path)
+
+        blocks = [b for b in iter_docx_blocks(path) if b.text]
+        for block in blocks:
+            print(f"   {block.part:6s} {block.kind:10s} {block.text!r}")
+
+        assert blocks[0] == DocxBlock('paragraph', "Jane Doe | jane.doe@email.com | (555) 123-4567", 'header')
+        assert DocxBlock('table_cell', "Skills:", 'body') in blocks
+        assert DocxBlock('table_cell', "Python, SQL\nDocker, Kubernetes", 'body') in blocks
+        textboxes = [b for b in blocks if b.kind == 'textbox']
+        assert textboxes == [DocxBlock('textbox', "Certifications:\nAWS Solutions Architect", 'body')]
+        assert blocks[-1] == DocxBlock('paragraph', "References available upon request", 'footer')
+        print("✅ All block kinds found, text box not duplicated")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_resume_information_uses_header_and_table():
+    """extract_resume_information should see the header contact line and table skills"""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, 'two_column.docx')
+        build_two_column_resume(path)
+
+        content = read_document_text(path)
+        info = ResumeOptimizer().extract_resume_information(content)
+        assert 'jane.doe@email.com' in info['contact_info']
+        assert 'Docker' in info['skills']
+        print("✅ Contact info and skills extracted from header and table")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_header_footer_dedupe_per_kind():
+    """Variants of the same header collapse; a line in both header and footer is kept twice"""
+    print("🔍 Testing header/footer de-duplication...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, 'name_everywhere.docx')
+        doc = Document()
+        section = doc.sections[0]
+        section.different_first_page_header_footer = True
+        section.header.paragraphs[0].text = "Jane Doe"
+        section.first_page_header.paragraphs[0].text = "Jane Doe"
+        section.footer.paragraphs[0].text = "Jane Doe"
+        doc.add_paragraph("Experience")
+        doc.save(path)
+
+        blocks = [(b.part, b.text) for b in iter_docx_blocks(path) if b.text]
+        assert blocks == [('header', "Jane Doe"), ('body', "Experience"), ('footer', "Jane Doe")], blocks
+        print("✅ De-duplicated within headers and within footers only")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_blocks_in_reading_order()
+    test_resume_information_uses_header_and_table()
+    test_header_footer_dedupe_per_kind()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Test the process-pool DOCX render farm"""
+
+import sys
+import os
+import io
+import time
+import zipfile
+import contextlib
+import tempfile
+import shutil
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from resume_windows import ResumeOptimizer
+from docx_render_farm import DocxRenderFarm, RenderTimeout, run_with_timeout
+from render_cache import RenderCache
+from ooxml_writer import DocxParagraph, DocxRun
+from docx import Document
+
+JOB = "Seeking a data scientist with Python, SQL and machine learning experience."
+RESUME = "Jane Q Public\nSkills: Python, SQL\nEducation: Example University, 2012"
+
+
+def quiet_optimizer(render_cache=None):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return ResumeOptimizer(render_cache=render_cache)
+
+
+def document_xml(path_or_bytes):
+    source = io.BytesIO(path_or_bytes) if isinstance(path_or_bytes, bytes) else path_or_bytes
+    with zipfile.ZipFile(source) as package:
+        return package.read('word/document.xml')
+
+
+def test_farm_matches_inline_render():
+    """Pool renders are the same documents as inline renders"""
+    print("🔍 Testing render farm output...")
+    optimizer = quiet_optimizer()
+    temp_dir = tempfile.mkdtemp()
+    try:
+        jobs = []
+        for index in range(10):
+            blocks = [DocxParagraph('ResumeHeading', (DocxRun(f"Section {index}"),)),
+                      DocxParagraph('ResumeBody', (DocxRun("Site: "), DocxRun("https://example.com", url="https://example.com")))]
+            jobs.append((os.path.join(temp_dir, f"resume_{index}.docx"), blocks, index % 2 == 0))
+
+        with DocxRenderFarm(workers=2, chunk_size=3, max_pending=2) as farm:
+            # Never forked from a parent that may have writer threads running
+            assert farm._pool._mp_context.get_start_method() in ('forkserver', 'spawn')
+            for path, blocks, header in jobs:
+                farm.submit(path, blocks, header)
+                assert len(farm._in_flight) <= farm.max_pending
+        assert farm.stats == {'submitted': 10, 'written': 10, 'errors': 0}
+
+        for path, blocks, header in jobs:
+            inline = io.BytesIO()
+            optimizer.save_resume_docx(inline, blocks, header)
+            assert document_xml(path) == document_xml(inline.getvalue())
+            Document(path)
+        print(f"   {farm.stats['written']} files rendered by {farm.workers} workers")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ Farm renders match inline renders")
+
+
+def test_save_results_submits_to_farm():
+    """save_results_to_files queues DOCX renders on an attached farm"""
+    print("🔍 Testing save_results_to_files with a render farm...")
+    temp_dir = tempfile.mkdtemp()
+    optimizer = quiet_optimizer(RenderCache(os.path.join(temp_dir, 'cache')))
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = optimizer.process_complete_optimization(JOB, RESUME, "data scientist", "Acme", '3')
+        out_dir = os.path.join(temp_dir, 'out')
+
+        optimizer.render_farm = DocxRenderFarm(workers=2)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                optimizer.save_results_to_files(results, out_dir, ('docx',))
+            assert optimizer.render_farm.stats['submitted'] == 4
+            optimizer.render_farm.flush()
+        finally:
+            optimizer.render_farm.close()
+            optimizer.render_farm = None
+
+        for name in ('optimized_resume.docx', 'combined_comprehensive_resume.docx'):
+            Document(os.path.join(out_dir, name))
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ DOCX files are written by the farm")
+
+
+def test_errors_and_timeouts():
+    """Failed jobs are reported per file and slow jobs time out"""
+    print("🔍 Testing render errors and timeouts...")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        good = os.path.join(temp_dir, 'good.docx')
+        bad = os.path.join(temp_dir, 'missing_dir', 'bad.docx')
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            with DocxRenderFarm(workers=1, chunk_size=2) as farm:
+                farm.submit(good, [DocxParagraph('ResumeBody', (DocxRun("ok"),))])
+                farm.submit(bad, [DocxParagraph('ResumeBody', (DocxRun("ok"),))])
+        assert os.path.exists(good)
+        assert farm.stats['written'] == 1 and farm.stats['errors'] == 1
+        assert "ERROR: Failed to render bad.docx" in output.getvalue()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    if hasattr(__import__('signal'), 'SIGALRM'):
+        start = time.perf_counter()
+        try:
+            run_with_timeout(time.sleep, 0.2, 5)
+            assert False, "sleep should have timed out"
+        except RenderTimeout:
+            pass
+        assert time.perf_counter() - start < 2
+    assert run_with_timeout(sum, 1.0, [1, 2]) == 3
+    print("✅ Errors are reported per file and jobs time out")
+
+
+if __name__ == "__main__":
+    test_farm_matches_inline_render()
+    test_save_results_submits_to_farm()
+    test_errors_and_timeouts()
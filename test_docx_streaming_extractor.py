@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Test the streaming DOCX text extractor against python-docx"""
+
+import sys
+import os
+import types
+import tempfile
+import shutil
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from docx import Document
+from docx_to_txt_converter import iter_docx_paragraphs, extract_text_from_docx_zip
+
+
+def test_matches_python_docx_on_template():
+    """Body paragraphs should match python-docx exactly on the real resume template"""
+    print("🔍 Comparing streaming extractor with python-docx...")
+
+    template = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Ryan_Weiler_Resume.docx')
+    expected = [p.text for p in Document(template).paragraphs]
+    paragraphs = iter_docx_paragraphs(template)
+
+    assert isinstance(paragraphs, types.GeneratorType)
+    assert list(paragraphs) == expected
+    print(f"✅ {len(expected)} paragraphs identical")
+
+
+def test_tabs_breaks_and_tables():
+    """Tabs, line breaks and table cell paragraphs should be extracted"""
+    print("🔍 Testing tabs, breaks and tables...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        doc = Document()
+        para = doc.add_paragraph()
+        para.add_run("Python")
+        para.add_run().add_tab()
+        para.add_run("SQL")
+        para.add_run().add_break()
+        para.add_run("Git")
+        table = doc.add_table(rows=1, cols=2)
+        table.cell(0, 0).text = "Phone: (555) 123-4567"
+        table.cell(0, 1).text = "Skills: Welding"
+        doc.add_paragraph("After the table")
+
+        path = os.path.join(temp_dir, 'layout.docx')
+        doc.save(path)
+
+        paragraphs = list(iter_docx_paragraphs(path))
+        assert paragraphs[0] == "Python\tSQL\nGit"
+        assert "Phone: (555) 123-4567" in paragraphs
+        assert "Skills: Welding" in paragraphs
+        assert paragraphs[-1] == "After the table"
+
+        text = extract_text_from_docx_zip(path)
+        assert "After the table" in text and "" not in text.split('\n')
+        print("✅ Tabs, breaks and table cells extracted")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_invalid_docx_reports_error():
+    """Non-ZIP input should come back as an Error string, not an exception"""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, 'broken.docx')
+        with open(path, 'wb') as f:
+            f.write(b'not a zip')
+        assert extract_text_from_docx_zip(path).startswith("Error:")
+        print("✅ Invalid DOCX reported as error")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_matches_python_docx_on_template()
+    test_tabs_breaks_and_tables()
+    test_invalid_docx_reports_error()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Test single-read encoding detection for job description and resume text files"""
+
+import sys
+import os
+import builtins
+import tempfile
+import shutil
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from resume_windows import detect_text_encoding, decode_text_bytes, read_document_text
+import browse_mode_fixed
+
+JOB_TEXT = "Café Line Cook – “Senior” position\nRequired: knife skills, food safety – 5+ years\n"
+
+
+def test_detects_common_encodings():
+    """BOMs, UTF-8, UTF-16 without BOM, cp1252 and latin-1 should all decode correctly"""
+    print("🔍 Testing encoding detection...")
+
+    cases = [
+        (JOB_TEXT.encode('utf-8'), 'utf-8'),
+        (b'\xef\xbb\xbf' + JOB_TEXT.encode('utf-8'), 'utf-8-sig'),
+        (JOB_TEXT.encode('utf-16'), 'utf-16'),
+        (JOB_TEXT.encode('utf-32'), 'utf-32'),
+        (JOB_TEXT.encode('utf-16-le'), 'utf-16-le'),
+        (JOB_TEXT.encode('utf-16-be'), 'utf-16-be'),
+        (JOB_TEXT.encode('cp1252'), 'cp1252'),
+    ]
+    for data, expected in cases:
+        assert detect_text_encoding(data) == expected, expected
+        assert decode_text_bytes(data) == JOB_TEXT
+        print(f"   ✅ {expected}")
+
+    # 0x81 is undefined in cp1252 - must fall back to latin-1
+    latin = b'Resume \x81 data \xe9'
+    assert detect_text_encoding(latin) == 'latin-1'
+    assert decode_text_bytes(latin) == latin.decode('latin-1')
+    print("   ✅ latin-1 fallback")
+
+
+def test_probe_boundary_and_late_errors():
+    """A multi-byte character split at the probe boundary must not break UTF-8 detection"""
+    data = ("a" * 9 + "é" * 10).encode('utf-8')
+    assert detect_text_encoding(data, probe_size=10) == 'utf-8'
+
+    # Invalid bytes past the probe are replaced instead of failing the read
+    late_error = b'a' * 100 + b'\xff'
+    assert detect_text_encoding(late_error, probe_size=10) == 'utf-8'
+    assert late_error.decode('utf-8', errors='replace') == 'a' * 100 + '\ufffd'
+
+    # Within the probe the same byte rules out UTF-8 entirely
+    assert decode_text_bytes(late_error) == 'a' * 100 + '\xff'
+    print("✅ Probe boundary handled")
+
+
+def test_read_file_safely_reads_once():
+    """read_file_safely should open a cp1252 file exactly once"""
+    print("🔍 Testing read_file_safely single read...")
+
+    temp_dir = tempfile.mkdtemp()
+    original_open = builtins.open
+    opened = []
+
+    def counting_open(path, *args, **kwargs):
+        if str(path).endswith('job.txt'):
+            opened.append(path)
+        return original_open(path, *args, **kwargs)
+
+    try:
+        path = os.path.join(temp_dir, 'job.txt')
+        with original_open(path, 'wb') as f:
+            f.write(JOB_TEXT.encode('cp1252'))
+
+        builtins.open = counting_open
+        content = browse_mode_fixed.read_file_safely(path)
+        builtins.open = original_open
+
+        assert content == JOB_TEXT
+        assert len(opened) == 1
+        assert read_document_text(path) == JOB_TEXT
+        print("✅ cp1252 file read with a single open")
+    finally:
+        builtins.open = original_open
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_detects_common_encodings()
+    test_probe_boundary_and_late_errors()
+    test_read_file_safely_reads_once()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Test the direct OOXML writer against python-docx output"""
+
+import sys
+import os
+import io
+import re
+import time
+import zipfile
+import tempfile
+import shutil
+import atexit
+import subprocess
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Renders go to a throwaway cache, never the shared ~/.resume_optimizer one
+os.environ['RESUME_RENDER_CACHE'] = tempfile.mkdtemp(prefix='render_cache_')
+atexit.register(shutil.rmtree, os.environ['RESUME_RENDER_CACHE'], True)
+
+import resume_windows
+from resume_windows import ResumeOptimizer
+import ooxml_writer
+from ooxml_writer import DocxFragment, DocxParagraph, DocxRun, write_docx
+from docx import Document
+
+NARRATIVE = """
+CAREER STORY RESUME - OPTICAL ENGINEER
+
+🔬 THE LIGHT ARCHITECT: Engineering the future through precision optics
+
+RYAN THOMAS WEILER
+
+CONTACT INFORMATION:
+📞 (561) 906-2118 | ✉️ ryan_wlr@yahoo.com
+🔗 LinkedIn: https://www.linkedin.com/in/ryan-weiler-7a3119190/ | 💻 GitHub: https://github.com/ryan-wlr
+Portfolio https://example.com/?a=1&b=<2> then https://github.com/ryan-wlr again
+University of Central Florida - B.S. Computer Science, GPA 3.5
+
+PROFESSIONAL NARRATIVE:
+Light has always been my medium of choice for "solving" complex problems & more.
+
+TECHNICAL COMPETENCIES:
+• Advanced Optical Design & Modeling (Zemax, Code V, LightTools)
+
+PROFESSIONAL EXPERIENCE:
+• Designed laser systems improving efficiency by 40% <measured>
+"""
+
+
+def render_both(optimizer, blocks, with_standard_header):
+    """Render blocks with python-docx and the direct writer, return both packages"""
+    doc = optimizer.new_resume_document(with_standard_header)
+    optimizer.render_blocks_to_document(doc, blocks)
+    python_docx = io.BytesIO()
+    doc.save(python_docx)
+
+    direct = io.BytesIO()
+    header = optimizer.standard_header_blocks() if with_standard_header else []
+    write_docx(direct, header + blocks)
+    return zipfile.ZipFile(python_docx), zipfile.ZipFile(direct)
+
+
+def relationships(package):
+    xml = package.read('word/_rels/document.xml.rels').decode('utf-8')
+    return sorted(re.findall(r'<Relationship [^>]*/>', xml))
+
+
+def assert_parity(expected, actual):
+    assert actual.read('word/document.xml') == expected.read('word/document.xml')
+    assert relationships(actual) == relationships(expected)
+    assert set(actual.namelist()) == set(expected.namelist())
+
+
+def test_standard_resume_parity():
+    """The standard resume must produce byte-identical document.xml"""
+    print("🔍 Testing OOXML writer parity (standard)...")
+    optimizer = ResumeOptimizer()
+    for field in ('software_engineer', 'optical_engineer', 'data_scientist'):
+        blocks = optimizer.build_standard_blocks(optimizer.get_field_data(field), include_header=False)
+        assert_parity(*render_both(optimizer, blocks, with_standard_header=True))
+    print("✅ Standard resumes identical")
+
+
+def test_narrative_resume_parity():
+    """Narrative resumes with hyperlinks, repeated URLs and markup characters must match"""
+    print("🔍 Testing OOXML writer parity (narrative)...")
+    optimizer = ResumeOptimizer()
+    optimizer.current_detected_field = 'optical_engineer'
+    blocks = optimizer.build_narrative_blocks(NARRATIVE)
+    python_docx, direct = render_both(optimizer, blocks, with_standard_header=False)
+    assert_parity(python_docx, direct)
+
+    # Four links, three distinct targets
+    assert len([r for r in relationships(direct) if 'TargetMode="External"' in r]) == 3
+    print("✅ Narrative resume identical, hyperlinks deduplicated")
+
+
+def test_text_edge_cases():
+    """Tabs, breaks, surrounding spaces and bold runs should match python-docx"""
+    optimizer = ResumeOptimizer()
+    blocks = [
+        DocxParagraph('Heading 1', (DocxRun("Skills\tand  tools ", 14, bold=True),)),
+        DocxParagraph(None, (DocxRun(" line one\nline two"), DocxRun("x", url="https://a.com/?q=\"1\""))),
+        DocxParagraph('Normal', (), 'center'),
+        DocxParagraph(),
+    ]
+    assert_parity(*render_both(optimizer, blocks, with_standard_header=False))
+    print("✅ Text edge cases identical")
+
+
+def test_control_characters_stay_well_formed():
+    """Control characters from extracted text must not break the package XML"""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, 'control.docx')
+        write_docx(path, [
+            DocxParagraph('Normal', (DocxRun("Page one\x0cpage two\x00"),)),
+            DocxParagraph(None, (DocxRun("Site\x01", url="https://a.com/\x02"),)),
+        ])
+        doc = Document(path)
+        assert doc.paragraphs[0].text == "Page one\npage two"
+        assert doc.paragraphs[1].text == "Site"
+        print("✅ Control characters dropped or turned into breaks")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_runs_reference_resume_styles():
+    """Body, heading and link runs should use the shared styles instead of font overrides"""
+    print("🔍 Testing resume styles...")
+    optimizer = ResumeOptimizer()
+    optimizer.current_detected_field = 'optical_engineer'
+    blocks = optimizer.build_narrative_blocks(NARRATIVE)
+    python_docx, direct = render_both(optimizer, blocks, with_standard_header=False)
+
+    for package in (python_docx, direct):
+        styles_xml = package.read('word/styles.xml').decode('utf-8')
+        for style_id in ('ResumeBody', 'ResumeHeading', 'ResumeLink'):
+            assert styles_xml.count(f'w:styleId="{style_id}"') == 1, style_id
+
+    document_xml = direct.read('word/document.xml').decode('utf-8')
+    # Only the two Title runs (hook and name) still carry a font override
+    assert document_xml.count('<w:rFonts') == 2
+    assert document_xml.count('<w:rStyle w:val="ResumeLink"/>') == 4
+
+    doc = Document(io.BytesIO(direct.fp.getvalue()))
+    assert doc.styles['ResumeBody'].font.size.pt == 12
+    assert doc.styles['ResumeHeading'].font.size.pt == 14
+    assert doc.styles['ResumeLink'].font.underline
+    assert [p.style.name for p in doc.paragraphs[2:4]] == ['Title', 'ResumeBody']
+    print("✅ Runs reference ResumeBody, ResumeHeading and ResumeLink")
+
+
+def test_static_section_fragments():
+    """Cached field fragments must render exactly like inline blocks, in both backends"""
+    print("🔍 Testing static section fragments...")
+    optimizer = ResumeOptimizer()
+    field_data = optimizer.get_field_data('marine_biologist')
+    inline = optimizer.build_standard_blocks(field_data, include_header=False)
+    cached = optimizer.build_standard_blocks(field_data, include_header=False, field='marine_biologist')
+
+    fragments = [block for block in cached if isinstance(block, DocxFragment)]
+    assert [f.key[-1] for f in fragments] == ['education', 'projects', 'skills']
+    assert len(cached) < len(inline)
+
+    template = ooxml_writer.load_template()
+    expected_xml, _ = ooxml_writer.render_document_xml(inline, template)
+    assert ooxml_writer.render_document_xml(cached, template)[0] == expected_xml
+    for fragment in fragments:
+        assert (fragment.key, ooxml_writer.RENDERER_VERSION) in ooxml_writer._FRAGMENT_CACHE
+
+    # Second render reuses the same fragment objects and their cached XML
+    again = optimizer.build_standard_blocks(field_data, include_header=False, field='marine_biologist')
+    assert [b for b in again if isinstance(b, DocxFragment)][0] is fragments[0]
+    assert ooxml_writer.render_document_xml(again, template)[0] == expected_xml
+
+    # python-docx expands fragments inline
+    assert_parity(*render_both(optimizer, cached, with_standard_header=True))
+
+    # Hyperlinks depend on per-document rel ids and cannot be cached
+    linked = DocxFragment(('test', 'links'), (DocxParagraph(None, (DocxRun("x", url="https://a.com"),)),))
+    try:
+        ooxml_writer.fragment_xml(linked)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    print("✅ Fragments cached and identical to inline rendering")
+
+
+def test_saved_resume_opens_and_is_faster():
+    """Files written through save_resume_docx should open in python-docx, faster than the object model"""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        optimizer = ResumeOptimizer()
+        optimizer.current_detected_field = 'optical_engineer'
+        optimizer.create_formatted_docx_resume_specific({'7_narrative_resume': NARRATIVE}, temp_dir, 'story.docx')
+        doc = Document(os.path.join(temp_dir, 'story.docx'))
+        assert doc.paragraphs[2].text == "RYAN THOMAS WEILER"
+        assert len(doc.part.rels) == 11
+
+        blocks = optimizer.build_standard_blocks(optimizer.get_field_data('software_engineer'))
+        path = os.path.join(temp_dir, 'bench.docx')
+        start = time.perf_counter()
+        for _ in range(5):
+            write_docx(path, blocks)
+        direct_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(5):
+            doc = optimizer.new_resume_document()
+            optimizer.render_blocks_to_document(doc, blocks)
+            doc.save(path)
+        python_docx_time = time.perf_counter() - start
+
+        print(f"   direct writer: {direct_time / 5 * 1000:.1f} ms, python-docx: {python_docx_time / 5 * 1000:.1f} ms")
+        assert direct_time < python_docx_time
+        print("✅ Direct writer output opens and renders faster")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_import_does_not_load_python_docx():
+    """The direct writer path should not pay for importing python-docx"""
+    check = "import sys, resume_windows; sys.exit('docx' in sys.modules)"
+    result = subprocess.run([sys.executable, '-c', check], cwd=os.path.dirname(os.path.abspath(__file__)))
+    assert result.returncode == 0
+    print("✅ resume_windows imports without python-docx")
+
+
+if __name__ == "__main__":
+    test_standard_resume_parity()
+    test_narrative_resume_parity()
+    test_text_edge_cases()
+    test_control_characters_stay_well_formed()
+    test_runs_reference_resume_styles()
+    test_static_section_fragments()
+    test_saved_resume_opens_and_is_faster()
+    test_import_does_not_load_python_docx()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Test the page-fit estimator and bullet auto-trim"""
+
+import sys
+import os
+import io
+import time
+import contextlib
+import tempfile
+import shutil
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from resume_windows import ResumeOptimizer
+from render_cache import RenderCache
+from ooxml_writer import DocxFragment, DocxParagraph, DocxRun, iter_paragraphs
+from page_fit import (content_box, estimate_document, estimate_layout, fit_to_pages,
+                      text_width, trim_order, wrap_line_count)
+from resume_ir import render_docx_blocks
+from docx import Document
+
+JOB = "Seeking a software engineer with Python, SQL and cloud experience."
+RESUME = "Jane Q Public\nSkills: Python, SQL\nEducation: Example University, 2012"
+
+
+def body(text):
+    return DocxParagraph('ResumeBody', (DocxRun(text),))
+
+
+def test_widths_and_wrapping():
+    """Calibri widths drive line wraps at the resume text width"""
+    print("🔍 Testing width table and line wrapping...")
+    width, height = content_box()
+    assert round(width, 1) == 511.2 and height == 720.0  # 8.5x11 minus 0.7"/0.5" margins
+
+    assert text_width("iiii", 12) < text_width("mmmm", 12)
+    assert text_width("Resume", 12, bold=True) > text_width("Resume", 12)
+    assert abs(text_width("ab", 24) - 2 * text_width("ab", 12)) < 1e-9
+
+    assert wrap_line_count([("Short line", 12, False)], width) == 1
+    assert wrap_line_count([("one\ntwo\nthree", 12, False)], width) == 3
+    sentence = "Designed and shipped data pipelines processing millions of events per day "
+    lines = wrap_line_count([(sentence * 4, 12, False)], width)
+    assert 2 <= lines <= 4, lines
+    assert wrap_line_count([("x" * 400, 12, False)], width) >= 3  # unbreakable text still wraps
+    print(f"   4 sentences wrap to {lines} lines at {width:.1f}pt")
+    print("✅ Widths and wraps are consistent")
+
+
+def test_estimate_pages():
+    """Page count grows with content and headings add their spacing"""
+    print("🔍 Testing page estimates...")
+    assert estimate_layout([body("Hello")]).pages == 1
+    assert estimate_layout([]).pages == 1
+
+    one_page = [body(f"Line {i}") for i in range(20)]
+    three_pages = [body(f"Line {i}") for i in range(70)]
+    assert estimate_layout(one_page).pages == 1
+    assert estimate_layout(three_pages).pages == 3
+
+    plain = estimate_layout([body("a"), body("b")])
+    with_heading = estimate_layout([body("a"), DocxParagraph('ResumeHeading', (DocxRun("Skills"),)), body("b")])
+    assert with_heading.last_page_height > plain.last_page_height
+
+    # Fragments are measured like their paragraphs
+    fragment = DocxFragment(('test', 'fragment'), one_page)
+    assert estimate_layout([fragment]) == estimate_layout(one_page)
+    print("✅ Page estimates track content")
+
+
+def test_trim_order_and_fit():
+    """Auto-trim drops deep bullets of long lists first and keeps one per list"""
+    print("🔍 Testing bullet auto-trim...")
+    blocks = ([DocxParagraph('ResumeHeading', (DocxRun("Experience"),))]
+              + [body(f"- exp {i}") for i in range(30)]
+              + [DocxParagraph('ResumeHeading', (DocxRun("Skills"),))]
+              + [body(f"• skill {i}") for i in range(5)])
+    order = trim_order(blocks)
+    assert blocks[order[0]].runs[0].text == "- exp 29"
+    assert "- exp 0" not in [blocks[i].runs[0].text for i in order]
+    assert "• skill 0" not in [blocks[i].runs[0].text for i in order]
+
+    assert estimate_layout(blocks).pages == 2
+    trimmed, dropped = fit_to_pages(blocks, 1)
+    assert estimate_layout(trimmed).pages == 1
+    assert dropped and all(text.startswith(("- ", "• ")) for text in dropped)
+    assert [p for p in trimmed if not p.runs[0].text.startswith(("- ", "• "))] == \
+        [p for p in blocks if not p.runs[0].text.startswith(("- ", "• "))]
+    print(f"   dropped {len(dropped)} bullets: {dropped[0]} ... {dropped[-1]}")
+
+    # Already fitting: unchanged, same object
+    assert fit_to_pages(blocks, 2)[0] is blocks
+    print("✅ Lowest-priority bullets are trimmed until the resume fits")
+
+
+def test_estimate_is_fast_and_pipeline_fits():
+    """Estimates take well under a millisecond and --max-pages trims the saved DOCX"""
+    print("🔍 Testing estimator speed and pipeline trimming...")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            optimizer = ResumeOptimizer(render_cache=RenderCache(os.path.join(temp_dir, 'cache')))
+            results = optimizer.process_complete_optimization(JOB, RESUME, "software engineer", "Acme", '3')
+        field_data = optimizer.get_field_data('software_engineer')
+        blocks = optimizer.standard_header_blocks() + optimizer.build_standard_blocks(field_data, False, 'software_engineer')
+
+        start = time.perf_counter()
+        for _ in range(50):
+            estimate_layout(blocks)
+        per_call = (time.perf_counter() - start) / 50
+        print(f"   standard resume: {estimate_layout(blocks).pages} page(s), {per_call * 1e6:.0f} us per estimate")
+        assert per_call < 0.005
+
+        narrative = estimate_document(optimizer.resume_documents['8_narrative_only'])
+        assert narrative.pages >= 1 and narrative.lines > 20
+
+        # optimized_resume.docx is the three-page combined resume here
+        optimizer.max_pages = 2
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            optimizer.save_results_to_files(results, temp_dir)
+        assert "Estimated length:" in output.getvalue()
+        assert "to fit 2 page(s) (now 2)" in output.getvalue()
+
+        saved = [p.text for p in Document(os.path.join(temp_dir, 'optimized_resume.docx')).paragraphs]
+        bullets = [t for t in saved if t.startswith(("- ", "• "))]
+        combined = render_docx_blocks(optimizer.resume_documents['7_combined_resume'])
+        original = [p for p in iter_paragraphs(combined) if p.runs and p.runs[0].text.startswith(("- ", "• "))]
+        assert 0 < len(bullets) < len(original)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ Estimates are fast and the saved resume is trimmed to the page budget")
+
+
+if __name__ == "__main__":
+    test_widths_and_wrapping()
+    test_estimate_pages()
+    test_trim_order_and_fit()
+    test_estimate_is_fast_and_pipeline_fits()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Test the pure-Python PDF text extractor"""
+
+import sys
+import os
+import zlib
+import tempfile
+import shutil
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pdf_text_extractor
+from pdf_text_extractor import extract_text_from_pdf, iter_pdf_pages, PdfError
+import resume_windows
+from resume_windows import read_document_text
+
+TO_UNICODE_CMAP = b"""/CIDInit /ProcSet findresource begin
+12 dict begin
+begincmap
+1 begincodespacerange
+<0000> <FFFF>
+endcodespacerange
+2 beginbfchar
+<0001> <0053>
+<0002> <0051>
+endbfchar
+1 beginbfrange
+<0010> <0019> <0030>
+endbfrange
+endcmap
+"""
+
+
+def build_pdf(page_streams, compress=False):
+    """Build a small PDF; each page stream is content bytes using fonts F1 (simple) and F2 (CID)"""
+    objects = {}
+    objects[1] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[3] = b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+    cmap = zlib.compress(TO_UNICODE_CMAP)
+    objects[4] = b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(cmap) + cmap + b"\nendstream"
+    objects[5] = b"<< /Type /Font /Subtype /Type0 /BaseFont /Calibri /Encoding /Identity-H /ToUnicode 4 0 R >>"
+
+    kids = []
+    next_num = 6
+    for content in page_streams:
+        page_num, content_num = next_num, next_num + 1
+        next_num += 2
+        kids.append(b"%d 0 R" % page_num)
+        objects[page_num] = b"<< /Type /Page /Parent 2 0 R /Contents %d 0 R >>" % content_num
+        if compress:
+            body = zlib.compress(content)
+            objects[content_num] = b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(body) + body + b"\nendstream"
+        else:
+            objects[content_num] = b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream"
+
+    # Resources live on the Pages node and are inherited by every page
+    objects[2] = (b"<< /Type /Pages /Kids [" + b" ".join(kids) + b"] /Count %d" % len(kids)
+                  + b" /Resources << /Font << /F1 3 0 R /F2 5 0 R >> >> >>")
+
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = {}
+    for num in sorted(objects):
+        offsets[num] = len(out)
+        out += b"%d 0 obj\n" % num + objects[num] + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for num in sorted(objects):
+        out += b"%010d 00000 n \n" % offsets[num]
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+PAGE_1 = b"""BT /F1 12 Tf 72 720 Td (Jane Doe) Tj 0 -14 Td (Email: jane@example.com \\(primary\\)) Tj ET
+BT /F1 12 Tf 72 690 Td [(Skills:) -300 (Python,) -250 (SQL)] TJ ET"""
+PAGE_2 = b"""BT /F2 11 Tf 72 720 Td <00010002> Tj T* <0011001200130014> Tj ET"""
+PAGE_3 = b"""BT /F1 12 Tf 72 720 Td (Experience: Welding Supervisor 2019-2024) Tj ET"""
+
+
+def write_pdf(temp_dir, name, data):
+    path = os.path.join(temp_dir, name)
+    with open(path, 'wb') as f:
+        f.write(data)
+    return path
+
+
+def test_extracts_text_from_pages():
+    """Literal, TJ-array and ToUnicode hex strings should all decode"""
+    print("🔍 Testing PDF text extraction...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        for compress in (False, True):
+            path = write_pdf(temp_dir, 'resume.pdf', build_pdf([PAGE_1, PAGE_2, PAGE_3], compress))
+            pages = list(iter_pdf_pages(path))
+            assert pages[0] == "Jane Doe\nEmail: jane@example.com (primary)\nSkills: Python, SQL"
+            assert pages[1] == "SQ\n1234"
+            assert pages[2] == "Experience: Welding Supervisor 2019-2024"
+            print(f"   ✅ 3 pages extracted (FlateDecode={compress})")
+
+        assert read_document_text(path).startswith("Jane Doe")
+        print("✅ read_document_text handles PDFs")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_page_budget_and_early_stop():
+    """max_pages and enough_chars should stop decoding further pages"""
+    print("🔍 Testing page budget...")
+
+    temp_dir = tempfile.mkdtemp()
+    decoded = []
+    original = pdf_text_extractor.PdfDocument.page_text
+
+    def counting_page_text(self, page):
+        decoded.append(page)
+        return original(self, page)
+
+    try:
+        path = write_pdf(temp_dir, 'long.pdf', build_pdf([PAGE_3] * 20, compress=True))
+        pdf_text_extractor.PdfDocument.page_text = counting_page_text
+
+        text = extract_text_from_pdf(path, max_pages=5)
+        assert text.count('Welding Supervisor') == 5 and len(decoded) == 5
+
+        decoded.clear()
+        extract_text_from_pdf(path, enough_chars=50)
+        assert len(decoded) == 2
+
+        # The resume/job readers pass their character budget down
+        decoded.clear()
+        original_limit = resume_windows.DOCUMENT_TEXT_CHARS
+        resume_windows.DOCUMENT_TEXT_CHARS = 50
+        try:
+            read_document_text(path)
+        finally:
+            resume_windows.DOCUMENT_TEXT_CHARS = original_limit
+        assert len(decoded) == 2
+        print("✅ Decoding stops at the page budget / once enough text is found")
+    finally:
+        pdf_text_extractor.PdfDocument.page_text = original
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_rejects_non_pdf():
+    """A file without a PDF header should raise PdfError"""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = write_pdf(temp_dir, 'fake.pdf', b'Just some text')
+        try:
+            extract_text_from_pdf(path)
+            assert False, "expected PdfError"
+        except PdfError:
+            print("✅ Non-PDF rejected")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_extracts_text_from_pages()
+    test_page_budget_and_early_stop()
+    test_rejects_non_pdf()
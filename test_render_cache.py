@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Test deterministic DOCX output and render-skip via the render cache"""
+
+import sys
+import os
+import io
+import zipfile
+import contextlib
+import tempfile
+import shutil
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import resume_windows
+from resume_windows import ResumeOptimizer
+from render_cache import RENDER_HASH_SUFFIX, RenderCache, read_render_hash, render_key
+from ooxml_writer import CORE_PROPERTIES_TIMESTAMP, ZIP_DATE_TIME, DocxParagraph, DocxRun
+
+JOB = "Seeking a welder with MIG, TIG and blueprint reading experience."
+RESUME = "Jane Q Public\nSkills: MIG welding, TIG welding\nEducation: Example Technical College, 2012"
+
+BLOCKS = [DocxParagraph('ResumeHeading', (DocxRun("Experience"),)),
+          DocxParagraph('ResumeBody', (DocxRun("Portfolio: "), DocxRun("https://example.com", url="https://example.com")))]
+
+
+def quiet_optimizer(cache_dir):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return ResumeOptimizer(render_cache=RenderCache(cache_dir))
+
+
+def test_renders_are_deterministic():
+    """Both backends produce identical bytes with fixed timestamps"""
+    print("🔍 Testing deterministic DOCX output...")
+    temp_dir = tempfile.mkdtemp()
+    original_backend = resume_windows.DOCX_BACKEND
+    try:
+        optimizer = quiet_optimizer(temp_dir)
+        for backend in ('ooxml', 'python-docx'):
+            resume_windows.DOCX_BACKEND = backend
+            first = optimizer.render_docx_bytes(BLOCKS, True)
+            second = optimizer.render_docx_bytes(list(BLOCKS), True)
+            assert first == second, f"{backend} output differs between renders"
+
+            with zipfile.ZipFile(io.BytesIO(first)) as package:
+                assert all(info.date_time == ZIP_DATE_TIME for info in package.infolist())
+                core = package.read('docProps/core.xml').decode('utf-8')
+            assert core.count(CORE_PROPERTIES_TIMESTAMP) == 2, core
+            print(f"   {backend}: {len(first)} bytes, stable")
+    finally:
+        resume_windows.DOCX_BACKEND = original_backend
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    # The key covers blocks, header and backend
+    assert render_key(BLOCKS, True, 'ooxml') == render_key(list(BLOCKS), True, 'ooxml')
+    assert render_key(BLOCKS, True, 'ooxml') != render_key(BLOCKS, False, 'ooxml')
+    assert render_key(BLOCKS, True, 'ooxml') != render_key(BLOCKS, True, 'python-docx')
+    assert render_key(BLOCKS, True, 'ooxml') != render_key(BLOCKS[:1], True, 'ooxml')
+    print("✅ Renders are byte-identical and keyed by their inputs")
+
+
+def test_unchanged_render_is_skipped():
+    """An up-to-date target is left alone; changed inputs re-render it"""
+    print("🔍 Testing render skip for an unchanged DOCX...")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        optimizer = quiet_optimizer(os.path.join(temp_dir, 'cache'))
+        path = os.path.join(temp_dir, 'resume.docx')
+        optimizer.save_resume_docx(path, BLOCKS)
+        assert read_render_hash(path) == render_key(BLOCKS, False, resume_windows.DOCX_BACKEND)
+        first_stat = os.stat(path)
+
+        optimizer.save_resume_docx(path, BLOCKS)
+        assert os.stat(path).st_ino == first_stat.st_ino and os.stat(path).st_mtime_ns == first_stat.st_mtime_ns
+
+        changed = BLOCKS + [DocxParagraph('ResumeBody', (DocxRun("New line"),))]
+        optimizer.save_resume_docx(path, changed)
+        assert read_render_hash(path) == render_key(changed, False, resume_windows.DOCX_BACKEND)
+        assert b'New line' in zipfile.ZipFile(path).read('word/document.xml')
+
+        # Editing the standard header re-renders even without a renderer version bump
+        header_path = os.path.join(temp_dir, 'with_header.docx')
+        optimizer.save_resume_docx(header_path, BLOCKS, True)
+        original_header = optimizer.standard_header_blocks()
+        optimizer.standard_header_blocks = lambda: [DocxParagraph('Title', (DocxRun("Jane Q Public", 26),), 'center')]
+        optimizer.save_resume_docx(header_path, BLOCKS, True)
+        assert b'Jane Q Public' in zipfile.ZipFile(header_path).read('word/document.xml')
+        assert read_render_hash(header_path) != render_key(BLOCKS, True, resume_windows.DOCX_BACKEND, original_header)
+        del optimizer.standard_header_blocks
+
+        # Overwriting a target never writes through into the cache entry
+        cached = optimizer.render_cache.path_for(render_key(BLOCKS, False, resume_windows.DOCX_BACKEND))
+        assert b'New line' not in zipfile.ZipFile(cached).read('word/document.xml')
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ Unchanged renders are skipped")
+
+
+def test_same_resume_in_new_folder_is_reused():
+    """Optimizing the same posting into another folder reuses the cached DOCX"""
+    print("🔍 Testing render reuse across output folders...")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        optimizer = quiet_optimizer(os.path.join(temp_dir, 'cache'))
+        outputs = []
+        for run in ("first_run", "second_run"):
+            out_dir = os.path.join(temp_dir, run)
+            with contextlib.redirect_stdout(io.StringIO()):
+                results = optimizer.process_complete_optimization(JOB, RESUME, "welder", "Acme Fabrication", '2')
+                optimizer.save_results_to_files(results, out_dir)
+            outputs.append(os.path.join(out_dir, 'optimized_resume.docx'))
+
+        assert optimizer.render_cache.hits == 1
+        first, second = (os.stat(path) for path in outputs)
+        with open(outputs[0], 'rb') as a, open(outputs[1], 'rb') as b:
+            assert a.read() == b.read()
+        assert os.path.exists(outputs[1] + RENDER_HASH_SUFFIX)
+        # Deliverables are private copies: editing one in place leaves the cache intact
+        assert first.st_ino != second.st_ino and second.st_nlink == 1
+        cached = optimizer.render_cache.path_for(read_render_hash(outputs[1]))
+        with open(outputs[1], 'r+b') as f:
+            f.write(b'edited')
+        with open(cached, 'rb') as c, open(outputs[0], 'rb') as a:
+            assert c.read() == a.read()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ Identical resumes in different folders are not re-rendered")
+
+
+if __name__ == "__main__":
+    test_renders_are_deterministic()
+    test_unchanged_render_is_skipped()
+    test_same_resume_in_new_folder_is_reused()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Test single-archive bundled output"""
+
+import sys
+import os
+import io
+import json
+import zipfile
+import hashlib
+import contextlib
+import tempfile
+import shutil
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from resume_windows import ResumeOptimizer
+from render_cache import RenderCache
+from result_bundle import MANIFEST_NAME, ResultBundle, ResultBundleWriter, is_result_bundle
+from docx import Document
+
+JOB = "Seeking a data scientist with Python, SQL and machine learning experience."
+RESUME = "Jane Q Public\nSkills: Python, SQL\nEducation: Example University, 2012"
+
+
+def test_writer_and_lazy_reader():
+    """Members round-trip with checksums and load only when asked for"""
+    print("🔍 Testing bundle writer and reader...")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        writer = ResultBundleWriter()
+        writer.add_text('report.txt', 'héllo wörld', key='1_report')
+        writer.add('resume.docx', b'PK fake docx bytes')
+        path = writer.write(os.path.join(temp_dir, 'nested', 'run.zip'))
+
+        with zipfile.ZipFile(path) as package:
+            assert package.namelist()[0] == MANIFEST_NAME
+            assert package.getinfo('resume.docx').compress_type == zipfile.ZIP_STORED
+            assert package.getinfo('report.txt').compress_type == zipfile.ZIP_DEFLATED
+
+        with ResultBundle(path) as bundle:
+            assert bundle._zip is None  # nothing read until first use
+            assert bundle.names() == ['report.txt', 'resume.docx']
+            assert bundle.entry('report.txt')['key'] == '1_report'
+            assert bundle.read_text('report.txt') == 'héllo wörld'
+            with bundle.open('resume.docx') as stream:
+                assert stream.read(2) == b'PK'
+            assert 'missing.txt' not in bundle
+            try:
+                bundle.read_bytes('missing.txt')
+                assert False, "missing member should raise"
+            except KeyError:
+                pass
+            extracted = bundle.extract('report.txt', os.path.join(temp_dir, 'out'))
+            with open(extracted, encoding='utf-8') as f:
+                assert f.read() == 'héllo wörld'
+
+        assert is_result_bundle(path)
+        try:
+            writer.add('manifest.json', b'{}')
+            assert False, "manifest name should be reserved"
+        except ValueError:
+            pass
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ Bundles round-trip and read lazily")
+
+
+def test_save_results_bundle():
+    """--bundle writes one zip holding every file a folder run would create"""
+    print("🔍 Testing bundled save_results_to_files...")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            optimizer = ResumeOptimizer(render_cache=RenderCache(os.path.join(temp_dir, 'cache')))
+            results = optimizer.process_complete_optimization(JOB, RESUME, "data scientist", "Acme", '3')
+            folder = optimizer.save_results_to_files(results, os.path.join(temp_dir, 'folder_run'), ('md',))
+            bundle_path = optimizer.save_results_to_files(results, os.path.join(temp_dir, 'bundle_run'), ('md',), bundle=True)
+
+        assert bundle_path == os.path.join(temp_dir, 'bundle_run.zip')
+        assert not os.path.exists(os.path.join(temp_dir, 'bundle_run'))
+        assert optimizer.output_bundle is None
+
+        folder_files = sorted(f for f in os.listdir(folder) if not f.endswith('.render-hash'))
+        with ResultBundle(bundle_path) as bundle:
+            assert sorted(bundle.names()) == folder_files
+            for name in folder_files:
+                with open(os.path.join(folder, name), 'rb') as f:
+                    assert bundle.read_bytes(name) == f.read(), name
+            docx_entry = bundle.entry('optimized_resume.docx')
+            assert len(docx_entry['render_key']) == 64
+            assert bundle.entry('combined_comprehensive_resume.txt')['key'] == '7_combined_resume'
+            Document(bundle.open('optimized_resume.docx'))
+
+            manifest = json.loads(zipfile.ZipFile(bundle_path).read(MANIFEST_NAME))
+            for entry in manifest['files']:
+                assert hashlib.sha256(bundle.read_bytes(entry['name'], verify=False)).hexdigest() == entry['sha256']
+        print(f"   {len(folder_files)} files -> 1 bundle ({os.path.getsize(bundle_path)} bytes)")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ A bundled run matches a folder run in one file")
+
+
+if __name__ == "__main__":
+    test_writer_and_lazy_reader()
+    test_save_results_bundle()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Test bulk resume ingestion into JSON lines"""
+
+import sys
+import os
+import json
+import subprocess
+import tempfile
+import shutil
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import resume_ingest
+from resume_cache import ResumeParseCache
+from resume_ingest import ingest_directory
+from run_index import RUN_INDEX_NAME, RunIndex
+
+
+def create_resume_folder():
+    """Create a folder of sample resumes plus one unreadable file"""
+    temp_dir = tempfile.mkdtemp()
+    nested = os.path.join(temp_dir, 'week_42')
+    os.makedirs(nested)
+
+    for i in range(7):
+        folder = nested if i % 2 else temp_dir
+        with open(os.path.join(folder, f'candidate_{i}.txt'), 'w', encoding='utf-8') as f:
+            f.write(f"Candidate Number{i}\nEmail: candidate{i}@email.com\n\nSkills:\nPython, SQL, Git\n")
+
+    # Not a valid DOCX - should produce an error record, not abort the run
+    with open(os.path.join(temp_dir, 'broken.docx'), 'wb') as f:
+        f.write(b'not a zip file')
+
+    # Ignored: wrong extension
+    with open(os.path.join(temp_dir, 'notes.md'), 'w') as f:
+        f.write('ignore me')
+
+    return temp_dir
+
+
+def test_ingest_directory():
+    """Every resume should produce exactly one JSON line with an error column"""
+    print("🔍 Testing bulk resume ingestion...")
+
+    temp_dir = create_resume_folder()
+    out_dir = tempfile.mkdtemp()
+    try:
+        out_path = os.path.join(out_dir, 'resumes.jsonl')
+        cache = ResumeParseCache(os.path.join(out_dir, 'cache.sqlite3'))
+
+        counts = ingest_directory(temp_dir, out_path, workers=2, chunk_size=3,
+                                  cache=cache, show_progress=False)
+
+        with open(out_path, 'r', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+
+        assert counts['total'] == 8
+        assert len(records) == 8
+        errors = [r for r in records if r['error']]
+        assert len(errors) == 1 and errors[0]['path'].endswith('broken.docx')
+        parsed = [r for r in records if not r['error']]
+        assert all(r['info']['name'].startswith('CANDIDATE NUMBER') for r in parsed)
+        print(f"✅ {len(parsed)} resumes parsed, 1 error recorded")
+
+        # Second run is served entirely from the parse cache
+        counts = ingest_directory(temp_dir, out_path, workers=2, chunk_size=3,
+                                  cache=cache, show_progress=False)
+        assert counts['cached'] == 7
+        print("✅ Re-ingestion served from cache")
+        cache.close()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+
+def test_killed_worker_does_not_abort_run():
+    """A worker that dies fails its in-flight chunks; the pool is rebuilt for the rest"""
+    print("🔍 Testing recovery from a killed worker...")
+
+    temp_dir = create_resume_folder()
+    out_dir = tempfile.mkdtemp()
+    with open(os.path.join(temp_dir, 'a_crash.txt'), 'w', encoding='utf-8') as f:
+        f.write('kills its worker')
+    original_read = resume_ingest.read_document_text
+
+    def read_or_die(path):
+        if path.endswith('a_crash.txt'):
+            os._exit(1)  # what SIGALRM or the OOM killer looks like to the pool
+        return original_read(path)
+
+    try:
+        # Forked workers inherit the patched reader
+        resume_ingest.read_document_text = read_or_die
+        out_path = os.path.join(out_dir, 'resumes.jsonl')
+        counts = ingest_directory(temp_dir, out_path, workers=1, chunk_size=1, show_progress=False)
+
+        with open(out_path, 'r', encoding='utf-8') as f:
+            records = {os.path.basename(r['path']): r for r in map(json.loads, f)}
+
+        assert counts['total'] == 9 and len(records) == 9
+        assert records['a_crash.txt']['error'].startswith('BrokenProcessPool')
+        crashed = [name for name, r in records.items() if (r['error'] or '').startswith('BrokenProcessPool')]
+        assert len(crashed) <= 2  # the crashing chunk and at most one queued behind it
+        errors = [name for name, r in records.items() if r['error']]
+        assert counts['parsed'] == 9 - len(errors) and counts['parsed'] >= 6
+        print(f"✅ Run completed after a worker died ({len(crashed)} chunks failed)")
+    finally:
+        resume_ingest.read_document_text = original_read
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        shutil.rmtree(out_dir, ignore_errors=True)
+
+
+def test_ingest_exit_status():
+    """`resume_windows.py ingest` exits non-zero for a missing directory or failed files"""
+    print("🔍 Testing ingest exit status...")
+    temp_dir = create_resume_folder()
+    out_dir = tempfile.mkdtemp()
+    try:
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resume_windows.py')
+
+        def ingest(directory):
+            return subprocess.run([sys.executable, script, 'ingest', directory, '--no-cache', '--jobs', '1',
+                                   '--out', os.path.join(out_dir, 'resumes.jsonl')],
+                                  cwd=out_dir, capture_output=True, timeout=120).returncode
+
+        assert ingest(os.path.join(temp_dir, 'missing')) == 1
+        assert ingest(temp_dir) == 1  # broken.docx fails
+        os.remove(os.path.join(temp_dir, 'broken.docx'))
+        assert ingest(temp_dir) == 0
+
+        # Completed ingests are logged in the run index of the working directory
+        runs = list(RunIndex(os.path.join(out_dir, RUN_INDEX_NAME)).runs(kind='ingest'))
+        assert [run['errors'] for run in runs] == [0, 1]
+        assert runs[0]['path'] == os.path.join(out_dir, 'resumes.jsonl')
+        assert runs[0]['source'] == os.path.abspath(temp_dir)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        shutil.rmtree(out_dir, ignore_errors=True)
+    print("✅ Ingest failures are visible in the exit status")
+
+
+if __name__ == "__main__":
+    test_ingest_directory()
+    test_killed_worker_does_not_abort_run()
+    test_ingest_exit_status()
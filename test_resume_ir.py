@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Test the resume IR and its text, Markdown, HTML and DOCX renderers"""
+
+import sys
+import os
+import io
+import argparse
+import contextlib
+import tempfile
+import shutil
+import atexit
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Renders go to a throwaway cache, never the shared ~/.resume_optimizer one
+os.environ['RESUME_RENDER_CACHE'] = tempfile.mkdtemp(prefix='render_cache_')
+atexit.register(shutil.rmtree, os.environ['RESUME_RENDER_CACHE'], True)
+
+from resume_windows import ResumeOptimizer, parse_export_formats
+from resume_ir import (BulletList, Link, Paragraph, ResumeDocument, Section, render_docx_blocks,
+                       render_html, render_markdown, render_text, section_from_text)
+from ooxml_writer import write_docx
+from docx import Document
+
+RESUME = """Jane Q Public
+Phone: 555-0100 | https://example.com/jane
+Skills: Python, SQL, Kubernetes
+Education: Example University — B.S. Physics, 2012
+Experience:
+Engineer at Acme 2015-2020
+- Built data pipelines"""
+
+JOB = "Seeking a data scientist with Python, SQL and machine learning experience."
+
+
+def quiet_optimizer():
+    with contextlib.redirect_stdout(io.StringIO()):
+        return ResumeOptimizer()
+
+
+def test_text_layout():
+    """Sections render as 'HEADING:' blocks separated by blank lines"""
+    print("🔍 Testing plain-text rendering...")
+    doc = ResumeDocument('test', 'NAME', 'Headline', [
+        Section('CONTACT INFORMATION', [Paragraph(['Site: ', Link('https://a.example')])], 'contact'),
+        Section('EXPERIENCE', [Paragraph(['Title']), BulletList(['one', 'two'])], 'experience', spaced=True),
+        Section('EMPTY', [BulletList([])]),
+        Section(None, [Paragraph(['footer'])]),
+    ], title='BANNER', hook='')
+
+    assert render_text(doc) == ("BANNER\n\n\n\nNAME\nHeadline\n\nCONTACT INFORMATION:\nSite: https://a.example\n\n"
+                                "EXPERIENCE:\n\nTitle\n• one\n• two\n\nEMPTY:\n\n\nfooter")
+
+    section = section_from_text("FUTURE VISION:\nMy story continues.", 'vision')
+    assert section.heading == 'FUTURE VISION' and section.plain_text() == 'My story continues.'
+    assert section_from_text("no heading here").heading is None
+    print("✅ Plain-text layout matches the resume text format")
+
+
+def test_generators_render_existing_text():
+    """create_* return the text render of the documents the pipeline builds"""
+    print("🔍 Testing generators against their documents...")
+    optimizer = quiet_optimizer()
+    for role in ["data scientist", "welder", "software engineer"]:
+        with contextlib.redirect_stdout(io.StringIO()):
+            analysis = optimizer.analyze_job_posting(JOB, role, "Acme")
+            narrative_doc = optimizer.build_narrative_resume_document(RESUME, analysis, role, "Acme")
+            enhanced_doc = optimizer.build_enhanced_resume_document(RESUME, analysis, role, "Acme")
+            narrative = optimizer.create_narrative_resume(RESUME, analysis, role, "Acme")
+            enhanced = optimizer.create_enhanced_resume(RESUME, analysis, role, "Acme")
+            combined_text = optimizer.create_combined_resume(narrative, enhanced, role, "Acme")
+            combined_doc = optimizer.build_combined_resume_document(narrative_doc, enhanced_doc, role, "Acme")
+
+        assert render_text(narrative_doc) == narrative
+        assert render_text(enhanced_doc) == enhanced
+        assert narrative.startswith(f"CAREER STORY RESUME - {role.upper()}\n\n")
+        assert "\nPROFESSIONAL NARRATIVE:\n" in narrative and "\nCAREER JOURNEY & IMPACT STORY:\n\nChapter 1" in narrative
+        assert enhanced.startswith("RYAN THOMAS WEILER\n") and "\nPROFESSIONAL EXPERIENCE:\n\n" in enhanced
+
+        # Picking sections from the documents gives the same combined resume as parsing the text
+        assert render_text(combined_doc) == combined_text
+        assert combined_doc.section('skills').bullets()[:6] == [s.strip() for s in enhanced_doc.section('skills').bullets()][:6]
+        print(f"   {role}: narrative {len(narrative)} chars, combined {len(combined_text)} chars")
+    print("✅ Generators build documents that render to the resume text")
+
+
+def test_markdown_and_html():
+    """Markdown and HTML keep headings, bullets and links, and HTML is escaped"""
+    print("🔍 Testing Markdown and HTML rendering...")
+    doc = ResumeDocument('test', 'A & B', 'Engineer <II>', [
+        Section('CONTACT INFORMATION', [Paragraph(['GitHub: ', Link('https://github.com/x?a=1&b=2')])], 'contact'),
+        Section("EDUCATION THAT SHAPED MY PATH", [Paragraph(["Line one\n• inner bullet"])], 'education'),
+        Section('SKILLS', [BulletList(['C++ & <templates>'])], 'skills'),
+    ], hook='🔥 THE HOOK')
+
+    markdown = render_markdown(doc)
+    assert markdown.startswith("# A & B\n\n**Engineer <II>**\n\n> 🔥 THE HOOK\n")
+    assert "## Education That Shaped My Path" in markdown
+    assert "GitHub: <https://github.com/x?a=1&b=2>" in markdown
+    assert "- inner bullet" in markdown and "- C++ & <templates>" in markdown
+
+    page = render_html(doc)
+    assert page.startswith("<!DOCTYPE html>") and '<meta charset="utf-8">' in page
+    assert "<h1>A &amp; B</h1>" in page
+    assert '<a href="https://github.com/x?a=1&amp;b=2">https://github.com/x?a=1&amp;b=2</a>' in page
+    assert "<li>C++ &amp; &lt;templates&gt;</li>" in page
+    assert "<templates>" not in page
+    print("✅ Markdown and HTML renderers keep structure and links")
+
+
+def test_docx_blocks():
+    """The DOCX render opens in python-docx with headings, bullets and live links"""
+    print("🔍 Testing DOCX rendering from the IR...")
+    optimizer = quiet_optimizer()
+    with contextlib.redirect_stdout(io.StringIO()):
+        analysis = optimizer.analyze_job_posting(JOB, "data scientist", "Acme")
+        doc = optimizer.build_narrative_resume_document(RESUME, analysis, "data scientist", "Acme")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        path = os.path.join(temp_dir, 'resume.docx')
+        write_docx(path, render_docx_blocks(doc))
+        rendered = Document(path)
+        texts = [p.text for p in rendered.paragraphs]
+        assert texts[0] == doc.hook and doc.name in texts
+        assert "Key Achievements That Define My Story" in texts
+        headings = [p.text for p in rendered.paragraphs if p.style.name == 'ResumeHeading']
+        assert len(headings) == len([s for s in doc.sections if s.heading]) - 1  # contact is centered, not titled
+        assert any(t.startswith("• ") for t in texts)
+        links = [r.target_ref for r in rendered.part.rels.values() if r.reltype.endswith('/hyperlink')]
+        assert "https://example.com/jane" in links
+        print(f"   {len(texts)} paragraphs, {len(headings)} headings, {len(links)} links")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ DOCX render opens with headings and hyperlinks")
+
+
+def test_save_results_exports_formats():
+    """One optimization run writes every requested format for each resume version"""
+    print("🔍 Testing multi-format export...")
+    optimizer = quiet_optimizer()
+    temp_dir = tempfile.mkdtemp()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            results = optimizer.process_complete_optimization(JOB, RESUME, "data scientist", "Acme", '3')
+            optimizer.save_results_to_files(results, temp_dir, ('md', 'html', 'docx'))
+        files = set(os.listdir(temp_dir))
+        for stem in ('combined_comprehensive_resume', 'narrative_only_reference', 'enhanced_only_reference'):
+            for ext in ('txt', 'md', 'html', 'docx'):
+                assert f"{stem}.{ext}" in files, f"{stem}.{ext} missing"
+        assert 'job_analysis_report.md' not in files
+
+        with open(os.path.join(temp_dir, 'combined_comprehensive_resume.md'), encoding='utf-8') as f:
+            assert f.read().startswith("# RYAN THOMAS WEILER\n")
+
+        # The main DOCX is the combined resume rendered from the same document
+        with open(os.path.join(temp_dir, 'optimized_resume.docx'), 'rb') as main, \
+                open(os.path.join(temp_dir, 'combined_comprehensive_resume.docx'), 'rb') as combined:
+            assert main.read() == combined.read()
+
+        # Without formats only the usual files are written
+        plain_dir = os.path.join(temp_dir, 'plain')
+        with contextlib.redirect_stdout(io.StringIO()):
+            optimizer.save_results_to_files(results, plain_dir)
+        assert not [f for f in os.listdir(plain_dir) if f.endswith(('.md', '.html'))]
+        print(f"   {len(files)} files written")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+    assert parse_export_formats("md, .HTML,md") == ('md', 'html')
+    try:
+        parse_export_formats("md,pdf")
+        assert False, "pdf should be rejected"
+    except argparse.ArgumentTypeError:
+        pass
+    print("✅ Extra formats are rendered from the same build")
+
+
+if __name__ == "__main__":
+    test_text_layout()
+    test_generators_render_existing_text()
+    test_markdown_and_html()
+    test_docx_blocks()
+    test_save_results_exports_formats()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Test the persistent resume parse cache"""
+
+import sys
+import os
+import time
+import tempfile
+import shutil
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import resume_cache
+from resume_cache import ResumeParseCache
+from resume_windows import ResumeOptimizer
+
+SAMPLE_RESUME = """Jane Doe
+Email: jane.doe@email.com | Phone: (555) 123-4567
+
+Experience:
+Senior Welder - Gulf Coast Fabrication (2018-2024)
+- Performed structural welding on offshore platforms
+
+Skills:
+MIG, TIG, Stick, Blueprint Reading
+
+Education:
+Certified Welding Program, Tampa Technical Institute
+"""
+
+
+def test_resume_parsed_once():
+    """A resume run against many postings should only be parsed once"""
+    print("🔍 Testing resume parse cache...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        resume_path = os.path.join(temp_dir, 'resume.txt')
+        with open(resume_path, 'w', encoding='utf-8') as f:
+            f.write(SAMPLE_RESUME)
+
+        cache = ResumeParseCache(os.path.join(temp_dir, 'cache.sqlite3'))
+        parse_calls = []
+
+        def read_text(path):
+            parse_calls.append(path)
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+
+        optimizer = ResumeOptimizer()
+        for _ in range(5):
+            text, info = cache.load(resume_path, read_text, optimizer.extract_resume_information)
+
+        assert len(parse_calls) == 1
+        assert cache.misses == 1 and cache.hits == 4
+        assert text == SAMPLE_RESUME
+        assert info['name'] == 'JANE DOE'
+        print("✅ Resume parsed once across 5 loads")
+
+        # A fresh cache instance on the same database is still warm
+        second = ResumeParseCache(cache.db_path)
+        second.load(resume_path, read_text, optimizer.extract_resume_information)
+        assert len(parse_calls) == 1 and second.hits == 1
+        print("✅ Cache persists across processes")
+
+        # Editing the file invalidates the entry
+        time.sleep(0.01)
+        with open(resume_path, 'a', encoding='utf-8') as f:
+            f.write("Projects:\nBuilt a custom pipe-welding rig for the shop\n")
+        text, info = second.load(resume_path, read_text, optimizer.extract_resume_information)
+        assert len(parse_calls) == 2
+        assert 'pipe-welding' in text
+        print("✅ Changed file is re-parsed")
+
+        cache.close()
+        second.close()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_stat_fast_path_skips_hashing():
+    """An unchanged file (same mtime and size) should not be re-hashed"""
+    print("🔍 Testing file-stat fast path...")
+
+    temp_dir = tempfile.mkdtemp()
+    original_hash_file = resume_cache.hash_file
+    hash_calls = []
+
+    def counting_hash_file(path, *args, **kwargs):
+        hash_calls.append(path)
+        return original_hash_file(path, *args, **kwargs)
+
+    try:
+        resume_path = os.path.join(temp_dir, 'resume.txt')
+        with open(resume_path, 'w', encoding='utf-8') as f:
+            f.write(SAMPLE_RESUME)
+
+        resume_cache.hash_file = counting_hash_file
+        cache = ResumeParseCache(os.path.join(temp_dir, 'cache.sqlite3'))
+        first = cache.content_hash(resume_path)
+        second = cache.content_hash(resume_path)
+
+        assert first == second
+        assert len(hash_calls) == 1
+        print("✅ Second lookup served from file stats")
+        cache.close()
+    finally:
+        resume_cache.hash_file = original_hash_file
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_optimizer_load_resume_file():
+    """ResumeOptimizer.load_resume_file should prime extract_resume_information"""
+    print("🔍 Testing ResumeOptimizer.load_resume_file...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        resume_path = os.path.join(temp_dir, 'resume.txt')
+        with open(resume_path, 'w', encoding='utf-8') as f:
+            f.write(SAMPLE_RESUME)
+
+        optimizer = ResumeOptimizer(parse_cache=ResumeParseCache(os.path.join(temp_dir, 'cache.sqlite3')))
+        content = optimizer.load_resume_file(resume_path)
+
+        calls = []
+        original = optimizer._extract_resume_information_uncached
+        optimizer._extract_resume_information_uncached = lambda text: calls.append(text) or original(text)
+
+        info = optimizer.extract_resume_information(content)
+        assert info['name'] == 'JANE DOE'
+        assert calls == []
+        print("✅ Resume info served from cache without re-parsing")
+        optimizer.parse_cache.close()
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_bare_optimizer_keeps_no_cache():
+    """Without an attached cache, load_resume_file parses directly and writes no database"""
+    print("🔍 Testing load_resume_file without a parse cache...")
+
+    temp_dir = tempfile.mkdtemp()
+    original_env = os.environ.get('RESUME_PARSE_CACHE')
+    try:
+        default_path = os.path.join(temp_dir, 'default_cache.sqlite3')
+        os.environ['RESUME_PARSE_CACHE'] = default_path
+        resume_path = os.path.join(temp_dir, 'resume.txt')
+        with open(resume_path, 'w', encoding='utf-8') as f:
+            f.write(SAMPLE_RESUME)
+
+        optimizer = ResumeOptimizer()
+        assert optimizer.load_resume_file(resume_path) == SAMPLE_RESUME
+        assert optimizer.parse_cache is None and not os.path.exists(default_path)
+        print("✅ Library use leaves no persistent cache behind")
+    finally:
+        if original_env is None:
+            os.environ.pop('RESUME_PARSE_CACHE', None)
+        else:
+            os.environ['RESUME_PARSE_CACHE'] = original_env
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_resume_parsed_once()
+    test_stat_fast_path_skips_hashing()
+    test_optimizer_load_resume_file()
+    test_bare_optimizer_keeps_no_cache()
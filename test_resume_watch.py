@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Test hot-folder watch mode"""
+
+import sys
+import os
+import tempfile
+import shutil
+import contextlib
+import io
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from resume_windows import ResumeOptimizer
+from resume_cache import ResumeParseCache
+from resume_watch import HotFolderWatcher, LEDGER_NAME, is_posting_file, run_watch_command
+from run_index import RunIndex
+
+RESUME = "Jane Doe\nEmail: jane.doe@email.com\n\nSkills:\nPipefitting, Welding, Blueprints"
+
+
+def make_watcher(inbox, outbox, resume_path, settle_seconds=0):
+    with contextlib.redirect_stdout(io.StringIO()):
+        # Resume parses stay in the test's temporary folder
+        optimizer = ResumeOptimizer(parse_cache=ResumeParseCache(os.path.join(os.path.dirname(outbox), 'parse_cache.sqlite3')))
+    return HotFolderWatcher(optimizer, inbox, outbox, resume_path, 'Welder',
+                            style_choice='2', settle_seconds=settle_seconds, quiet=True)
+
+
+def result_dirs(outbox):
+    return sorted(d for d in os.listdir(outbox) if not d.startswith('.'))
+
+
+def test_partial_file_names_ignored():
+    """Hidden, Office lock and in-progress download files should be skipped"""
+    assert is_posting_file('welder.txt') and is_posting_file('Plumber.DOCX')
+    for name in ('.welder.txt', '~$welder.docx', 'welder.txt.part', 'welder.pdf.crdownload', 'notes.md'):
+        assert not is_posting_file(name), name
+    print("✅ Partial and non-posting files ignored")
+
+
+def test_debounce_and_ledger():
+    """Postings are processed once settled, published atomically and not redone after restart"""
+    print("🔍 Testing hot-folder watch mode...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        inbox = os.path.join(temp_dir, 'inbox')
+        outbox = os.path.join(temp_dir, 'outbox')
+        os.makedirs(inbox)
+        resume_path = os.path.join(temp_dir, 'resume.txt')
+        with open(resume_path, 'w', encoding='utf-8') as f:
+            f.write(RESUME)
+
+        posting = os.path.join(inbox, 'welder.txt')
+        with open(posting, 'w', encoding='utf-8') as f:
+            f.write("Certified Welder - TIG and MIG welding")
+
+        watcher = make_watcher(inbox, outbox, resume_path, settle_seconds=5)
+        assert watcher.poll(now=100.0) == []
+        # Still being written: the changed stat restarts the settle window
+        with open(posting, 'a', encoding='utf-8') as f:
+            f.write(" on structural steel")
+        assert watcher.poll(now=104.0) == []
+        assert watcher.poll(now=106.0) == []
+        processed = watcher.poll(now=109.5)
+        assert len(processed) == 1
+        assert watcher.poll(now=120.0) == []
+        print("✅ Posting processed once after it settled")
+
+        published = result_dirs(outbox)
+        assert len(published) == 1 and published[0].startswith('welder_')
+        with open(os.path.join(outbox, published[0], 'enhanced_standard_resume.txt'), encoding='utf-8') as f:
+            assert f.read().strip()
+        assert not [d for d in os.listdir(outbox) if d.startswith('.staging')]
+        assert os.path.exists(os.path.join(outbox, LEDGER_NAME))
+
+        # Restart: the ledger prevents reprocessing, even after a touch
+        os.utime(posting, None)
+        restarted = make_watcher(inbox, outbox, resume_path)
+        assert restarted.poll() == []
+        assert len(result_dirs(outbox)) == 1
+        print("✅ Restart did not reprocess the posting")
+
+        # Changed content is processed again
+        with open(posting, 'w', encoding='utf-8') as f:
+            f.write("Pipe Welder - pipeline welding, 6G certification")
+        assert len(restarted.poll()) == 1
+        assert len(result_dirs(outbox)) == 2
+        print("✅ Changed posting reprocessed")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_failed_posting_recorded():
+    """An unreadable posting is logged in the ledger and leaves no partial output"""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        inbox = os.path.join(temp_dir, 'inbox')
+        outbox = os.path.join(temp_dir, 'outbox')
+        os.makedirs(inbox)
+        with open(os.path.join(inbox, 'empty.txt'), 'w') as f:
+            f.write("   ")
+
+        watcher = make_watcher(inbox, outbox, RESUME)
+        assert watcher.poll() == []
+        assert watcher.ledger.get('empty.txt')['error']
+        assert result_dirs(outbox) == []
+        print("✅ Failed posting recorded without partial output")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_watch_command_indexes_runs():
+    """Folders published by `resume_windows.py watch` are logged in the run index"""
+    temp_dir = tempfile.mkdtemp()
+    original_env = {name: os.environ.get(name) for name in ('RESUME_RUN_INDEX', 'RESUME_PARSE_CACHE')}
+    try:
+        inbox = os.path.join(temp_dir, 'inbox')
+        os.makedirs(inbox)
+        with open(os.path.join(inbox, 'welder.txt'), 'w') as f:
+            f.write("Welder needed: MIG/TIG welding, blueprint reading, pipefitting.")
+        os.environ['RESUME_RUN_INDEX'] = os.path.join(temp_dir, 'runs.jsonl')
+        os.environ['RESUME_PARSE_CACHE'] = os.path.join(temp_dir, 'parse_cache.sqlite3')
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert run_watch_command([inbox, '--resume', RESUME, '--style', '2', '--once', '--quiet']) == 0
+        published = result_dirs(inbox + '_outbox')
+        assert len(published) == 1
+        run = RunIndex(os.environ['RESUME_RUN_INDEX']).latest()
+        assert run['kind'] == 'folder' and run['path'] == os.path.join(inbox + '_outbox', published[0])
+        assert run['style'] == '2'
+        print("✅ Watch mode runs are indexed")
+    finally:
+        for name, value in original_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    test_partial_file_names_ignored()
+    test_debounce_and_ledger()
+    test_failed_posting_recorded()
+    test_watch_command_indexes_runs()
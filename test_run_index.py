@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Test the run index and latest-output lookups"""
+
+import sys
+import os
+import io
+import json
+import contextlib
+import tempfile
+import shutil
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import run_index
+from resume_windows import ResumeOptimizer
+from render_cache import RenderCache
+from run_index import RUN_INDEX_NAME, RunIndex, latest_output_folder
+
+JOB = "Seeking a data scientist with Python, SQL and machine learning experience."
+RESUME = "Jane Q Public\nSkills: Python, SQL\nEducation: Example University, 2012"
+
+
+def test_queries_newest_first():
+    """latest/by_field/by_company read the index from its end"""
+    print("🔍 Testing run index queries...")
+    temp_dir = tempfile.mkdtemp()
+    original_block = run_index.READ_BLOCK_SIZE
+    try:
+        run_index.READ_BLOCK_SIZE = 64  # force lines to straddle read blocks
+        index = RunIndex(os.path.join(temp_dir, RUN_INDEX_NAME))
+        assert index.latest() is None and index.by_field('chef') == []
+        for i in range(40):
+            path = os.path.join(temp_dir, f"browse_mode_output_{i:03d}")
+            os.makedirs(path)
+            index.append(path, field='chef' if i % 2 else 'welder', company=f"Co {i % 3}")
+
+        assert index.latest()['path'].endswith('browse_mode_output_039')
+        assert index.latest(field='welder')['path'].endswith('browse_mode_output_038')
+        assert [os.path.basename(r['path'])[-3:] for r in index.by_company('Co 0', limit=3)] == ['039', '036', '033']
+        assert len(index.by_field('chef')) == 20
+        assert len(list(index.runs())) == 40
+
+        # Deleted outputs and torn lines are skipped
+        shutil.rmtree(os.path.join(temp_dir, 'browse_mode_output_039'))
+        with open(index.path, 'a', encoding='utf-8') as f:
+            f.write('{"path": "/tmp/tor')
+        assert index.latest()['path'].endswith('browse_mode_output_038')
+        assert index.latest(existing=False)['path'].endswith('browse_mode_output_039')
+    finally:
+        run_index.READ_BLOCK_SIZE = original_block
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ Queries return the newest matching runs")
+
+
+def test_saved_runs_are_indexed():
+    """save_results_to_files logs each run and tools find it without scanning"""
+    print("🔍 Testing run logging from save_results_to_files...")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        # Folders from before the index still turn up through the directory scan
+        os.makedirs(os.path.join(temp_dir, 'browse_mode_output_20200101_000000'))
+        assert latest_output_folder(directory=temp_dir) == os.path.join(temp_dir, 'browse_mode_output_20200101_000000')
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            optimizer = ResumeOptimizer(render_cache=RenderCache(os.path.join(temp_dir, 'cache')))
+            optimizer.run_index = RunIndex(os.path.join(temp_dir, RUN_INDEX_NAME))
+            results = optimizer.process_complete_optimization(JOB, RESUME, "data scientist", "Acme", '2')
+            folder = optimizer.save_results_to_files(results, os.path.join(temp_dir, 'browse_mode_output_a'))
+            bundle = optimizer.save_results_to_files(results, os.path.join(temp_dir, 'browse_mode_output_b'), bundle=True)
+
+        with open(os.path.join(temp_dir, RUN_INDEX_NAME), encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        assert [(r['kind'], r['path']) for r in records] == [('folder', folder), ('bundle', bundle)]
+        assert records[0]['company'] == 'Acme' and records[0]['style'] == '2'
+        assert records[0]['field'] == optimizer.current_detected_field
+        assert '7_enhanced_resume' in records[0]['keys']
+
+        # The bundle is newer, but only folders are returned for the folder-reading tools
+        assert latest_output_folder(directory=temp_dir) == folder
+        assert RunIndex(os.path.join(temp_dir, RUN_INDEX_NAME)).latest()['kind'] == 'bundle'
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ Saved runs are indexed and found without a directory scan")
+
+
+if __name__ == "__main__":
+    test_queries_newest_first()
+    test_saved_runs_are_indexed()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Test staged, all-or-nothing output folders"""
+
+import sys
+import os
+import io
+import contextlib
+import tempfile
+import shutil
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import staged_output
+from resume_windows import ResumeOptimizer
+from render_cache import RenderCache
+from docx_render_farm import DocxRenderFarm
+from run_index import RUN_INDEX_NAME, RunIndex
+from staged_output import STAGING_PREFIX, StagedOutput, unique_output_dir
+
+JOB = "Seeking a welder with MIG, TIG and blueprint reading experience."
+RESUME = "Jane Q Public\nSkills: MIG welding, TIG welding\nEducation: Example Technical College, 2012"
+
+
+def test_unique_names():
+    """Names made in the same second still differ and sort by time"""
+    print("🔍 Testing collision-free output names...")
+    names = {unique_output_dir('browse_mode_output') for _ in range(50)}
+    assert len(names) == 50
+    prefix, date, clock, token = next(iter(names)).rsplit('_', 3)
+    assert prefix == 'browse_mode_output' and len(date) == 8 and len(clock) == 6 and len(token) == 8
+    print("✅ Output names are unique")
+
+
+def test_publish_hold_and_failure():
+    """Folders appear only when complete; failed writes publish nothing"""
+    print("🔍 Testing staged publishing...")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        final = os.path.join(temp_dir, 'run')
+        staged = StagedOutput(final)
+        staged.write_text('a.txt', 'alpha')
+        staged.hold()  # a render still in flight
+        assert staged.close() is False and not os.path.exists(final)
+        with open(os.path.join(staged.staging_dir, 'b.docx'), 'wb') as f:
+            f.write(b'docx')
+        staged.release()
+        assert staged.committed and sorted(os.listdir(final)) == ['a.txt', 'b.docx']
+        assert not os.path.exists(staged.staging_dir)
+
+        # Saving into an existing folder replaces its files and keeps the rest
+        staged = StagedOutput(final)
+        staged.write_text('a.txt', 'beta')
+        assert staged.close()
+        with open(os.path.join(final, 'a.txt'), encoding='utf-8') as f:
+            assert f.read() == 'beta'
+        assert os.path.exists(os.path.join(final, 'b.docx'))
+
+        broken = os.path.join(temp_dir, 'broken')
+        staged = StagedOutput(broken)
+        staged.write_text('ok.txt', 'fine')
+        staged.write_text(os.path.join('missing_dir', 'x.txt'), 'fails')
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert staged.close() is False
+        assert list(staged.errors) == [os.path.join('missing_dir', 'x.txt')]
+        assert not os.path.exists(broken) and not os.path.exists(staged.staging_dir)
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ Output is published all at once or not at all")
+
+
+def test_crash_leaves_no_folder():
+    """An exception mid-save leaves neither a partial folder nor a staging folder"""
+    print("🔍 Testing save_results_to_files crash safety...")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            optimizer = ResumeOptimizer(render_cache=RenderCache(os.path.join(temp_dir, 'cache')))
+            results = optimizer.process_complete_optimization(JOB, RESUME, "welder", "Acme", '2')
+            good = optimizer.save_results_to_files(results, os.path.join(temp_dir, 'good'))
+        assert os.path.exists(os.path.join(good, 'optimized_resume.docx'))
+        assert os.path.exists(os.path.join(good, 'job_analysis_report.txt'))
+
+        def crash(*args, **kwargs):
+            raise RuntimeError("renderer crashed")
+        optimizer.create_docx_from_document = crash
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                optimizer.save_results_to_files(results, os.path.join(temp_dir, 'crashed'))
+            assert False, "expected the crash to propagate"
+        except RuntimeError:
+            pass
+        assert optimizer.staged_output is None
+        assert sorted(os.listdir(temp_dir)) == ['cache', 'good']
+        assert not any(name.startswith(STAGING_PREFIX) for name in os.listdir(temp_dir))
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ A crashed save publishes nothing")
+
+
+def test_only_published_runs_are_indexed():
+    """A failed write is reported per file and nothing is indexed; farm renders index on publish"""
+    print("🔍 Testing run indexing after publish...")
+    temp_dir = tempfile.mkdtemp()
+    original_write = staged_output._write_file
+
+    def failing_write(path, data):
+        if path.endswith('job_analysis_report.txt'):
+            raise OSError("disk full")
+        original_write(path, data)
+
+    try:
+        index_path = os.path.join(temp_dir, RUN_INDEX_NAME)
+        with contextlib.redirect_stdout(io.StringIO()):
+            optimizer = ResumeOptimizer(render_cache=RenderCache(os.path.join(temp_dir, 'cache')))
+            optimizer.run_index = RunIndex(index_path)
+            results = optimizer.process_complete_optimization(JOB, RESUME, "welder", "Acme", '2')
+
+        staged_output._write_file = failing_write
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            saved = optimizer.save_results_to_files(results, os.path.join(temp_dir, 'failed'))
+        staged_output._write_file = original_write
+        log = output.getvalue()
+        assert saved is None and not os.path.exists(os.path.join(temp_dir, 'failed'))
+        assert log.count("ERROR: Failed to save job_analysis_report.txt: disk full") == 1
+        assert "All files saved successfully" not in log
+        assert list(RunIndex(index_path).runs()) == []
+
+        # With a render farm the folder is published, and indexed, when its last render is written
+        fresh_cache = RenderCache(os.path.join(temp_dir, 'empty_cache'))
+        optimizer.render_cache = fresh_cache
+        optimizer.render_farm = DocxRenderFarm(workers=1)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                pending = optimizer.save_results_to_files(results, os.path.join(temp_dir, 'farmed'))
+                assert not os.path.exists(pending) and list(RunIndex(index_path).runs()) == []
+                optimizer.render_farm.flush()
+        finally:
+            optimizer.render_farm.close()
+            optimizer.render_farm = None
+        assert [run['path'] for run in RunIndex(index_path).runs()] == [pending]
+        assert os.path.exists(os.path.join(pending, 'optimized_resume.docx'))
+    finally:
+        staged_output._write_file = original_write
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ Only published folders are indexed")
+
+
+if __name__ == "__main__":
+    test_unique_names()
+    test_publish_hold_and_failure()
+    test_crash_leaves_no_folder()
+    test_only_published_runs_are_indexed()
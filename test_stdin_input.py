@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""Test stdin bulk input for the command line optimizer"""
+
+import sys
+import os
+import io
+import contextlib
+import subprocess
+import tempfile
+import shutil
+
+# Add the current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import resume_windows
+from resume_windows import iter_stdin_records
+from run_index import RUN_INDEX_NAME, RunIndex
+
+PLUMBER_JOB = "Licensed Plumber needed for commercial pipefitting and repairs"
+WELDER_JOB = "Certified Welder - TIG and MIG welding on structural steel"
+RESUME = "Jane Doe\nEmail: jane.doe@email.com\n\nSkills:\nPipefitting, Welding, Blueprints"
+
+
+def run_main(argv, stdin_bytes, cwd):
+    """Run resume_windows.main() with the given argv and binary stdin"""
+    original_argv, original_stdin, original_cwd = sys.argv, sys.stdin, os.getcwd()
+    try:
+        sys.argv = ['resume_windows.py'] + argv
+        sys.stdin = io.TextIOWrapper(io.BytesIO(stdin_bytes))
+        os.chdir(cwd)
+        return resume_windows.main()
+    finally:
+        sys.argv, sys.stdin = original_argv, original_stdin
+        os.chdir(original_cwd)
+
+
+def test_nul_delimited_records():
+    """Records should split on NUL, tolerate a trailing NUL and flag incomplete input"""
+    data = f"{PLUMBER_JOB}\0{RESUME}\0{WELDER_JOB}\0{RESUME}\0".encode('utf-8')
+    assert list(iter_stdin_records(data)) == [(PLUMBER_JOB, RESUME), (WELDER_JOB, RESUME)]
+    assert list(iter_stdin_records(data.rstrip(b'\0'))) == [(PLUMBER_JOB, RESUME), (WELDER_JOB, RESUME)]
+
+    records = iter_stdin_records(f"{PLUMBER_JOB}\0{RESUME}\0{WELDER_JOB}".encode('utf-8'))
+    assert next(records) == (PLUMBER_JOB, RESUME)
+    try:
+        next(records)
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+
+    # cp1252 fields decode like files do
+    assert list(iter_stdin_records("Café job\0Résumé".encode('cp1252'))) == [("Café job", "Résumé")]
+    print("✅ NUL-delimited records parsed")
+
+
+def test_stdin_batch_processes_every_pair():
+    """--stdin should run one optimization per pair in a single process"""
+    print("🔍 Testing --stdin batch mode...")
+
+    temp_dir = tempfile.mkdtemp()
+    try:
+        data = f"{PLUMBER_JOB}\0{RESUME}\0{WELDER_JOB}\0{RESUME}\0".encode('utf-8')
+        assert run_main(['--stdin', '--role', 'Plumber', '--style', '2'], data, temp_dir) == 0
+
+        outputs = sorted(f for f in os.listdir(temp_dir) if f != RUN_INDEX_NAME)
+        assert len(outputs) == 2 and outputs[0].endswith('_001') and outputs[1].endswith('_002')
+        assert os.path.exists(os.path.join(temp_dir, outputs[0], 'optimization_executive_summary.txt'))
+        indexed = [os.path.basename(run['path']) for run in RunIndex(os.path.join(temp_dir, RUN_INDEX_NAME)).runs()]
+        assert indexed == outputs[::-1]
+        print(f"✅ {len(outputs)} output folders created")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_job_description_from_stdin():
+    """A '-' job description should be read from stdin without prompting"""
+    temp_dir = tempfile.mkdtemp()
+    try:
+        run_main(['-', '--resume', RESUME, '--role', 'Welder'], WELDER_JOB.encode('utf-8'), temp_dir)
+        outputs = [f for f in os.listdir(temp_dir) if f != RUN_INDEX_NAME]
+        assert len(outputs) == 1
+        # No style given: stdin is consumed, so both versions are created
+        assert os.path.exists(os.path.join(temp_dir, outputs[0], 'combined_comprehensive_resume.txt'))
+        print("✅ Job description read from stdin")
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def test_stdin_batch_rejects_resume_dash():
+    """--stdin with --resume - is a usage error, not a resume that reads '-'"""
+    temp_dir = tempfile.mkdtemp()
+    original_stderr = sys.stderr
+    try:
+        sys.stderr = io.StringIO()
+        try:
+            run_main(['--stdin', '--resume', '-'], PLUMBER_JOB.encode('utf-8'), temp_dir)
+            assert False, "expected a usage error"
+        except SystemExit as e:
+            assert e.code == 2
+        assert '--stdin already reads' in sys.stderr.getvalue()
+        assert os.listdir(temp_dir) == []
+    finally:
+        sys.stderr = original_stderr
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ --stdin --resume - rejected")
+
+
+def test_failing_record_does_not_stop_batch():
+    """An error while optimizing one record is reported and the next record still runs"""
+    print("🔍 Testing per-record failure handling...")
+    temp_dir = tempfile.mkdtemp()
+    original = resume_windows.ResumeOptimizer.process_complete_optimization
+
+    def fail_for_plumber(self, job_description, *args, **kwargs):
+        if job_description == PLUMBER_JOB:
+            raise ValueError("optimizer bug")
+        return original(self, job_description, *args, **kwargs)
+
+    try:
+        resume_windows.ResumeOptimizer.process_complete_optimization = fail_for_plumber
+        data = f"{PLUMBER_JOB}\0{RESUME}\0{WELDER_JOB}\0{RESUME}\0".encode('utf-8')
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            assert run_main(['--stdin', '--style', '2'], data, temp_dir) == 1
+        assert "ERROR: Record 1 failed: ValueError: optimizer bug" in output.getvalue()
+        outputs = [f for f in os.listdir(temp_dir) if f != RUN_INDEX_NAME]
+        assert len(outputs) == 1 and outputs[0].endswith('_002')
+    finally:
+        resume_windows.ResumeOptimizer.process_complete_optimization = original
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ The batch continued past the failing record")
+
+
+def run_script(argv, stdin_bytes, cwd):
+    """Run resume_windows.py in a subprocess with caches kept inside cwd"""
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resume_windows.py')
+    env = dict(os.environ, RESUME_RENDER_CACHE=os.path.join(cwd, 'render_cache'),
+               RESUME_PARSE_CACHE=os.path.join(cwd, 'parse_cache.sqlite3'))
+    return subprocess.run([sys.executable, script] + argv, input=stdin_bytes, cwd=cwd, env=env,
+                          capture_output=True, timeout=120)
+
+
+def test_bad_stdin_record_exit_status():
+    """An incomplete stdin record makes the script exit non-zero"""
+    print("🔍 Testing --stdin exit status...")
+    temp_dir = tempfile.mkdtemp()
+    try:
+        data = f"{PLUMBER_JOB}\0{RESUME}\0{WELDER_JOB}".encode('utf-8')
+        completed = run_script(['--stdin', '--style', '2'], data, temp_dir)
+        assert completed.returncode != 0, completed.stdout.decode('utf-8', 'replace')[-500:]
+        assert b'Incomplete record' in completed.stdout
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    print("✅ A bad stdin record fails the run")
+
+
+if __name__ == "__main__":
+    test_nul_delimited_records()
+    test_stdin_batch_processes_every_pair()
+    test_job_description_from_stdin()
+    test_stdin_batch_rejects_resume_dash()
+    test_bad_stdin_record_exit_status()
+    test_failing_record_does_not_stop_batch()
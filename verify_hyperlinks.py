@@ -4,17 +4,18 @@
 import sys
 import os
 
+from run_index import latest_output_folder
+
 def verify_latest_hyperlinks():
     """Verify the latest generated DOCX has proper clickable hyperlinks"""
     print("🔍 Verifying latest browse mode DOCX for clickable hyperlinks...")
     
     # Find the latest browse_mode_output folder
-    folders = [f for f in os.listdir('.') if f.startswith('browse_mode_output_')]
-    if not folders:
+    latest_folder = latest_output_folder('browse_mode_output_')
+    if not latest_folder:
         print("❌ No browse_mode_output folders found")
         return
     
-    latest_folder = sorted(folders)[-1]
     docx_path = os.path.join(latest_folder, 'optimized_resume.docx')
     
     print(f"📂 Checking: {docx_path}")